@@ -2,6 +2,8 @@
 # TEMPO BOT v2.0.1 - CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════════════
 
+from utils.address import checksum
+
 # Console colors
 class COLORS:
     RESET = "\033[0m"
@@ -32,21 +34,57 @@ VERSION_INFO = {
 # Core configuration
 CONFIG = {
     'RPC_URL': 'https://rpc.testnet.tempo.xyz',
+    # Several endpoints enable routing/failover (first entry = preferred for sends); empty = RPC_URL only
+    'RPC_URLS': [],
     'CHAIN_ID': 42429,
     'EXPLORER_URL': 'https://explore.tempo.xyz',
     'GAS_LIMIT': 3000000,
+    'FEE_CACHE_TTL': 2,
+    'FEE_HISTORY_BLOCKS': 5,
+    'FEE_PRIORITY_PERCENTILE': 50,
+    'FEE_BASE_MULTIPLIER': 2,
+    'RECEIPT_POLL_INTERVAL': 0.5,
+    'RECEIPT_TIMEOUT': 120,
+    'MULTICALL_BATCH_SIZE': 100,
+    'STATS_QUEUE_SIZE': 10000,
+    'STATS_BATCH_SIZE': 500,
+    'STATS_EXPORT_CHUNK_SIZE': 5000,
+    'STATS_BACKFILL_BATCH_SIZE': 100,
+    'ADDRESS_INDEX_PARALLEL_MIN': 200,
+    'RPC_POOL_SIZE': 20,
+    'RPC_TIMEOUT': 30,
+    'RPC_KEEPALIVE': 30,
+    'RPC_EWMA_ALPHA': 0.2,
+    'RETRY_MAX_ATTEMPTS': 4,
+    'RETRY_BASE_DELAY': 1,
+    'RETRY_MAX_DELAY': 30,
+    'TX_RETRY_BASE_DELAY': 5,
+    'TX_RETRY_MAX_DELAY': 60,
+    'CIRCUIT_FAILURE_THRESHOLD': 3,
+    'CIRCUIT_RESET_SECONDS': 5,
+    'CIRCUIT_MAX_RESET_SECONDS': 120,
+    'RPC_READ_RATE': 25,
+    'RPC_SEND_RATE': 5,
+    'RPC_RECEIPT_RATE': 5,
+    'RPC_MAX_IN_FLIGHT': 32,
+    'RPC_RATE_BACKOFF': 0.5,
+    'RPC_RATE_RECOVERY': 0.02,
+    'READ_CACHE_SIZE': 4096,
+    'READ_CACHE_PERSIST': True,
+    'READ_CACHE_BLOCK_TTL': 2,
     'MIN_DELAY_BETWEEN_WALLETS': 5,
     'MAX_DELAY_BETWEEN_WALLETS': 30,
     'MIN_DELAY_BETWEEN_DEPLOYS': 3,
     'MAX_DELAY_BETWEEN_DEPLOYS': 10,
+    'AUTO_CONCURRENCY': 5,
     'FAUCET_CLAIM_DELAY_SEC': 15,
     'FAUCET_FINISH_DELAY_SEC': 30,
     'FAUCET_PRE_CLAIM_MS': 4000,
     'TOKENS': {
-        'PathUSD': '0x20c0000000000000000000000000000000000000',
-        'AlphaUSD': '0x20c0000000000000000000000000000000000001',
-        'BetaUSD': '0x20c0000000000000000000000000000000000002',
-        'ThetaUSD': '0x20c0000000000000000000000000000000000003'
+        'PathUSD': checksum('0x20c0000000000000000000000000000000000000'),
+        'AlphaUSD': checksum('0x20c0000000000000000000000000000000000001'),
+        'BetaUSD': checksum('0x20c0000000000000000000000000000000000002'),
+        'ThetaUSD': checksum('0x20c0000000000000000000000000000000000003')
     },
     'FAUCET_TOKENS': [
         {'symbol': 'PathUSD', 'amount': '1,000,000'},
@@ -58,14 +96,14 @@ CONFIG = {
 
 # System contract addresses
 SYSTEM_CONTRACTS = {
-    'TIP20_FACTORY': '0x20fc000000000000000000000000000000000000',
-    'FEE_MANAGER': '0xfeec000000000000000000000000000000000000',
-    'STABLECOIN_DEX': '0xdec0000000000000000000000000000000000000'
+    'TIP20_FACTORY': checksum('0x20fc000000000000000000000000000000000000'),
+    'FEE_MANAGER': checksum('0xfeec000000000000000000000000000000000000'),
+    'STABLECOIN_DEX': checksum('0xdec0000000000000000000000000000000000000')
 }
 
 # Additional contract addresses
-INFINITY_NAME_CONTRACT = '0x70a57af45cd15f1565808cf7b1070bac363afd8a'
-RETRIEVER_NFT_CONTRACT = '0x603928C91Db2A58E2E689D42686A139Ad41CB51C'
+INFINITY_NAME_CONTRACT = checksum('0x70a57af45cd15f1565808cf7b1070bac363afd8a')
+RETRIEVER_NFT_CONTRACT = checksum('0x603928C91Db2A58E2E689D42686A139Ad41CB51C')
 
 # ERC20 ABI
 ERC20_ABI = [
@@ -373,7 +411,7 @@ FEE_MANAGER_ABI = [
 ]
 
 # Multicall3 for batch operations
-MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+MULTICALL3_ADDRESS = checksum('0xcA11bde05977b3631167028862bE2a173976CA11')
 MULTICALL3_ABI = [
     {
         'constant': False,
@@ -400,7 +438,7 @@ MULTICALL3_ABI = [
 ]
 
 # EIP-7702 Default Delegation
-DEFAULT_7702_IMPL = '0x7702c00000000000000000000000000000000000'
+DEFAULT_7702_IMPL = checksum('0x7702c00000000000000000000000000000000000')
 DEFAULT_ACCOUNT_REGISTRAR = '0x7702ac00000000000000000000000000000000000000'
 
 # TIP-403 Registry ABI
@@ -461,7 +499,7 @@ TIP403_REGISTRY_ABI = [
 ]
 
 # TIP-403 Registry Address
-TIP403_REGISTRY = '0x403c000000000000000000000000000000000000'
+TIP403_REGISTRY = checksum('0x403c000000000000000000000000000000000000')
 
 # TIP-20 Token ABI for policy management
 TIP20_POLICY_ABI = [
@@ -9,6 +9,8 @@ import signal
 import subprocess
 from config import COLORS, VERSION_INFO
 from utils.helpers import ask_question, close_rl
+from utils.provider import close_web3_clients
+from utils.resilience import is_transient_error
 
 # Import modules
 from modules.deploy import run_contract_deploy
@@ -26,7 +28,7 @@ from modules.stats import run_statistics
 from modules.auto import run_auto_mode
 
 # Helper functions
-from utils.wallet import load_created_tokens
+from utils.wallet import load_created_tokens, warm_address_index
 
 def banner():
     """Show banner with logo"""
@@ -119,7 +121,7 @@ async def main():
             sys.__excepthook__(exc_type, exc_value, exc_traceback)
             return
         err_msg = str(exc_value)
-        if any(x in err_msg for x in ['502', '503', 'Bad Gateway', 'SERVER_ERROR', 'timeout']):
+        if is_transient_error(exc_value):
             print('\n\033[1m\033[33m⚠️ RPC temporarily unavailable (502/503). Continuing...\033[0m')
         else:
             print(f'\n\033[1m\033[31m⚠️ Unhandled error:\033[0m {err_msg[:150]}')
@@ -203,6 +205,7 @@ async def main():
                 ask_question('\n\033[1m\033[33mPress Enter to continue...\033[0m')
             elif choice == '0':
                 print(f"\n  {COLORS.BOLD_MAGENTA}👋  Goodbye!{COLORS.RESET}\n")
+                await close_web3_clients()
                 close_rl()
                 sys.exit(0)
             else:
@@ -227,6 +230,8 @@ signal.signal(signal.SIGINT, signal_handler)
 
 if __name__ == '__main__':
     try:
+        # Large pv.txt files are derived in a process pool - not from inside the loop
+        warm_address_index()
         asyncio.run(main())
     except KeyboardInterrupt:
         print(f"\n  {COLORS.BOLD_MAGENTA}👋  Goodbye!{COLORS.RESET}\n")
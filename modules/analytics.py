@@ -3,11 +3,13 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import asyncio
-from web3 import Web3
-from eth_account import Account
 from config import CONFIG, SYSTEM_CONTRACTS, ERC20_ABI, FEE_MANAGER_ABI, COLORS
-from utils.helpers import async_sleep
-from utils.wallet import get_private_keys
+from utils.address import checksum
+from utils.multicall import get_multicall
+from utils.provider import create_web3
+from utils.wallet import get_private_keys, get_wallets
+from utils.cache import cached_read
+from utils.contracts import get_contract
 
 async def run_analytics():
     """Main entry for analytics module"""
@@ -23,60 +25,71 @@ async def run_analytics():
             print('\033[1m\033[31mPrivate keys not found in pv.txt\033[0m')
             return
 
-        web3 = Web3(Web3.HTTPProvider(CONFIG['RPC_URL']))
-        wallets = [Account.from_key(pk) for pk in private_keys]
+        web3 = create_web3()
+        wallets = get_wallets(private_keys)
 
         print(f"\033[1m\033[36mAnalyzing {len(wallets)} wallet(s)...\033[0m\n")
 
+        reader = get_multicall(web3)
+        token_contracts = {
+            symbol: get_contract(web3, checksum(address), ERC20_ABI)
+            for symbol, address in CONFIG['TOKENS'].items()
+        }
+        fee_manager = get_contract(web3, SYSTEM_CONTRACTS['FEE_MANAGER'], FEE_MANAGER_ABI)
+        pairs = [
+            ['AlphaUSD', 'PathUSD'],
+            ['BetaUSD', 'PathUSD'],
+            ['ThetaUSD', 'PathUSD']
+        ]
+        # Pool ids do not depend on the wallet - resolve them once
+        pool_ids = await asyncio.gather(*(
+            cached_read(web3, fee_manager.functions.getPoolId(
+                CONFIG['TOKENS'][token1],
+                CONFIG['TOKENS'][token2]
+            ))
+            for token1, token2 in pairs
+        ), return_exceptions=True)
+        pools = [(pair, pool_id) for pair, pool_id in zip(pairs, pool_ids) if not isinstance(pool_id, Exception)]
+
         for w in range(len(wallets)):
             wallet = wallets[w]
 
+            # All balances of this wallet in one aggregated read
+            results = await reader.read_many(
+                [contract.functions.balanceOf(wallet.address) for contract in token_contracts.values()] +
+                [fee_manager.functions.liquidityBalances(pool_id, wallet.address) for _, pool_id in pools]
+            )
+            balances = results[:len(token_contracts)]
+            lp_balances = results[len(token_contracts):]
+
             print(f"\n╔════════════════════════════════════════════════════════════════╗")
             print(f"║  WALLET #{w + 1}: {wallet.address[:10]}...{wallet.address[-8]}  ║")
             print(f"╠════════════════════════════════════════════════════════════════╣")
 
             # Token balances
             print(f"║  {BOLD_CYAN}TOKENS:{RESET}                                                    ║")
-            for symbol, address in CONFIG['TOKENS'].items():
-                try:
-                    contract = web3.eth.contract(address=Web3.to_checksum_address(address), abi=ERC20_ABI)
-                    balance = contract.functions.balanceOf(wallet.address).call()
-                    formatted = balance / (10 ** 6)
-                    display = f"{formatted:.2f}"
-                    print(f"║  {symbol.ljust(12)} │ {display.rjust(15)} {symbol.ljust(8)}  ║")
-                except Exception:
+            for symbol, balance in zip(token_contracts, balances):
+                if balance is None:
                     print(f"║  {symbol.ljust(12)} │ {' ERROR'.rjust(15)}                ║")
+                    continue
+                formatted = balance / (10 ** 6)
+                display = f"{formatted:.2f}"
+                print(f"║  {symbol.ljust(12)} │ {display.rjust(15)} {symbol.ljust(8)}  ║")
 
             # LP balances
             print(f"║                                                                ║")
             print(f"║  {BOLD_CYAN}LP POSITIONS:{RESET}                                              ║")
 
-            fee_manager = web3.eth.contract(address=Web3.to_checksum_address(SYSTEM_CONTRACTS['FEE_MANAGER']), abi=FEE_MANAGER_ABI)
-            pairs = [
-                ['AlphaUSD', 'PathUSD'],
-                ['BetaUSD', 'PathUSD'],
-                ['ThetaUSD', 'PathUSD']
-            ]
-
-            for token1, token2 in pairs:
-                try:
-                    pool_id = fee_manager.functions.getPoolId(
-                        Web3.to_checksum_address(CONFIG['TOKENS'][token1]),
-                        Web3.to_checksum_address(CONFIG['TOKENS'][token2])
-                    ).call()
-                    lp_balance = fee_manager.functions.liquidityBalances(pool_id, wallet.address).call()
-                    formatted = lp_balance / (10 ** 6)
-                    display = f"{formatted:.2f}"
-                    pair_name = f"{token1}/{token2}"
-                    print(f"║  {pair_name.ljust(20)} │ {display.rjust(15)} LP       ║")
-                except Exception:
-                    pass
+            for ((token1, token2), _), lp_balance in zip(pools, lp_balances):
+                if lp_balance is None:
+                    continue
+                formatted = lp_balance / (10 ** 6)
+                display = f"{formatted:.2f}"
+                pair_name = f"{token1}/{token2}"
+                print(f"║  {pair_name.ljust(20)} │ {display.rjust(15)} LP       ║")
 
             print(f"╚════════════════════════════════════════════════════════════════╝")
 
-            if w < len(wallets) - 1:
-                await async_sleep(1)
-
         print(f"\n\033[1m\033[32m✓ Analytics completed\033[0m")
 
     except Exception as error:
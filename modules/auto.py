@@ -6,13 +6,20 @@ import asyncio
 import random
 import string
 import re
-from web3 import Web3
 from eth_account import Account
-from solcx import compile_source, set_solc_version
 from config import CONFIG, SYSTEM_CONTRACTS, RETRIEVER_NFT_CONTRACT, ERC20_ABI, TIP20_FACTORY_ABI, STABLECOIN_DEX_ABI, FEE_MANAGER_ABI, COLORS
-from utils.helpers import async_sleep, short_hash, wait_for_tx_with_retry, ask_question
+from utils.address import checksum
+from utils.compiler import compile_solidity_async, warm_templates_async
+from utils.helpers import async_sleep, short_hash, ask_question
+from utils.provider import create_web3, rpc_request
+from utils.pipeline import TxPipeline
+from modules.deploy import get_contract_source
+from modules.nft import NFT_CONTRACT_NAME, get_nft_contract_source, get_random_color
 from utils.wallet import load_created_tokens
-from utils.wallet import get_private_keys
+from utils.wallet import get_private_keys, get_wallets
+from utils.resilience import is_transient_error
+from utils.cache import cached_read, ISSUER_ROLE, PAUSE_ROLE
+from utils.contracts import get_contract
 
 TIP20_MINT_ABI = [
     {
@@ -148,40 +155,18 @@ def parse_wallet_selection(input_str, total_wallets):
 
 # ACTIVITIES
 
-async def activity1_deploy(web3, wallet, private_key):
+async def activity1_deploy(web3, wallet):
     """Deploy a simple contract"""
-    source = 'pragma solidity ^0.8.20; contract TestContract { string public message = "Hello Tempo!"; }'
+    pipeline = TxPipeline(web3)
     try:
-        wallet_address = Web3.to_checksum_address(wallet.address)
-        set_solc_version('0.8.20')
-        compiled = compile_source(source, solc_version='0.8.20', optimize=True, optimize_runs=200)
-        contract_interface = compiled['<stdin>:TestContract']
-        bytecode = '0x' + contract_interface['bin']
-
-        contract = web3.eth.contract(abi=contract_interface['abi'], bytecode=bytecode)
-        nonce = web3.eth.get_transaction_count(wallet_address)
-        transaction = contract.constructor().build_transaction({
-            'from': wallet_address,
-            'nonce': nonce,
-            'gas': 2500000,
-            'gasPrice': web3.eth.gas_price,
-            'chainId': CONFIG['CHAIN_ID']
-        })
-
-        # Подписываем транзакцию
-        try:
-            signed_txn = wallet.sign_transaction(transaction)
-            raw_tx = signed_txn.rawTransaction
-        except (AttributeError, TypeError):
-            signed_txn = Account.sign_transaction(transaction, private_key)
-            raw_tx = signed_txn.rawTransaction if hasattr(signed_txn, 'rawTransaction') else signed_txn.raw_transaction
-
-        tx_hash = web3.eth.send_raw_transaction(raw_tx)
-        receipt = await wait_for_tx_with_retry(web3, tx_hash.hex())
+        compiled = await compile_solidity_async(get_contract_source(), 'MyContract')
+        contract = web3.eth.contract(abi=compiled['abi'], bytecode=compiled['bytecode'])
+        pending = await pipeline.submit(wallet, contract.constructor('Hello Tempo!'), gas=2500000)
+        receipt = await pending.wait()
         addr = receipt['contractAddress']
         print(f"  → Contract: {addr}")
-        print(f"  → TX: {short_hash(tx_hash.hex())}")
-        return tx_hash.hex()
+        print(f"  → TX: {short_hash(pending.hash)}")
+        return pending.hash
     except Exception as e:
         print(f"  → Error: {str(e)[:60]}")
         return None
@@ -189,79 +174,50 @@ async def activity1_deploy(web3, wallet, private_key):
 async def activity2_faucet(web3, wallet):
     """Call faucet"""
     try:
-        tx_hashes = web3.manager.request_blocking('tempo_fundAddress', [wallet.address])
+        await rpc_request(web3, 'tempo_fundAddress', [wallet.address])
         print(f"  → Received: 4 tokens of 1,000,000")
         await async_sleep(2)
         return 'faucet'
     except Exception:
         return None
 
-async def activity3_send_tokens(web3, wallet, private_key):
+async def activity3_send_tokens(web3, wallet):
     """Send small token transfer"""
+    pipeline = TxPipeline(web3)
     try:
-        wallet_address = Web3.to_checksum_address(wallet.address)
-        path_usd = web3.eth.contract(address=Web3.to_checksum_address(CONFIG['TOKENS']['PathUSD']), abi=ERC20_ABI)
-        random_address = Web3.to_checksum_address(Account.create().address)
+        path_usd = get_contract(web3, CONFIG['TOKENS']['PathUSD'], ERC20_ABI)
+        random_address = checksum(Account.create().address)
         amount = int(0.01 * (10 ** 6))
-        nonce = web3.eth.get_transaction_count(wallet_address)
-        tx = path_usd.functions.transfer(random_address, amount).build_transaction({
-            'from': wallet_address,
-            'nonce': nonce,
-            'gas': 100000,
-            'gasPrice': web3.eth.gas_price,
-            'chainId': CONFIG['CHAIN_ID']
-        })
-        # Подписываем транзакцию
-        try:
-            signed_tx = wallet.sign_transaction(tx)
-            raw_tx = signed_tx.rawTransaction
-        except (AttributeError, TypeError):
-            signed_tx = Account.sign_transaction(tx, private_key)
-            raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-        tx_hash = web3.eth.send_raw_transaction(raw_tx)
-        await wait_for_tx_with_retry(web3, tx_hash.hex())
+        pending = await pipeline.submit(wallet, path_usd.functions.transfer(random_address, amount), gas=100000)
+        await pending.wait()
         print(f"  → 0.01 PathUSD → {short_hash(random_address)}")
-        print(f"  → TX: {short_hash(tx_hash.hex())}")
-        return tx_hash.hex()
+        print(f"  → TX: {short_hash(pending.hash)}")
+        return pending.hash
     except Exception as e:
         print(f"  → Error: {str(e)[:60]}")
         return None
 
-async def activity4_create_stablecoin(web3, wallet, private_key):
+async def activity4_create_stablecoin(web3, wallet):
     """Create a new stablecoin via factory"""
+    pipeline = TxPipeline(web3)
     try:
-        wallet_address = Web3.to_checksum_address(wallet.address)
-        factory_address = Web3.to_checksum_address(SYSTEM_CONTRACTS['TIP20_FACTORY'])
-        factory = web3.eth.contract(address=factory_address, abi=TIP20_FACTORY_ABI)
+        wallet_address = checksum(wallet.address)
+        factory_address = SYSTEM_CONTRACTS['TIP20_FACTORY']
+        factory = get_contract(web3, factory_address, TIP20_FACTORY_ABI)
         random_suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=4))
         token_name = f'Test Token {random_suffix}'
         token_symbol = f'T{random_suffix}USD'
 
-        nonce = web3.eth.get_transaction_count(wallet_address)
-        tx = factory.functions.createToken(token_name, token_symbol, 'USD', Web3.to_checksum_address(CONFIG['TOKENS']['PathUSD']), wallet_address).build_transaction({
-            'from': wallet_address,
-            'nonce': nonce,
-            'gas': 500000,
-            'gasPrice': web3.eth.gas_price,
-            'chainId': CONFIG['CHAIN_ID']
-        })
-        # Подписываем транзакцию
-        try:
-            signed_tx = wallet.sign_transaction(tx)
-            raw_tx = signed_tx.rawTransaction
-        except (AttributeError, TypeError):
-            signed_tx = Account.sign_transaction(tx, private_key)
-            raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-        tx_hash = web3.eth.send_raw_transaction(raw_tx)
-        receipt = await wait_for_tx_with_retry(web3, tx_hash.hex())
-        print(f"  → TX: {short_hash(tx_hash.hex())}")
+        pending = await pipeline.submit(wallet, factory.functions.createToken(token_name, token_symbol, 'USD', CONFIG['TOKENS']['PathUSD'], wallet_address), gas=500000)
+        receipt = await pending.wait()
+        print(f"  → TX: {short_hash(pending.hash)}")
 
         # Parse TokenCreated event
-        factory_contract = web3.eth.contract(address=factory_address, abi=TIP20_FACTORY_ABI)
+        factory_contract = get_contract(web3, factory_address, TIP20_FACTORY_ABI)
         for log in receipt.get('logs', []):
             try:
                 event = factory_contract.events.TokenCreated().process_log(log)
-                token_address = Web3.to_checksum_address(event['args']['token'])
+                token_address = checksum(event['args']['token'])
                 print(f"  → Token: {token_address}")
                 return token_address
             except:
@@ -271,170 +227,97 @@ async def activity4_create_stablecoin(web3, wallet, private_key):
         print(f"  → Error: {str(e)[:60]}")
         return None
 
-async def activity5_swap(web3, wallet, private_key):
+async def activity5_swap(web3, wallet):
     """Swap tokens on DEX"""
+    pipeline = TxPipeline(web3)
     try:
-        wallet_address = Web3.to_checksum_address(wallet.address)
-        dex_address = Web3.to_checksum_address(SYSTEM_CONTRACTS['STABLECOIN_DEX'])
-        dex = web3.eth.contract(address=dex_address, abi=STABLECOIN_DEX_ABI)
-        path_usd_address = Web3.to_checksum_address(CONFIG['TOKENS']['PathUSD'])
-        path_usd = web3.eth.contract(address=path_usd_address, abi=ERC20_ABI)
+        wallet_address = checksum(wallet.address)
+        dex_address = SYSTEM_CONTRACTS['STABLECOIN_DEX']
+        dex = get_contract(web3, dex_address, STABLECOIN_DEX_ABI)
+        path_usd_address = CONFIG['TOKENS']['PathUSD']
+        path_usd = get_contract(web3, path_usd_address, ERC20_ABI)
         amount = int(1 * (10 ** 6))
 
-        allowance = path_usd.functions.allowance(wallet_address, dex_address).call()
+        allowance = await path_usd.functions.allowance(wallet_address, dex_address).call()
         if allowance < amount:
-            nonce = web3.eth.get_transaction_count(wallet_address)
             max_uint256 = 2**256 - 1
-            approve_tx = path_usd.functions.approve(dex_address, max_uint256).build_transaction({
-                'from': wallet_address,
-                'nonce': nonce,
-                'gas': 100000,
-                'gasPrice': web3.eth.gas_price,
-                'chainId': CONFIG['CHAIN_ID']
-            })
-            # Подписываем транзакцию
-            try:
-                signed_approve = wallet.sign_transaction(approve_tx)
-                raw_tx = signed_approve.rawTransaction
-            except (AttributeError, TypeError):
-                signed_approve = Account.sign_transaction(approve_tx, private_key)
-                raw_tx = signed_approve.rawTransaction if hasattr(signed_approve, 'rawTransaction') else signed_approve.raw_transaction
-            approve_hash = web3.eth.send_raw_transaction(raw_tx)
-            await wait_for_tx_with_retry(web3, approve_hash.hex())
-            print(f"  → Approve TX: {short_hash(approve_hash.hex())}")
-
-        alpha_usd_address = Web3.to_checksum_address(CONFIG['TOKENS']['AlphaUSD'])
-        quote = dex.functions.quoteSwapExactAmountIn(path_usd_address, alpha_usd_address, amount).call()
+            approve_tx = await pipeline.submit(wallet, path_usd.functions.approve(dex_address, max_uint256), gas=100000)
+            await approve_tx.wait()
+            print(f"  → Approve TX: {short_hash(approve_tx.hash)}")
+
+        alpha_usd_address = CONFIG['TOKENS']['AlphaUSD']
+        quote = await dex.functions.quoteSwapExactAmountIn(path_usd_address, alpha_usd_address, amount).call()
 
         if quote > 0:
             min_out = (quote * 99) // 100
-            nonce = web3.eth.get_transaction_count(wallet_address)
-            tx = dex.functions.swapExactAmountIn(path_usd_address, alpha_usd_address, amount, min_out).build_transaction({
-                'from': wallet_address,
-                'nonce': nonce,
-                'gas': 300000,
-                'gasPrice': web3.eth.gas_price,
-                'chainId': CONFIG['CHAIN_ID']
-            })
-            # Подписываем транзакцию
-            try:
-                signed_swap = wallet.sign_transaction(tx)
-                raw_tx = signed_swap.rawTransaction
-            except (AttributeError, TypeError):
-                signed_swap = Account.sign_transaction(tx, private_key)
-                raw_tx = signed_swap.rawTransaction if hasattr(signed_swap, 'rawTransaction') else signed_swap.raw_transaction
-            tx_hash = web3.eth.send_raw_transaction(raw_tx)
-            await wait_for_tx_with_retry(web3, tx_hash.hex())
+            pending = await pipeline.submit(wallet, dex.functions.swapExactAmountIn(path_usd_address, alpha_usd_address, amount, min_out), gas=300000)
+            await pending.wait()
             print(f"  → 1 PathUSD → AlphaUSD")
-            print(f"  → Swap TX: {short_hash(tx_hash.hex())}")
-            return tx_hash.hex()
+            print(f"  → Swap TX: {short_hash(pending.hash)}")
+            return pending.hash
     except Exception as e:
         print(f"  → Error: {str(e)[:60]}")
         return None
 
-async def activity6_add_liquidity(web3, wallet, private_key):
+async def activity6_add_liquidity(web3, wallet):
     """Add liquidity to fee manager pool"""
+    pipeline = TxPipeline(web3)
     try:
-        wallet_address = Web3.to_checksum_address(wallet.address)
-        fee_manager_address = Web3.to_checksum_address(SYSTEM_CONTRACTS['FEE_MANAGER'])
-        fee_manager = web3.eth.contract(address=fee_manager_address, abi=FEE_MANAGER_ABI)
-        path_usd_address = Web3.to_checksum_address(CONFIG['TOKENS']['PathUSD'])
-        path_usd = web3.eth.contract(address=path_usd_address, abi=ERC20_ABI)
+        wallet_address = checksum(wallet.address)
+        fee_manager_address = SYSTEM_CONTRACTS['FEE_MANAGER']
+        fee_manager = get_contract(web3, fee_manager_address, FEE_MANAGER_ABI)
+        path_usd_address = CONFIG['TOKENS']['PathUSD']
+        path_usd = get_contract(web3, path_usd_address, ERC20_ABI)
         amount = int(10 * (10 ** 6))
 
-        allowance = path_usd.functions.allowance(wallet_address, fee_manager_address).call()
+        allowance = await path_usd.functions.allowance(wallet_address, fee_manager_address).call()
         if allowance < amount:
-            nonce = web3.eth.get_transaction_count(wallet_address)
             max_uint256 = 2**256 - 1
-            approve_tx = path_usd.functions.approve(fee_manager_address, max_uint256).build_transaction({
-                'from': wallet_address,
-                'nonce': nonce,
-                'gas': 100000,
-                'gasPrice': web3.eth.gas_price,
-                'chainId': CONFIG['CHAIN_ID']
-            })
-            # Подписываем транзакцию
-            try:
-                signed_approve = wallet.sign_transaction(approve_tx)
-                raw_tx = signed_approve.rawTransaction
-            except (AttributeError, TypeError):
-                signed_approve = Account.sign_transaction(approve_tx, private_key)
-                raw_tx = signed_approve.rawTransaction if hasattr(signed_approve, 'rawTransaction') else signed_approve.raw_transaction
-            approve_hash = web3.eth.send_raw_transaction(raw_tx)
-            await wait_for_tx_with_retry(web3, approve_hash.hex())
-            print(f"  → Approve TX: {short_hash(approve_hash.hex())}")
-
-        alpha_usd_address = Web3.to_checksum_address(CONFIG['TOKENS']['AlphaUSD'])
-        nonce = web3.eth.get_transaction_count(wallet_address)
-        tx = fee_manager.functions.mintWithValidatorToken(alpha_usd_address, path_usd_address, amount, wallet_address).build_transaction({
-            'from': wallet_address,
-            'nonce': nonce,
-            'gas': 500000,
-            'gasPrice': web3.eth.gas_price,
-            'chainId': CONFIG['CHAIN_ID']
-        })
-        # Подписываем транзакцию
-        try:
-            signed_tx = wallet.sign_transaction(tx)
-            raw_tx = signed_tx.rawTransaction
-        except (AttributeError, TypeError):
-            signed_tx = Account.sign_transaction(tx, private_key)
-            raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-        tx_hash = web3.eth.send_raw_transaction(raw_tx)
-        await wait_for_tx_with_retry(web3, tx_hash.hex())
+            approve_tx = await pipeline.submit(wallet, path_usd.functions.approve(fee_manager_address, max_uint256), gas=100000)
+            await approve_tx.wait()
+            print(f"  → Approve TX: {short_hash(approve_tx.hash)}")
+
+        alpha_usd_address = CONFIG['TOKENS']['AlphaUSD']
+        pending = await pipeline.submit(wallet, fee_manager.functions.mintWithValidatorToken(alpha_usd_address, path_usd_address, amount, wallet_address), gas=500000)
+        await pending.wait()
         print(f"  → 10 PathUSD into AlphaUSD/PathUSD pool")
-        print(f"  → TX: {short_hash(tx_hash.hex())}")
-        return tx_hash.hex()
+        print(f"  → TX: {short_hash(pending.hash)}")
+        return pending.hash
     except Exception as e:
         print(f"  → Error: {str(e)[:60]}")
         return None
 
-async def activity7_set_fee_token(web3, wallet, private_key):
+async def activity7_set_fee_token(web3, wallet):
     """Set BetaUSD as fee token"""
+    pipeline = TxPipeline(web3)
     try:
-        wallet_address = Web3.to_checksum_address(wallet.address)
-        fee_manager_address = Web3.to_checksum_address(SYSTEM_CONTRACTS['FEE_MANAGER'])
-        fee_manager = web3.eth.contract(address=fee_manager_address, abi=FEE_MANAGER_ABI)
-        beta_usd_address = Web3.to_checksum_address(CONFIG['TOKENS']['BetaUSD'])
-        nonce = web3.eth.get_transaction_count(wallet_address)
-        tx = fee_manager.functions.setUserToken(beta_usd_address).build_transaction({
-            'from': wallet_address,
-            'nonce': nonce,
-            'gas': 100000,
-            'gasPrice': web3.eth.gas_price,
-            'chainId': CONFIG['CHAIN_ID']
-        })
-        # Подписываем транзакцию
-        try:
-            signed_tx = wallet.sign_transaction(tx)
-            raw_tx = signed_tx.rawTransaction
-        except (AttributeError, TypeError):
-            signed_tx = Account.sign_transaction(tx, private_key)
-            raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-        tx_hash = web3.eth.send_raw_transaction(raw_tx)
-        await wait_for_tx_with_retry(web3, tx_hash.hex())
+        fee_manager_address = SYSTEM_CONTRACTS['FEE_MANAGER']
+        fee_manager = get_contract(web3, fee_manager_address, FEE_MANAGER_ABI)
+        beta_usd_address = CONFIG['TOKENS']['BetaUSD']
+        pending = await pipeline.submit(wallet, fee_manager.functions.setUserToken(beta_usd_address), gas=100000)
+        await pending.wait()
         print(f"  → Fee token: BetaUSD")
-        print(f"  → TX: {short_hash(tx_hash.hex())}")
-        return tx_hash.hex()
+        print(f"  → TX: {short_hash(pending.hash)}")
+        return pending.hash
     except Exception as e:
         print(f"  → Error: {str(e)[:60]}")
         return None
 
-async def activity8_mint_tokens(web3, wallet, private_key, token_address):
+async def activity8_mint_tokens(web3, wallet, token_address):
     """Mint tokens for created TIP-20"""
+    pipeline = TxPipeline(web3)
     if not token_address:
         return None
 
     try:
-        wallet_address = Web3.to_checksum_address(wallet.address)
-        token_address_checksum = Web3.to_checksum_address(token_address)
-        token = web3.eth.contract(address=token_address_checksum, abi=TIP20_MINT_ABI)
-        ISSUER_ROLE = Web3.keccak(text="ISSUER_ROLE")
+        wallet_address = checksum(wallet.address)
+        token_address_checksum = checksum(token_address)
+        token = get_contract(web3, token_address_checksum, TIP20_MINT_ABI)
 
         # Check role
         needs_role = False
         try:
-            has_role = token.functions.hasRole(ISSUER_ROLE, wallet_address).call()
+            has_role = await token.functions.hasRole(ISSUER_ROLE, wallet_address).call()
             needs_role = not has_role
         except Exception:
             needs_role = True
@@ -442,247 +325,129 @@ async def activity8_mint_tokens(web3, wallet, private_key, token_address):
         # Grant role if needed
         if needs_role:
             try:
-                nonce = web3.eth.get_transaction_count(wallet_address)
-                grant_tx = token.functions.grantRole(ISSUER_ROLE, wallet_address).build_transaction({
-                    'from': wallet_address,
-                    'nonce': nonce,
-                    'gas': 150000,
-                    'gasPrice': web3.eth.gas_price,
-                    'chainId': CONFIG['CHAIN_ID']
-                })
-                # Sign transaction
-                try:
-                    signed_grant = wallet.sign_transaction(grant_tx)
-                    raw_tx = signed_grant.rawTransaction
-                except (AttributeError, TypeError):
-                    signed_grant = Account.sign_transaction(grant_tx, private_key)
-                    raw_tx = signed_grant.rawTransaction if hasattr(signed_grant, 'rawTransaction') else signed_grant.raw_transaction
-                grant_tx_hash = web3.eth.send_raw_transaction(raw_tx)
-                await wait_for_tx_with_retry(web3, grant_tx_hash.hex())
-                print(f"  → Grant Role TX: {short_hash(grant_tx_hash.hex())}")
-                await async_sleep(2)
+                grant_tx = await pipeline.submit(wallet, token.functions.grantRole(ISSUER_ROLE, wallet_address), gas=150000)
+                await grant_tx.wait()
+                print(f"  → Grant Role TX: {short_hash(grant_tx.hash)}")
             except Exception:
                 pass
 
         # Mint
         mint_amount = int(1000 * (10 ** 6))
-        nonce = web3.eth.get_transaction_count(wallet_address)
-        tx = token.functions.mint(wallet_address, mint_amount).build_transaction({
-            'from': wallet_address,
-            'nonce': nonce,
-            'gas': 200000,
-            'gasPrice': web3.eth.gas_price,
-            'chainId': CONFIG['CHAIN_ID']
-        })
-        # Sign transaction
-        try:
-            signed_tx = wallet.sign_transaction(tx)
-            raw_tx = signed_tx.rawTransaction
-        except (AttributeError, TypeError):
-            signed_tx = Account.sign_transaction(tx, private_key)
-            raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-        tx_hash = web3.eth.send_raw_transaction(raw_tx)
-        await wait_for_tx_with_retry(web3, tx_hash.hex())
-        print(f"  → Mint TX: {short_hash(tx_hash.hex())}")
-        return tx_hash.hex()
+        pending = await pipeline.submit(wallet, token.functions.mint(wallet_address, mint_amount), gas=200000)
+        await pending.wait()
+        print(f"  → Mint TX: {short_hash(pending.hash)}")
+        return pending.hash
     except Exception as e:
         print(f"  → Error: {str(e)[:60]}")
         return None
 
-async def activity9_burn_tokens(web3, wallet, private_key, token_address):
+async def activity9_burn_tokens(web3, wallet, token_address):
     """Burn some tokens"""
+    pipeline = TxPipeline(web3)
     if not token_address:
         return None
 
     try:
-        wallet_address = Web3.to_checksum_address(wallet.address)
-        token_address_checksum = Web3.to_checksum_address(token_address)
-        token = web3.eth.contract(address=token_address_checksum, abi=TIP20_MINT_ABI)
-        balance = token.functions.balanceOf(wallet_address).call()
+        wallet_address = checksum(wallet.address)
+        token_address_checksum = checksum(token_address)
+        token = get_contract(web3, token_address_checksum, TIP20_MINT_ABI)
+        balance = await token.functions.balanceOf(wallet_address).call()
 
         if balance >= int(10 * (10 ** 6)):
             burn_amount = int(10 * (10 ** 6))
-            nonce = web3.eth.get_transaction_count(wallet_address)
-            tx = token.functions.burn(burn_amount).build_transaction({
-                'from': wallet_address,
-                'nonce': nonce,
-                'gas': 150000,
-                'gasPrice': web3.eth.gas_price,
-                'chainId': CONFIG['CHAIN_ID']
-            })
-            # Sign transaction
-            try:
-                signed_tx = wallet.sign_transaction(tx)
-                raw_tx = signed_tx.rawTransaction
-            except (AttributeError, TypeError):
-                signed_tx = Account.sign_transaction(tx, private_key)
-                raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-            tx_hash = web3.eth.send_raw_transaction(raw_tx)
-            await wait_for_tx_with_retry(web3, tx_hash.hex())
-            print(f"  → Burn TX: {short_hash(tx_hash.hex())}")
-            return tx_hash.hex()
+            pending = await pipeline.submit(wallet, token.functions.burn(burn_amount), gas=150000)
+            await pending.wait()
+            print(f"  → Burn TX: {short_hash(pending.hash)}")
+            return pending.hash
     except Exception as e:
         print(f"  → Error: {str(e)[:60]}")
         pass
     return None
 
-async def activity10_transfer_with_memo(web3, wallet, private_key):
+async def activity10_transfer_with_memo(web3, wallet):
     """Transfer with memo"""
+    pipeline = TxPipeline(web3)
     try:
-        wallet_address = Web3.to_checksum_address(wallet.address)
-        path_usd_address = Web3.to_checksum_address(CONFIG['TOKENS']['PathUSD'])
-        path_usd = web3.eth.contract(address=path_usd_address, abi=TIP20_MINT_ABI)
-        random_address = Web3.to_checksum_address(Account.create().address)
+        path_usd_address = CONFIG['TOKENS']['PathUSD']
+        path_usd = get_contract(web3, path_usd_address, TIP20_MINT_ABI)
+        random_address = checksum(Account.create().address)
         amount = int(0.01 * (10 ** 6))
         memo_bytes = 'test-memo'.encode('utf-8')[:32].ljust(32, b'\x00')
         memo = '0x' + memo_bytes.hex()
 
-        nonce = web3.eth.get_transaction_count(wallet_address)
-        tx = path_usd.functions.transferWithMemo(random_address, amount, memo).build_transaction({
-            'from': wallet_address,
-            'nonce': nonce,
-            'gas': 150000,
-            'gasPrice': web3.eth.gas_price,
-            'chainId': CONFIG['CHAIN_ID']
-        })
-        # Подписываем транзакцию
-        try:
-            signed_tx = wallet.sign_transaction(tx)
-            raw_tx = signed_tx.rawTransaction
-        except (AttributeError, TypeError):
-            signed_tx = Account.sign_transaction(tx, private_key)
-            raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-        tx_hash = web3.eth.send_raw_transaction(raw_tx)
-        await wait_for_tx_with_retry(web3, tx_hash.hex())
+        pending = await pipeline.submit(wallet, path_usd.functions.transferWithMemo(random_address, amount, memo), gas=150000)
+        await pending.wait()
         print(f"  → 0.01 PathUSD → {short_hash(random_address)}")
         print(f"  → Memo: test-memo")
-        print(f"  → TX: {short_hash(tx_hash.hex())}")
-        return tx_hash.hex()
+        print(f"  → TX: {short_hash(pending.hash)}")
+        return pending.hash
     except Exception as e:
         print(f"  → Error: {str(e)[:60]}")
         return None
 
-async def activity11_limit_order(web3, wallet, private_key):
+async def activity11_limit_order(web3, wallet):
     """Place random limit order"""
+    pipeline = TxPipeline(web3)
     try:
-        wallet_address = Web3.to_checksum_address(wallet.address)
-        dex_address = Web3.to_checksum_address(SYSTEM_CONTRACTS['STABLECOIN_DEX'])
-        dex = web3.eth.contract(address=dex_address, abi=STABLECOIN_DEX_ABI)
+        wallet_address = checksum(wallet.address)
+        dex_address = SYSTEM_CONTRACTS['STABLECOIN_DEX']
+        dex = get_contract(web3, dex_address, STABLECOIN_DEX_ABI)
         tokens = ['AlphaUSD', 'BetaUSD', 'ThetaUSD']
         random_token = random.choice(tokens)
-        token_address = Web3.to_checksum_address(CONFIG['TOKENS'][random_token])
+        token_address = CONFIG['TOKENS'][random_token]
         is_bid = random.random() < 0.5
 
         amount = int(10 * (10 ** 6))
 
         if is_bid:
-            path_usd = web3.eth.contract(address=Web3.to_checksum_address(CONFIG['TOKENS']['PathUSD']), abi=ERC20_ABI)
-            allowance = path_usd.functions.allowance(wallet_address, dex_address).call()
+            path_usd = get_contract(web3, CONFIG['TOKENS']['PathUSD'], ERC20_ABI)
+            allowance = await path_usd.functions.allowance(wallet_address, dex_address).call()
             if allowance < amount:
-                nonce = web3.eth.get_transaction_count(wallet_address)
                 max_uint256 = 2**256 - 1
-                approve_tx = path_usd.functions.approve(dex_address, max_uint256).build_transaction({
-                    'from': wallet_address,
-                    'nonce': nonce,
-                    'gas': 100000,
-                    'gasPrice': web3.eth.gas_price,
-                    'chainId': CONFIG['CHAIN_ID']
-                })
-                # Подписываем транзакцию
-                try:
-                    signed_approve = wallet.sign_transaction(approve_tx)
-                    raw_tx = signed_approve.rawTransaction
-                except (AttributeError, TypeError):
-                    signed_approve = Account.sign_transaction(approve_tx, private_key)
-                    raw_tx = signed_approve.rawTransaction if hasattr(signed_approve, 'rawTransaction') else signed_approve.raw_transaction
-                approve_hash = web3.eth.send_raw_transaction(raw_tx)
-                await wait_for_tx_with_retry(web3, approve_hash.hex())
-                print(f"  → Approve TX: {short_hash(approve_hash.hex())}")
+                approve_tx = await pipeline.submit(wallet, path_usd.functions.approve(dex_address, max_uint256), gas=100000)
+                await approve_tx.wait()
+                print(f"  → Approve TX: {short_hash(approve_tx.hash)}")
         else:
-            token = web3.eth.contract(address=token_address, abi=ERC20_ABI)
-            allowance = token.functions.allowance(wallet_address, dex_address).call()
+            token = get_contract(web3, token_address, ERC20_ABI)
+            allowance = await token.functions.allowance(wallet_address, dex_address).call()
             if allowance < amount:
-                nonce = web3.eth.get_transaction_count(wallet_address)
                 max_uint256 = 2**256 - 1
-                approve_tx = token.functions.approve(dex_address, max_uint256).build_transaction({
-                    'from': wallet_address,
-                    'nonce': nonce,
-                    'gas': 100000,
-                    'gasPrice': web3.eth.gas_price,
-                    'chainId': CONFIG['CHAIN_ID']
-                })
-                # Подписываем транзакцию
-                try:
-                    signed_approve = wallet.sign_transaction(approve_tx)
-                    raw_tx = signed_approve.rawTransaction
-                except (AttributeError, TypeError):
-                    signed_approve = Account.sign_transaction(approve_tx, private_key)
-                    raw_tx = signed_approve.rawTransaction if hasattr(signed_approve, 'rawTransaction') else signed_approve.raw_transaction
-                approve_hash = web3.eth.send_raw_transaction(raw_tx)
-                await wait_for_tx_with_retry(web3, approve_hash.hex())
-                print(f"  → Approve TX: {short_hash(approve_hash.hex())}")
-
-        nonce = web3.eth.get_transaction_count(wallet_address)
-        tx = dex.functions.place(token_address, amount, is_bid, 0).build_transaction({
-            'from': wallet_address,
-            'nonce': nonce,
-            'gas': 300000,
-            'gasPrice': web3.eth.gas_price,
-            'chainId': CONFIG['CHAIN_ID']
-        })
-        # Подписываем транзакцию
-        try:
-            signed_tx = wallet.sign_transaction(tx)
-            raw_tx = signed_tx.rawTransaction
-        except (AttributeError, TypeError):
-            signed_tx = Account.sign_transaction(tx, private_key)
-            raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-        tx_hash = web3.eth.send_raw_transaction(raw_tx)
-        await wait_for_tx_with_retry(web3, tx_hash.hex())
+                approve_tx = await pipeline.submit(wallet, token.functions.approve(dex_address, max_uint256), gas=100000)
+                await approve_tx.wait()
+                print(f"  → Approve TX: {short_hash(approve_tx.hash)}")
+
+        pending = await pipeline.submit(wallet, dex.functions.place(token_address, amount, is_bid, 0), gas=300000)
+        await pending.wait()
         print(f"  → {'Buy' if is_bid else 'Sell'} {random_token}: 10 tokens")
-        print(f"  → TX: {short_hash(tx_hash.hex())}")
-        return tx_hash.hex()
+        print(f"  → TX: {short_hash(pending.hash)}")
+        return pending.hash
     except Exception as e:
         print(f"  → Error: {str(e)[:60]}")
         return None
 
-async def activity12_remove_liquidity(web3, wallet, private_key):
+async def activity12_remove_liquidity(web3, wallet):
     """Remove some liquidity"""
+    pipeline = TxPipeline(web3)
     try:
-        wallet_address = Web3.to_checksum_address(wallet.address)
-        fee_manager = web3.eth.contract(address=Web3.to_checksum_address(SYSTEM_CONTRACTS['FEE_MANAGER']), abi=FEE_MANAGER_ABI)
-        alpha_usd_address = Web3.to_checksum_address(CONFIG['TOKENS']['AlphaUSD'])
-        path_usd_address = Web3.to_checksum_address(CONFIG['TOKENS']['PathUSD'])
-        pool_id = fee_manager.functions.getPoolId(alpha_usd_address, path_usd_address).call()
-        lp_balance = fee_manager.functions.liquidityBalances(pool_id, wallet_address).call()
+        wallet_address = checksum(wallet.address)
+        fee_manager = get_contract(web3, SYSTEM_CONTRACTS['FEE_MANAGER'], FEE_MANAGER_ABI)
+        alpha_usd_address = CONFIG['TOKENS']['AlphaUSD']
+        path_usd_address = CONFIG['TOKENS']['PathUSD']
+        pool_id = await cached_read(web3, fee_manager.functions.getPoolId(alpha_usd_address, path_usd_address))
+        lp_balance = await fee_manager.functions.liquidityBalances(pool_id, wallet_address).call()
 
         if lp_balance >= int(1 * (10 ** 6)):
             withdraw_amount = int(1 * (10 ** 6))
-            nonce = web3.eth.get_transaction_count(wallet_address)
-            tx = fee_manager.functions.burn(
+            pending = await pipeline.submit(wallet, fee_manager.functions.burn(
                 alpha_usd_address,
                 path_usd_address,
                 withdraw_amount,
                 wallet_address
-            ).build_transaction({
-                'from': wallet_address,
-                'nonce': nonce,
-                'gas': 500000,
-                'gasPrice': web3.eth.gas_price,
-                'chainId': CONFIG['CHAIN_ID']
-            })
-            # Sign transaction
-            try:
-                signed_tx = wallet.sign_transaction(tx)
-                raw_tx = signed_tx.rawTransaction
-            except (AttributeError, TypeError):
-                signed_tx = Account.sign_transaction(tx, private_key)
-                raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-            tx_hash = web3.eth.send_raw_transaction(raw_tx)
-            await wait_for_tx_with_retry(web3, tx_hash.hex())
+            ), gas=500000)
+            await pending.wait()
             print(f"  → Withdrawn: 1 LP from AlphaUSD/PathUSD pool")
-            print(f"  → TX: {short_hash(tx_hash.hex())}")
-            return tx_hash.hex()
+            print(f"  → TX: {short_hash(pending.hash)}")
+            return pending.hash
         else:
             print(f"  → Not enough LP (balance: {lp_balance / (10 ** 6)})")
             return None
@@ -690,130 +455,61 @@ async def activity12_remove_liquidity(web3, wallet, private_key):
         print(f"  → Error: {str(e)[:60]}")
         return None
 
-async def activity13_grant_role(web3, wallet, private_key, token_address):
+async def activity13_grant_role(web3, wallet, token_address):
     """Grant PAUSE_ROLE to self"""
+    pipeline = TxPipeline(web3)
     if not token_address:
         return None
 
     try:
-        wallet_address = Web3.to_checksum_address(wallet.address)
-        token = web3.eth.contract(address=Web3.to_checksum_address(token_address), abi=TIP20_MINT_ABI)
-        PAUSE_ROLE = Web3.keccak(text="PAUSE_ROLE")
+        wallet_address = checksum(wallet.address)
+        token = get_contract(web3, checksum(token_address), TIP20_MINT_ABI)
 
-        has_role = token.functions.hasRole(PAUSE_ROLE, wallet_address).call()
+        has_role = await token.functions.hasRole(PAUSE_ROLE, wallet_address).call()
         if not has_role:
-            nonce = web3.eth.get_transaction_count(wallet_address)
-            grant_tx = token.functions.grantRole(PAUSE_ROLE, wallet_address).build_transaction({
-                'from': wallet_address,
-                'nonce': nonce,
-                'gas': 150000,
-                'gasPrice': web3.eth.gas_price,
-                'chainId': CONFIG['CHAIN_ID']
-            })
-            # Sign transaction
-            try:
-                signed_grant = wallet.sign_transaction(grant_tx)
-                raw_tx = signed_grant.rawTransaction
-            except (AttributeError, TypeError):
-                signed_grant = Account.sign_transaction(grant_tx, private_key)
-                raw_tx = signed_grant.rawTransaction if hasattr(signed_grant, 'rawTransaction') else signed_grant.raw_transaction
-            tx_hash = web3.eth.send_raw_transaction(raw_tx)
-            await wait_for_tx_with_retry(web3, tx_hash.hex())
-            print(f"  → Grant PAUSE_ROLE TX: {short_hash(tx_hash.hex())}")
-            return tx_hash.hex()
+            pending = await pipeline.submit(wallet, token.functions.grantRole(PAUSE_ROLE, wallet_address), gas=150000)
+            await pending.wait()
+            print(f"  → Grant PAUSE_ROLE TX: {short_hash(pending.hash)}")
+            return pending.hash
     except Exception as e:
         print(f"  → Error: {str(e)[:60]}")
         pass
     return None
 
-async def activity14_nft(web3, wallet, private_key):
+async def activity14_nft(web3, wallet):
     """Deploy and mint a simple NFT contract"""
+    pipeline = TxPipeline(web3)
     try:
         nft_name = 'Test NFT ' + ''.join(random.choices(string.ascii_uppercase + string.digits, k=4))
         nft_symbol = 'T' + ''.join(random.choices(string.ascii_uppercase + string.digits, k=3))
-        clean_symbol = ''.join(c for c in nft_symbol if c.isalnum())
-        contract_name = f"{clean_symbol}NFT"
-
-        source = f"""// SPDX-License-Identifier: MIT
-pragma solidity ^0.8.20;
-contract {contract_name} {{
-    string public name = "{nft_name}";
-    string public symbol = "{nft_symbol}";
-    uint256 private _tokenIdCounter;
-    mapping(uint256 => address) private _owners;
-    mapping(address => uint256) private _balances;
-    event Transfer(address indexed from, address indexed to, uint256 indexed tokenId);
-    function balanceOf(address owner) public view returns (uint256) {{ return _balances[owner]; }}
-    function mint(address to) public returns (uint256) {{
-        uint256 tokenId = _tokenIdCounter++;
-        _owners[tokenId] = to;
-        _balances[to]++;
-        emit Transfer(address(0), to, tokenId);
-        return tokenId;
-    }}
-}}"""
-
-        wallet_address = Web3.to_checksum_address(wallet.address)
-        set_solc_version('0.8.20')
-        compiled = compile_source(source, solc_version='0.8.20', optimize=True, optimize_runs=200)
-        contract_interface = compiled[f'<stdin>:{contract_name}']
-        bytecode = '0x' + contract_interface['bin']
-
-        contract = web3.eth.contract(abi=contract_interface['abi'], bytecode=bytecode)
-        nonce = web3.eth.get_transaction_count(wallet_address)
-        transaction = contract.constructor().build_transaction({
-            'from': wallet_address,
-            'nonce': nonce,
-            'gas': 2000000,
-            'gasPrice': web3.eth.gas_price,
-            'chainId': CONFIG['CHAIN_ID']
-        })
-
-        # Подписываем транзакцию
-        try:
-            signed_txn = wallet.sign_transaction(transaction)
-            raw_tx = signed_txn.rawTransaction
-        except (AttributeError, TypeError):
-            signed_txn = Account.sign_transaction(transaction, private_key)
-            raw_tx = signed_txn.rawTransaction if hasattr(signed_txn, 'rawTransaction') else signed_txn.raw_transaction
-        tx_hash = web3.eth.send_raw_transaction(raw_tx)
-        receipt = await wait_for_tx_with_retry(web3, tx_hash.hex())
-        addr = Web3.to_checksum_address(receipt['contractAddress'])
+
+        wallet_address = checksum(wallet.address)
+        contract_interface = await compile_solidity_async(get_nft_contract_source(), NFT_CONTRACT_NAME)
+        contract = web3.eth.contract(abi=contract_interface['abi'], bytecode=contract_interface['bytecode'])
+        pending = await pipeline.submit(wallet, contract.constructor(nft_name, nft_symbol), gas=2000000)
+        receipt = await pending.wait()
+        addr = checksum(receipt['contractAddress'])
         print(f"  → NFT контракт: {addr}")
-        print(f"  → Deploy TX: {short_hash(tx_hash.hex())}")
+        print(f"  → Deploy TX: {short_hash(pending.hash)}")
         await async_sleep(2)
 
         # Mint only 1 NFT
-        contract_instance = web3.eth.contract(address=addr, abi=contract_interface['abi'])
-        nonce = web3.eth.get_transaction_count(wallet_address)
-        mint_tx = contract_instance.functions.mint(wallet_address).build_transaction({
-            'from': wallet_address,
-            'nonce': nonce,
-            'gas': 150000,
-            'gasPrice': web3.eth.gas_price,
-            'chainId': CONFIG['CHAIN_ID']
-        })
-        # Подписываем транзакцию
-        try:
-            signed_mint = wallet.sign_transaction(mint_tx)
-            raw_tx = signed_mint.rawTransaction
-        except (AttributeError, TypeError):
-            signed_mint = Account.sign_transaction(mint_tx, private_key)
-            raw_tx = signed_mint.rawTransaction if hasattr(signed_mint, 'rawTransaction') else signed_mint.raw_transaction
-        mint_tx_hash = web3.eth.send_raw_transaction(raw_tx)
-        await wait_for_tx_with_retry(web3, mint_tx_hash.hex())
+        contract_instance = get_contract(web3, addr, contract_interface['abi'])
+        mint_tx = await pipeline.submit(wallet, contract_instance.functions.mint(wallet_address, get_random_color()), gas=150000)
+        await mint_tx.wait()
         print(f"  → Mint NFT #0")
-        print(f"  → Mint TX: {short_hash(mint_tx_hash.hex())}")
-        return mint_tx_hash.hex()
+        print(f"  → Mint TX: {short_hash(mint_tx.hash)}")
+        return mint_tx.hash
     except Exception as e:
         print(f"  → Error: {str(e)[:60]}")
         return None
 
-async def activity16_retriever_nft(web3, wallet, private_key):
+async def activity16_retriever_nft(web3, wallet):
     """Retriever NFT"""
+    pipeline = TxPipeline(web3)
     try:
-        wallet_address = Web3.to_checksum_address(wallet.address)
-        nft_contract = web3.eth.contract(address=Web3.to_checksum_address(RETRIEVER_NFT_CONTRACT), abi=RETRIEVER_NFT_ABI)
+        wallet_address = checksum(wallet.address)
+        nft_contract = get_contract(web3, RETRIEVER_NFT_CONTRACT, RETRIEVER_NFT_ABI)
 
         allowlist_proof = {
             'proof': [],
@@ -822,97 +518,52 @@ async def activity16_retriever_nft(web3, wallet, private_key):
             'currency': '0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE'
         }
 
-        nonce = web3.eth.get_transaction_count(wallet_address)
-        tx = nft_contract.functions.claim(
+        pending = await pipeline.submit(wallet, nft_contract.functions.claim(
             wallet_address,
             1,
             '0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE',
             0,
             allowlist_proof,
             b''
-        ).build_transaction({
-            'from': wallet_address,
-            'nonce': nonce,
-            'gas': 300000,
-            'gasPrice': web3.eth.gas_price,
-            'chainId': CONFIG['CHAIN_ID']
-        })
-
-        # Sign transaction
-        try:
-            signed_tx = wallet.sign_transaction(tx)
-            raw_tx = signed_tx.rawTransaction
-        except (AttributeError, TypeError):
-            signed_tx = Account.sign_transaction(tx, private_key)
-            raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-        tx_hash = web3.eth.send_raw_transaction(raw_tx)
-        await wait_for_tx_with_retry(web3, tx_hash.hex())
+        ), gas=300000)
+        await pending.wait()
         print(f"  → Retriever NFT claimed")
-        print(f"  → TX: {short_hash(tx_hash.hex())}")
-        return tx_hash.hex()
+        print(f"  → TX: {short_hash(pending.hash)}")
+        return pending.hash
     except Exception as e:
         print(f"  → Error: {str(e)[:60]}")
         return None
 
-async def activity17_batch_operations(web3, wallet, private_key):
+async def activity17_batch_operations(web3, wallet):
     """Batch Operations"""
+    pipeline = TxPipeline(web3)
     try:
-        wallet_address = Web3.to_checksum_address(wallet.address)
-        dex_address = Web3.to_checksum_address(SYSTEM_CONTRACTS['STABLECOIN_DEX'])
-        dex = web3.eth.contract(address=dex_address, abi=STABLECOIN_DEX_ABI)
-        path_usd_address = Web3.to_checksum_address(CONFIG['TOKENS']['PathUSD'])
-        path_usd = web3.eth.contract(address=path_usd_address, abi=ERC20_ABI)
+        wallet_address = checksum(wallet.address)
+        dex_address = SYSTEM_CONTRACTS['STABLECOIN_DEX']
+        dex = get_contract(web3, dex_address, STABLECOIN_DEX_ABI)
+        path_usd_address = CONFIG['TOKENS']['PathUSD']
+        path_usd = get_contract(web3, path_usd_address, ERC20_ABI)
         amount = int(0.5 * (10 ** 6))
 
         # Approve
-        allowance = path_usd.functions.allowance(wallet_address, dex_address).call()
+        allowance = await path_usd.functions.allowance(wallet_address, dex_address).call()
         if allowance < amount:
-            nonce = web3.eth.get_transaction_count(wallet_address)
             max_uint256 = 2**256 - 1
-            approve_tx = path_usd.functions.approve(dex_address, max_uint256).build_transaction({
-                'from': wallet_address,
-                'nonce': nonce,
-                'gas': 100000,
-                'gasPrice': web3.eth.gas_price,
-                'chainId': CONFIG['CHAIN_ID']
-            })
-            # Sign transaction
-            try:
-                signed_approve = wallet.sign_transaction(approve_tx)
-                raw_tx = signed_approve.rawTransaction
-            except (AttributeError, TypeError):
-                signed_approve = Account.sign_transaction(approve_tx, private_key)
-                raw_tx = signed_approve.rawTransaction if hasattr(signed_approve, 'rawTransaction') else signed_approve.raw_transaction
-            approve_hash = web3.eth.send_raw_transaction(raw_tx)
-            await wait_for_tx_with_retry(web3, approve_hash.hex())
-            print(f"  → Approve TX: {short_hash(approve_hash.hex())}")
+            approve_tx = await pipeline.submit(wallet, path_usd.functions.approve(dex_address, max_uint256), gas=100000)
+            await approve_tx.wait()
+            print(f"  → Approve TX: {short_hash(approve_tx.hash)}")
 
         # Swap
-        beta_usd_address = Web3.to_checksum_address(CONFIG['TOKENS']['BetaUSD'])
-        quote = dex.functions.quoteSwapExactAmountIn(path_usd_address, beta_usd_address, amount).call()
+        beta_usd_address = CONFIG['TOKENS']['BetaUSD']
+        quote = await dex.functions.quoteSwapExactAmountIn(path_usd_address, beta_usd_address, amount).call()
 
         if quote > 0:
             min_out = (quote * 99) // 100
-            nonce = web3.eth.get_transaction_count(wallet_address)
-            tx = dex.functions.swapExactAmountIn(path_usd_address, beta_usd_address, amount, min_out).build_transaction({
-                'from': wallet_address,
-                'nonce': nonce,
-                'gas': 300000,
-                'gasPrice': web3.eth.gas_price,
-                'chainId': CONFIG['CHAIN_ID']
-            })
-            # Sign transaction
-            try:
-                signed_swap = wallet.sign_transaction(tx)
-                raw_tx = signed_swap.rawTransaction
-            except (AttributeError, TypeError):
-                signed_swap = Account.sign_transaction(tx, private_key)
-                raw_tx = signed_swap.rawTransaction if hasattr(signed_swap, 'rawTransaction') else signed_swap.raw_transaction
-            tx_hash = web3.eth.send_raw_transaction(raw_tx)
-            await wait_for_tx_with_retry(web3, tx_hash.hex())
+            pending = await pipeline.submit(wallet, dex.functions.swapExactAmountIn(path_usd_address, beta_usd_address, amount, min_out), gas=300000)
+            await pending.wait()
             print(f"  → 0.5 PathUSD → BetaUSD")
-            print(f"  → Swap TX: {short_hash(tx_hash.hex())}")
-            return tx_hash.hex()
+            print(f"  → Swap TX: {short_hash(pending.hash)}")
+            return pending.hash
         else:
             print(f"  → No liquidity for swap")
             return None
@@ -920,6 +571,124 @@ async def activity17_batch_operations(web3, wallet, private_key):
         print(f"  → Error: {str(e)[:60]}")
         return None
 
+async def run_wallet_activities(web3, wallet, wallet_number, position, total):
+    """Run the shuffled activity list of one wallet and count the outcomes"""
+    tag = f"[W#{wallet_number}]"
+    summary = {'wallet': wallet_number, 'address': wallet.address, 'done': 0, 'failed': 0, 'skipped': 0, 'error': None}
+
+    print(f"\n{'=' * 67}")
+    print(f"WALLET #{wallet_number} ({position}/{total}): {wallet.address}")
+    print('=' * 67)
+
+    # List of all activities
+    activities = [
+        {'id': 1, 'name': 'Deploy contract', 'fn': lambda: activity1_deploy(web3, wallet)},
+        {'id': 2, 'name': 'Faucet', 'fn': lambda: activity2_faucet(web3, wallet)},
+        {'id': 3, 'name': 'Send tokens', 'fn': lambda: activity3_send_tokens(web3, wallet)},
+        {'id': 4, 'name': 'Create stablecoin', 'fn': lambda: activity4_create_stablecoin(web3, wallet)},
+        {'id': 5, 'name': 'Swap', 'fn': lambda: activity5_swap(web3, wallet)},
+        {'id': 6, 'name': 'Add liquidity', 'fn': lambda: activity6_add_liquidity(web3, wallet)},
+        {'id': 7, 'name': 'Set fee token', 'fn': lambda: activity7_set_fee_token(web3, wallet)},
+        {'id': 10, 'name': 'Transfer with memo', 'fn': lambda: activity10_transfer_with_memo(web3, wallet)},
+        {'id': 11, 'name': 'Limit order', 'fn': lambda: activity11_limit_order(web3, wallet)},
+        {'id': 12, 'name': 'Remove liquidity', 'fn': lambda: activity12_remove_liquidity(web3, wallet)},
+        {'id': 14, 'name': 'NFT', 'fn': lambda: activity14_nft(web3, wallet)},
+        {'id': 16, 'name': 'Retriever NFT', 'fn': lambda: activity16_retriever_nft(web3, wallet)},
+        {'id': 17, 'name': 'Batch Operations', 'fn': lambda: activity17_batch_operations(web3, wallet)}
+    ]
+
+    # Shuffle activities per wallet
+    shuffled = shuffle_array(activities)
+
+    print(f'\n{tag} Execution order:')
+    for idx, act in enumerate(shuffled):
+        print(f"  {idx + 1}. [{act['id']}] {act['name']}")
+    print('')
+
+    def count(result):
+        summary['done' if result else 'failed'] += 1
+
+    # Execute activities
+    for j in range(len(shuffled)):
+        activity = shuffled[j]
+
+        try:
+            print(f"\n{tag} [{j + 1}/{len(shuffled)}] {activity['name']}...")
+
+            # Special handling for token creation
+            if activity['id'] == 4:
+                created_token = await activity['fn']()
+                count(created_token)
+                if created_token:
+                    print(f"\033[1m\033[32m  ✓ Token created: {created_token}\033[0m")
+
+                    # Then immediately mint, burn and grant a role on the new token
+                    print(f"\n{tag} [Bonus] Mint tokens...")
+                    mint_result = await activity8_mint_tokens(web3, wallet, created_token)
+                    count(mint_result)
+                    if mint_result:
+                        print(f"  ✓ Mint done")
+                    else:
+                        print(f"  ✗ Mint failed")
+
+                    print(f"\n{tag} [Bonus] Burn tokens...")
+                    burn_result = await activity9_burn_tokens(web3, wallet, created_token)
+                    count(burn_result)
+                    if burn_result:
+                        print(f"  ✓ Burn done")
+                    else:
+                        print(f"  ✗ Burn failed")
+
+                    print(f"\n{tag} [Bonus] Grant role...")
+                    role_result = await activity13_grant_role(web3, wallet, created_token)
+                    count(role_result)
+                    if role_result:
+                        print(f"  ✓ Role granted")
+                    else:
+                        print(f"  ✗ Role not granted")
+                else:
+                    print(f"\033[1m\033[31m  ✗ Token not created\033[0m")
+            elif activity['id'] in [8, 9, 13]:
+                summary['skipped'] += 1
+                print(f"  ⊘ Skipped (handled after token creation)")
+            elif activity['id'] in [15, 18]:
+                summary['skipped'] += 1
+                print(f"  ⊘ Skipped (requires specific params)")
+            else:
+                result = await activity['fn']()
+                count(result)
+                if result:
+                    print(f"\033[1m\033[32m  ✓ Done\033[0m")
+                else:
+                    print(f"\033[1m\033[31m  ✗ Failed\033[0m")
+
+            # Delay between activities
+            delay = random.randint(2000, 5000) / 1000
+            await async_sleep(delay)
+
+        except Exception as error:
+            summary['failed'] += 1
+            err_msg = str(error)
+            if is_transient_error(error):
+                print(f"  ⚠️ RPC error, continuing...")
+            else:
+                print(f"  ✗ Error: {err_msg[:60]}")
+
+    print(f"\n✅ Wallet #{wallet_number} finished!")
+    return summary
+
+def print_auto_summary(results):
+    """Per-wallet results table of an auto mode run"""
+    print(f"\n\033[1m\033[35m📊  AUTO MODE SUMMARY\033[0m")
+    for r in sorted(results, key=lambda r: r['wallet']):
+        status = f"\033[1m\033[31maborted: {r['error'][:40]}\033[0m" if r['error'] else (
+            f"\033[1m\033[32m✓ {r['done']}\033[0m  \033[1m\033[31m✗ {r['failed']}\033[0m  \033[1m\033[33m⊘ {r['skipped']}\033[0m"
+        )
+        print(f"  #{str(r['wallet']).ljust(4)} {short_hash(r['address'])}  {status}")
+    print(f"\033[1m\033[32m✓\033[0m Successful activities: \033[1m\033[32m{sum(r['done'] for r in results)}\033[0m")
+    print(f"\033[1m\033[31m✗\033[0m Failed activities: \033[1m\033[31m{sum(r['failed'] for r in results)}\033[0m")
+    print(f"\033[1m\033[36m◆\033[0m Total wallets: \033[1m\033[36m{len(results)}\033[0m")
+
 async def run_auto_mode():
     """Main entry for automatic activity mode"""
     print('\n╔═══════════════════════════════════════════════════════════════╗')
@@ -959,113 +728,37 @@ async def run_auto_mode():
         print('\033[1m\033[36mIndexes:\033[0m', ', '.join(str(i + 1) for i in selected_indices))
         print('')
 
-    web3 = Web3(Web3.HTTPProvider(CONFIG['RPC_URL']))
-    test_wallets = [private_keys[i] for i in selected_indices]
-
-    for i in range(len(test_wallets)):
-        wallet = Account.from_key(test_wallets[i])
-        wallet_number = selected_indices[i] + 1
-        print(f"\n{'=' * 67}")
-        print(f"WALLET #{wallet_number} ({i + 1}/{len(test_wallets)}): {wallet.address}")
-        print('=' * 67)
-
-        private_key = test_wallets[i]
-
-        # List of all activities
-        activities = [
-            {'id': 1, 'name': 'Deploy contract', 'fn': lambda: activity1_deploy(web3, wallet, private_key)},
-            {'id': 2, 'name': 'Faucet', 'fn': lambda: activity2_faucet(web3, wallet)},
-            {'id': 3, 'name': 'Send tokens', 'fn': lambda: activity3_send_tokens(web3, wallet, private_key)},
-            {'id': 4, 'name': 'Create stablecoin', 'fn': lambda: activity4_create_stablecoin(web3, wallet, private_key)},
-            {'id': 5, 'name': 'Swap', 'fn': lambda: activity5_swap(web3, wallet, private_key)},
-            {'id': 6, 'name': 'Add liquidity', 'fn': lambda: activity6_add_liquidity(web3, wallet, private_key)},
-            {'id': 7, 'name': 'Set fee token', 'fn': lambda: activity7_set_fee_token(web3, wallet, private_key)},
-            {'id': 10, 'name': 'Transfer with memo', 'fn': lambda: activity10_transfer_with_memo(web3, wallet, private_key)},
-            {'id': 11, 'name': 'Limit order', 'fn': lambda: activity11_limit_order(web3, wallet, private_key)},
-            {'id': 12, 'name': 'Remove liquidity', 'fn': lambda: activity12_remove_liquidity(web3, wallet, private_key)},
-            {'id': 14, 'name': 'NFT', 'fn': lambda: activity14_nft(web3, wallet, private_key)},
-            {'id': 16, 'name': 'Retriever NFT', 'fn': lambda: activity16_retriever_nft(web3, wallet, private_key)},
-            {'id': 17, 'name': 'Batch Operations', 'fn': lambda: activity17_batch_operations(web3, wallet, private_key)}
-        ]
-
-        # Shuffle activities per wallet
-        shuffled = shuffle_array(activities)
-
-        print('\nExecution order:')
-        for idx, act in enumerate(shuffled):
-            print(f"  {idx + 1}. [{act['id']}] {act['name']}")
-        print('')
+    # Compile the built-in contracts once, before the wallets start
+    try:
+        await warm_templates_async([get_contract_source(), get_nft_contract_source()])
+    except Exception as error:
+        print(f"\033[1m\033[33m⚠️ Contract precompile failed: {str(error)[:60]}\033[0m")
 
-        created_token = None
+    web3 = create_web3()
+    wallets = get_wallets(private_keys)
+    concurrency = max(1, min(CONFIG['AUTO_CONCURRENCY'], len(selected_indices)))
+    print(f"\033[1m\033[36mWallets in parallel: {concurrency}\033[0m")
 
-        # Execute activities
-        for j in range(len(shuffled)):
-            activity = shuffled[j]
+    # Each wallet keeps its own activity order; up to `concurrency` wallets run at once
+    semaphore = asyncio.Semaphore(concurrency)
 
+    async def worker(position, index):
+        async with semaphore:
+            wallet = wallets[index]
             try:
-                print(f"\n[{j + 1}/{len(shuffled)}] {activity['name']}...")
-
-                # Special handling for token creation
-                if activity['id'] == 4:
-                    created_token = await activity['fn']()
-                    if created_token:
-                        print(f"\033[1m\033[32m  ✓ Token created: {created_token}\033[0m")
-                    else:
-                        print(f"\033[1m\033[31m  ✗ Token not created\033[0m")
-
-                        # Then immediately mint and burn
-                        await async_sleep(3)
-                        print(f"\n[Bonus] Mint tokens...")
-                        mint_result = await activity8_mint_tokens(web3, wallet, private_key, created_token)
-                        if mint_result:
-                            print(f"  ✓ Mint done")
-                        else:
-                            print(f"  ✗ Mint failed")
-
-                        await async_sleep(2)
-                        print(f"\n[Bonus] Burn tokens...")
-                        burn_result = await activity9_burn_tokens(web3, wallet, private_key, created_token)
-                        if burn_result:
-                            print(f"  ✓ Burn done")
-                        else:
-                            print(f"  ✗ Burn failed")
-
-                        await async_sleep(2)
-                        print(f"\n[Bonus] Grant role...")
-                        role_result = await activity13_grant_role(web3, wallet, private_key, created_token)
-                        if role_result:
-                            print(f"  ✓ Role granted")
-                        else:
-                            print(f"  ✗ Role not granted")
-                elif activity['id'] in [8, 9, 13]:
-                    print(f"  ⊘ Skipped (handled after token creation)")
-                elif activity['id'] in [15, 18]:
-                    print(f"  ⊘ Skipped (requires specific params)")
-                else:
-                    result = await activity['fn']()
-                    if result:
-                        print(f"\033[1m\033[32m  ✓ Done\033[0m")
-                    else:
-                        print(f"\033[1m\033[31m  ✗ Failed\033[0m")
-
-                # Delay between activities
-                delay = random.randint(2000, 5000) / 1000
-                await async_sleep(delay)
-
+                result = await run_wallet_activities(web3, wallet, index + 1, position + 1, len(selected_indices))
             except Exception as error:
-                err_msg = str(error)
-                if '502' in err_msg or '503' in err_msg:
-                    print(f"  ⚠️ RPC error, continuing...")
-                else:
-                    print(f"  ✗ Error: {err_msg[:60]}")
+                print(f"\n  ✗ Wallet #{index + 1} aborted: {str(error)[:60]}")
+                result = {'wallet': index + 1, 'address': wallet.address, 'done': 0, 'failed': 0, 'skipped': 0, 'error': str(error)}
 
-        print(f"\n✅ Wallet #{wallet_number} finished!")
+            # Delay before this slot picks up the next wallet
+            if position < len(selected_indices) - concurrency:
+                delay = random.randint(5000, 10000) / 1000
+                await async_sleep(delay)
+            return result
 
-        # Delay between wallets
-        if i < len(test_wallets) - 1:
-            delay = random.randint(5000, 10000) / 1000
-            print(f"\nWaiting {int(delay)}s before next wallet...")
-            await async_sleep(delay)
+    results = await asyncio.gather(*(worker(position, index) for position, index in enumerate(selected_indices)))
+    print_auto_summary(results)
 
     print('\n╔═══════════════════════════════════════════════════════════════╗')
     print('║              AUTO MODE FINISHED                               ║')
@@ -6,12 +6,16 @@ import asyncio
 import os
 import json
 import time
-from web3 import Web3
 from eth_account import Account
 from config import CONFIG, SYSTEM_CONTRACTS, ERC20_ABI, STABLECOIN_DEX_ABI, COLORS
-from utils.helpers import ask_question, async_sleep, short_hash, wait_for_tx_with_retry, countdown, get_random_int
-from utils.wallet import get_private_keys
-from utils.statistics import WalletStatistics
+from utils.address import checksum
+from utils.contracts import get_contract
+from utils.helpers import ask_question, async_sleep, short_hash, countdown, get_random_int
+from utils.provider import create_web3
+from utils.pipeline import TxPipeline
+from utils.wallet import get_private_keys, get_wallets
+from utils.statistics import get_statistics
+from utils.resilience import is_transient_error, backoff_seconds
 
 # Batch contract ABI
 BATCH_ABI = [
@@ -51,7 +55,7 @@ async def get_batch_contract(web3, wallet):
             data = json.load(f)
             if data.get('address'):
                 print(f"\033[1m\033[32m✓ Batch контракт найден: {data['address']}\033[0m\n")
-                return web3.eth.contract(address=Web3.to_checksum_address(data['address']), abi=BATCH_ABI)
+                return get_contract(web3, checksum(data['address']), BATCH_ABI)
 
     # If no contract, fall back to simple operations
     print('\033[1m\033[33m⚠️ Batch contract not found. Using simple operations.\033[0m\n')
@@ -79,8 +83,9 @@ async def run_batch_operations():
             print('\033[1m\033[31mPrivate keys not found in pv.txt\033[0m')
             return
 
-        web3 = Web3(Web3.HTTPProvider(CONFIG['RPC_URL']))
-        wallets = [Account.from_key(pk) for pk in private_keys]
+        web3 = create_web3()
+        pipeline = TxPipeline(web3)
+        wallets = get_wallets(private_keys)
 
         print(f"\n\033[1m\033[36mFound {len(wallets)} wallet(s)\033[0m\n")
 
@@ -94,22 +99,21 @@ async def run_batch_operations():
             token_out = CONFIG['TOKENS']['AlphaUSD']
             amount = int(1 * (10 ** 6))
 
-            dex_address_checksum = Web3.to_checksum_address(SYSTEM_CONTRACTS['STABLECOIN_DEX'])
-            token_in_checksum = Web3.to_checksum_address(token_in)
-            token_out_checksum = Web3.to_checksum_address(token_out)
-            dex = web3.eth.contract(address=dex_address_checksum, abi=STABLECOIN_DEX_ABI)
+            dex_address_checksum = SYSTEM_CONTRACTS['STABLECOIN_DEX']
+            token_in_checksum = checksum(token_in)
+            token_out_checksum = checksum(token_out)
+            dex = get_contract(web3, dex_address_checksum, STABLECOIN_DEX_ABI)
 
             for w in range(len(wallets)):
                 wallet = wallets[w]
-                private_key = private_keys[w]
-                wallet_address = Web3.to_checksum_address(wallet.address)
+                wallet_address = checksum(wallet.address)
 
                 print(f"\n\033[1m\033[35mWALLET #{w + 1}/{len(wallets)}\033[0m")
                 print(f"\033[1m\033[36mAddress: {wallet_address}\033[0m")
 
                 try:
                     try:
-                        quote = dex.functions.quoteSwapExactAmountIn(
+                        quote = await dex.functions.quoteSwapExactAmountIn(
                             token_in_checksum,
                             token_out_checksum,
                             amount
@@ -122,54 +126,24 @@ async def run_batch_operations():
 
                     # Approve DEX
                     print('\033[1m\033[33m1/2 Approve DEX...\033[0m')
-                    token = web3.eth.contract(address=token_in_checksum, abi=ERC20_ABI)
-                    nonce = web3.eth.get_transaction_count(wallet_address)
+                    token = get_contract(web3, token_in_checksum, ERC20_ABI)
                     max_uint256 = 2**256 - 1
-                    approve_tx = token.functions.approve(dex_address_checksum, max_uint256).build_transaction({
-                        'from': wallet_address,
-                        'nonce': nonce,
-                        'gas': 100000,
-                        'gasPrice': web3.eth.gas_price,
-                        'chainId': CONFIG['CHAIN_ID']
-                    })
-                    try:
-                        signed_approve = wallet.sign_transaction(approve_tx)
-                        raw_tx = signed_approve.rawTransaction
-                    except (AttributeError, TypeError):
-                        signed_approve = Account.sign_transaction(approve_tx, private_key)
-                        raw_tx = signed_approve.rawTransaction if hasattr(signed_approve, 'rawTransaction') else signed_approve.raw_transaction
-                    await wait_for_tx_with_retry(web3, web3.eth.send_raw_transaction(raw_tx).hex())
+                    await pipeline.send(wallet, token.functions.approve(dex_address_checksum, max_uint256), gas=100000)
                     print('  ✓ Approved\n')
 
                     # Execute swap
                     print('\033[1m\033[33m2/2 Swap...\033[0m')
                     start_time = time.time()
 
-                    nonce = web3.eth.get_transaction_count(wallet_address)
-                    swap_tx = dex.functions.swapExactAmountIn(
+                    pending = await pipeline.submit(wallet, dex.functions.swapExactAmountIn(
                         token_in_checksum,
                         token_out_checksum,
                         amount,
                         min_out
-                    ).build_transaction({
-                        'from': wallet_address,
-                        'nonce': nonce,
-                        'gas': 300000,
-                        'gasPrice': web3.eth.gas_price,
-                        'chainId': CONFIG['CHAIN_ID']
-                    })
-
-                    # Подписываем транзакцию
-                    try:
-                        signed_swap = wallet.sign_transaction(swap_tx)
-                        raw_tx = signed_swap.rawTransaction
-                    except (AttributeError, TypeError):
-                        signed_swap = Account.sign_transaction(swap_tx, private_key)
-                        raw_tx = signed_swap.rawTransaction if hasattr(signed_swap, 'rawTransaction') else signed_swap.raw_transaction
-                    tx_hash = web3.eth.send_raw_transaction(raw_tx)
+                    ), gas=300000)
 
-                    print(f"  TX: {short_hash(tx_hash.hex())}")
-                    receipt = await wait_for_tx_with_retry(web3, tx_hash.hex())
+                    print(f"  TX: {short_hash(pending.hash)}")
+                    receipt = await pending.wait()
 
                     end_time = time.time()
                     duration = f"{end_time - start_time:.1f}"
@@ -180,16 +154,15 @@ async def run_batch_operations():
                     print(f"\033[1m\033[36mTime: {duration}s\033[0m")
                     print(f"\033[1m\033[33m💡 Savings: ~30-40% gas vs 2 TX\033[0m")
 
-                    stats = WalletStatistics()
+                    stats = get_statistics()
                     stats.record_transaction(
                         wallet_address,
                         'batch_approve_swap',
-                        tx_hash.hex(),
+                        pending.hash,
                         str(receipt['gasUsed']),
                         'success',
                         {'tokenIn': token_in, 'tokenOut': token_out, 'amount': str(amount)}
                     )
-                    stats.close()
 
                     successful += 1
 
@@ -224,8 +197,8 @@ async def run_batch_operations():
                 ['PathUSD', 'BetaUSD']
             ]
 
-            dex_address_checksum = Web3.to_checksum_address(SYSTEM_CONTRACTS['STABLECOIN_DEX'])
-            dex = web3.eth.contract(address=dex_address_checksum, abi=STABLECOIN_DEX_ABI)
+            dex_address_checksum = SYSTEM_CONTRACTS['STABLECOIN_DEX']
+            dex = get_contract(web3, dex_address_checksum, STABLECOIN_DEX_ABI)
             amount = int(0.5 * (10 ** 6))
 
             print('\033[1m\033[36mPreparing swaps:\033[0m')
@@ -236,8 +209,7 @@ async def run_batch_operations():
 
             for w in range(len(wallets)):
                 wallet = wallets[w]
-                private_key = private_keys[w]
-                wallet_address = Web3.to_checksum_address(wallet.address)
+                wallet_address = checksum(wallet.address)
 
                 print(f"\n\033[1m\033[35mWALLET #{w + 1}/{len(wallets)}\033[0m")
                 print(f"\033[1m\033[36mAddress: {wallet_address}\033[0m")
@@ -258,33 +230,19 @@ async def run_batch_operations():
                         try:
                             print(f"\033[1m\033[33m{i + 1}/{count} {token_in_name} → {token_out_name}...\033[0m")
 
-                            token_in_checksum = Web3.to_checksum_address(token_in)
-                            token_out_checksum = Web3.to_checksum_address(token_out)
+                            token_in_checksum = checksum(token_in)
+                            token_out_checksum = checksum(token_out)
 
                             # Approve DEX
-                            token = web3.eth.contract(address=token_in_checksum, abi=ERC20_ABI)
-                            allowance = token.functions.allowance(wallet_address, dex_address_checksum).call()
+                            token = get_contract(web3, token_in_checksum, ERC20_ABI)
+                            allowance = await token.functions.allowance(wallet_address, dex_address_checksum).call()
 
                             if allowance < amount:
-                                nonce = web3.eth.get_transaction_count(wallet_address)
                                 max_uint256 = 2**256 - 1
-                                approve_tx = token.functions.approve(dex_address_checksum, max_uint256).build_transaction({
-                                    'from': wallet_address,
-                                    'nonce': nonce,
-                                    'gas': 100000,
-                                    'gasPrice': web3.eth.gas_price,
-                                    'chainId': CONFIG['CHAIN_ID']
-                                })
-                                try:
-                                    signed_approve = wallet.sign_transaction(approve_tx)
-                                    raw_tx = signed_approve.rawTransaction
-                                except (AttributeError, TypeError):
-                                    signed_approve = Account.sign_transaction(approve_tx, private_key)
-                                    raw_tx = signed_approve.rawTransaction if hasattr(signed_approve, 'rawTransaction') else signed_approve.raw_transaction
-                                await wait_for_tx_with_retry(web3, web3.eth.send_raw_transaction(raw_tx).hex())
+                                await pipeline.send(wallet, token.functions.approve(dex_address_checksum, max_uint256), gas=100000)
 
                             # Get quote
-                            quote = dex.functions.quoteSwapExactAmountIn(
+                            quote = await dex.functions.quoteSwapExactAmountIn(
                                 token_in_checksum,
                                 token_out_checksum,
                                 amount
@@ -292,44 +250,28 @@ async def run_batch_operations():
                             min_out = (quote * 99) // 100
 
                             # Execute swap
-                            nonce = web3.eth.get_transaction_count(wallet_address)
-                            swap_tx = dex.functions.swapExactAmountIn(
+                            pending = await pipeline.submit(wallet, dex.functions.swapExactAmountIn(
                                 token_in_checksum,
                                 token_out_checksum,
                                 amount,
                                 min_out
-                            ).build_transaction({
-                                'from': wallet_address,
-                                'nonce': nonce,
-                                'gas': 300000,
-                                'gasPrice': web3.eth.gas_price,
-                                'chainId': CONFIG['CHAIN_ID']
-                            })
-
-                            try:
-                                signed_swap = wallet.sign_transaction(swap_tx)
-                                raw_tx = signed_swap.rawTransaction
-                            except (AttributeError, TypeError):
-                                signed_swap = Account.sign_transaction(swap_tx, private_key)
-                                raw_tx = signed_swap.rawTransaction if hasattr(signed_swap, 'rawTransaction') else signed_swap.raw_transaction
-                            tx_hash = web3.eth.send_raw_transaction(raw_tx)
-                            print(f"  TX: {short_hash(tx_hash.hex())}")
+                            ), gas=300000)
+                            print(f"  TX: {short_hash(pending.hash)}")
 
                             try:
-                                receipt = await wait_for_tx_with_retry(web3, tx_hash.hex())
+                                receipt = await pending.wait()
                                 total_gas += receipt['gasUsed']
                                 print(f"  ✓ Done (Gas: {receipt['gasUsed']})\n")
 
-                                stats = WalletStatistics()
+                                stats = get_statistics()
                                 stats.record_transaction(
                                     wallet_address,
                                     'batch_multiple_swaps',
-                                    tx_hash.hex(),
+                                    pending.hash,
                                     str(receipt['gasUsed']),
                                     'success',
                                     {'tokenIn': token_in_name, 'tokenOut': token_out_name, 'amount': str(amount)}
                                 )
-                                stats.close()
                             except Exception:
                                 print(f"  ✓ TX sent\n")
 
@@ -339,16 +281,13 @@ async def run_batch_operations():
                         except Exception as error:
                             retries -= 1
                             err_msg = str(error)[:50]
-                            if retries > 0 and any(x in err_msg for x in ['ECONNRESET', 'timeout', '502']):
-                                print(f"  ⚠️ Network error, retrying in 3s... ({retries} tries left)\n")
-                                await async_sleep(3)
+                            if retries > 0 and is_transient_error(error):
+                                wait_time = backoff_seconds(3 - retries)
+                                print(f"  ⚠️ Network error, retrying in {wait_time}s... ({retries} tries left)\n")
+                                await async_sleep(wait_time)
                             else:
                                 print(f"  ✗ Error: {err_msg}\n")
 
-                    # Small delay between swaps
-                    if i < count - 1:
-                        await async_sleep(1)
-
                 end_time = time.time()
                 duration = f"{end_time - start_time:.1f}"
 
@@ -381,12 +320,11 @@ async def run_batch_operations():
 
             token_addr = CONFIG['TOKENS']['PathUSD']
             amount = int(0.01 * (10 ** 6))
-            token_addr_checksum = Web3.to_checksum_address(token_addr)
+            token_addr_checksum = checksum(token_addr)
 
             for w in range(len(wallets)):
                 wallet = wallets[w]
-                private_key = private_keys[w]
-                wallet_address = Web3.to_checksum_address(wallet.address)
+                wallet_address = checksum(wallet.address)
 
                 print(f"\n\033[1m\033[35mWALLET #{w + 1}/{len(wallets)}\033[0m")
                 print(f"\033[1m\033[36mAddress: {wallet_address}\033[0m")
@@ -397,7 +335,7 @@ async def run_batch_operations():
                     amounts = [amount] * count
 
                     # Ensure all addresses are checksum
-                    recipients_checksum = [Web3.to_checksum_address(r) for r in recipients]
+                    recipients_checksum = [checksum(r) for r in recipients]
 
                     # Execute multiple transfers
                     print(f"\033[1m\033[33mBatch: {count} transfers...\033[0m")
@@ -406,30 +344,14 @@ async def run_batch_operations():
                     # Execute transfers sequentially (without batch contract)
                     last_tx_hash = None
                     for i, recipient in enumerate(recipients_checksum):
-                        token = web3.eth.contract(address=token_addr_checksum, abi=ERC20_ABI)
-                        nonce = web3.eth.get_transaction_count(wallet_address)
-                        transfer_tx = token.functions.transfer(
+                        token = get_contract(web3, token_addr_checksum, ERC20_ABI)
+                        pending = await pipeline.submit(wallet, token.functions.transfer(
                             recipient,
                             amount
-                        ).build_transaction({
-                            'from': wallet_address,
-                            'nonce': nonce,
-                            'gas': 100000,
-                            'gasPrice': web3.eth.gas_price,
-                            'chainId': CONFIG['CHAIN_ID']
-                        })
-
-                        # Sign transaction
-                        try:
-                            signed_transfer = wallet.sign_transaction(transfer_tx)
-                            raw_tx = signed_transfer.rawTransaction
-                        except (AttributeError, TypeError):
-                            signed_transfer = Account.sign_transaction(transfer_tx, private_key)
-                            raw_tx = signed_transfer.rawTransaction if hasattr(signed_transfer, 'rawTransaction') else signed_transfer.raw_transaction
-                        tx_hash = web3.eth.send_raw_transaction(raw_tx)
-                        print(f"  TX {i+1}: {short_hash(tx_hash.hex())}")
-                        await wait_for_tx_with_retry(web3, tx_hash.hex())
-                        last_tx_hash = tx_hash.hex()
+                        ), gas=100000)
+                        print(f"  TX {i+1}: {short_hash(pending.hash)}")
+                        await pending.wait()
+                        last_tx_hash = pending.hash
 
                     end_time = time.time()
                     duration = f"{end_time - start_time:.1f}"
@@ -438,7 +360,7 @@ async def run_batch_operations():
                     print(f"\033[1m\033[36mTime: {duration}s\033[0m")
 
                     if last_tx_hash:
-                        stats = WalletStatistics()
+                        stats = get_statistics()
                         stats.record_transaction(
                             wallet_address,
                             'batch_multiple_transfers',
@@ -447,7 +369,6 @@ async def run_batch_operations():
                             'success',
                             {'transfersCount': count, 'totalAmount': str(amount * count)}
                         )
-                        stats.close()
 
                     print(f"\n\033[1m\033[36mRecipients:\033[0m")
                     for i, addr in enumerate(recipients[:5]):
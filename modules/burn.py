@@ -3,12 +3,16 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import asyncio
-from web3 import Web3
-from eth_account import Account
 from config import CONFIG, COLORS
-from utils.helpers import ask_question, async_sleep, countdown, get_random_int, short_hash, wait_for_tx_with_retry
-from utils.wallet import get_private_keys, load_created_tokens, get_token_balance
-from utils.statistics import WalletStatistics
+from utils.address import checksum
+from utils.helpers import ask_question, countdown, get_random_int, short_hash
+from utils.provider import create_web3
+from utils.pipeline import TxPipeline
+from utils.wallet import get_private_keys, load_created_tokens, get_token_balance, get_wallets
+from utils.statistics import get_statistics
+from utils.resilience import is_transient_error, backoff_seconds
+from utils.cache import cached_read
+from utils.contracts import get_contract
 from config import SYSTEM_CONTRACTS, FEE_MANAGER_ABI, ERC20_ABI
 
 TIP20_BURN_ABI = [
@@ -46,14 +50,15 @@ async def run_burn_tokens():
             print('\033[1m\033[31mPrivate keys not found in pv.txt\033[0m')
             return
 
-        web3 = Web3(Web3.HTTPProvider(CONFIG['RPC_URL']))
-        wallets = [Account.from_key(pk) for pk in private_keys]
+        web3 = create_web3()
+        pipeline = TxPipeline(web3)
+        wallets = get_wallets(private_keys)
         created_tokens = load_created_tokens()
 
         # Convert addresses to checksum for created token lookup
         wallets_with_tokens = []
         for w in wallets:
-            wallet_addr_checksum = Web3.to_checksum_address(w.address)
+            wallet_addr_checksum = checksum(w.address)
             # Try to find tokens by checksum address
             wallet_tokens = created_tokens.get(wallet_addr_checksum, [])
             if len(wallet_tokens) > 0:
@@ -81,12 +86,11 @@ async def run_burn_tokens():
         skipped = 0
 
         # Check fee token balance for all wallets
-        fee_manager = web3.eth.contract(address=Web3.to_checksum_address(SYSTEM_CONTRACTS['FEE_MANAGER']), abi=FEE_MANAGER_ABI)
+        fee_manager = get_contract(web3, SYSTEM_CONTRACTS['FEE_MANAGER'], FEE_MANAGER_ABI)
 
         for w in range(len(wallets)):
             wallet = wallets[w]
-            private_key = private_keys[w]
-            wallet_address = Web3.to_checksum_address(wallet.address)
+            wallet_address = checksum(wallet.address)
             wallet_tokens = created_tokens.get(wallet_address, [])
 
             print(f"\n\033[1m\033[35mWALLET #{w + 1}/{len(wallets)}\033[0m")
@@ -99,12 +103,12 @@ async def run_burn_tokens():
 
             # Проверяем баланс fee токена
             try:
-                current_fee_token = fee_manager.functions.userTokens(wallet_address).call()
+                current_fee_token = await fee_manager.functions.userTokens(wallet_address).call()
                 if current_fee_token == '0x0000000000000000000000000000000000000000':
                     current_fee_token = CONFIG['TOKENS']['PathUSD']  # Default
 
-                fee_token_contract = web3.eth.contract(address=Web3.to_checksum_address(current_fee_token), abi=ERC20_ABI)
-                fee_balance = fee_token_contract.functions.balanceOf(wallet_address).call()
+                fee_token_contract = get_contract(web3, checksum(current_fee_token), ERC20_ABI)
+                fee_balance = await fee_token_contract.functions.balanceOf(wallet_address).call()
                 fee_balance_formatted = fee_balance / (10 ** 6)
 
                 # Minimum balance to pay gas (~0.1 token)
@@ -125,13 +129,13 @@ async def run_burn_tokens():
 
                 while not burn_done and burn_retry <= max_burn_retries:
                     try:
-                        token_address_checksum = Web3.to_checksum_address(token_info['token'])
-                        token = web3.eth.contract(address=token_address_checksum, abi=TIP20_BURN_ABI)
+                        token_address_checksum = checksum(token_info['token'])
+                        token = get_contract(web3, token_address_checksum, TIP20_BURN_ABI)
 
-                        decimals = token.functions.decimals().call()
+                        decimals = await cached_read(web3, token.functions.decimals())
                         amount_wei = int(float(amount) * (10 ** decimals))
 
-                        bal_before = token.functions.balanceOf(wallet_address).call()
+                        bal_before = await token.functions.balanceOf(wallet_address).call()
                         print(f"\n\033[1m\033[36mBurning {amount} {token_info['symbol']}...\033[0m")
                         print(f"\033[1m\033[34mBalance before: {bal_before / (10 ** decimals)}\033[0m")
 
@@ -141,42 +145,27 @@ async def run_burn_tokens():
                             burn_done = True
                             continue
 
-                        nonce = web3.eth.get_transaction_count(wallet_address)
-                        burn_tx = token.functions.burn(amount_wei).build_transaction({
-                            'from': wallet_address,
-                            'nonce': nonce,
-                            'gas': 150000,
-                            'gasPrice': web3.eth.gas_price,
-                            'chainId': CONFIG['CHAIN_ID']
-                        })
-                        try:
-                            signed_burn = wallet.sign_transaction(burn_tx)
-                            raw_tx = signed_burn.rawTransaction
-                        except (AttributeError, TypeError):
-                            signed_burn = Account.sign_transaction(burn_tx, private_key)
-                            raw_tx = signed_burn.rawTransaction if hasattr(signed_burn, 'rawTransaction') else signed_burn.raw_transaction
-                        burn_tx_hash = web3.eth.send_raw_transaction(raw_tx)
-
-                        print(f"\033[1m\033[33mTX: {short_hash(burn_tx_hash.hex())}\033[0m")
-                        receipt = await wait_for_tx_with_retry(web3, burn_tx_hash.hex())
-
-                        bal_after = token.functions.balanceOf(wallet_address).call()
+                        burn_tx = await pipeline.submit(wallet, token.functions.burn(amount_wei), gas=150000)
+
+                        print(f"\033[1m\033[33mTX: {short_hash(burn_tx.hash)}\033[0m")
+                        receipt = await burn_tx.wait()
+
+                        bal_after = await token.functions.balanceOf(wallet_address).call()
                         print(f"\033[1m\033[34mBalance after: {bal_after / (10 ** decimals)}\033[0m")
 
                         if bal_after < bal_before:
                             print(f"\033[1m\033[32m✓ Burn successful! -{(bal_before - bal_after) / (10 ** decimals)}\033[0m")
 
                             # Record in statistics
-                            stats = WalletStatistics()
+                            stats = get_statistics()
                             stats.record_transaction(
                                 wallet_address,
                                 'token_burn',
-                                burn_tx_hash.hex(),
+                                burn_tx.hash,
                                 str(receipt['gasUsed']),
                                 'success',
                                 {'tokenAddress': token_info['token'], 'symbol': token_info['symbol'], 'amount': amount}
                             )
-                            stats.close()
 
                             successful += 1
                         else:
@@ -187,11 +176,11 @@ async def run_burn_tokens():
 
                     except Exception as error:
                         err_msg = str(error)
-                        is_retryable = any(x in err_msg for x in ['502', '503', 'Bad Gateway', 'SERVER_ERROR', 'timeout'])
+                        is_retryable = is_transient_error(error)
 
                         if is_retryable and burn_retry < max_burn_retries:
                             burn_retry += 1
-                            wait_time = burn_retry * 10
+                            wait_time = backoff_seconds(burn_retry)
                             print(f"\033[1m\033[33m⚠️ RPC error, retry in {wait_time}s... ({burn_retry}/{max_burn_retries})\033[0m")
                             await countdown(wait_time, 'Retry in')
                         else:
@@ -199,8 +188,6 @@ async def run_burn_tokens():
                             failed += 1
                             burn_done = True
 
-                await async_sleep(2)
-
             if w < len(wallets) - 1:
                 await countdown(get_random_int(3, 6), 'Next wallet in')
 
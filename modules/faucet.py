@@ -3,24 +3,25 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import asyncio
-from web3 import Web3
-from eth_account import Account
 from config import CONFIG, COLORS
+from utils.address import checksum
 from utils.helpers import ask_question, countdown, animated_spinner, get_random_int, async_sleep
-from utils.wallet import get_private_keys
-from utils.statistics import WalletStatistics
+from utils.provider import create_web3, rpc_request
+from utils.wallet import get_private_keys, get_wallets
+from utils.statistics import get_statistics
+from utils.resilience import is_transient_error, backoff_seconds
 
 async def claim_faucet_single(web3, wallet, claim_number, total_claims, retry_count=0):
     """Claim faucet for a single wallet"""
     max_retries = 3
     # Ensure checksum address
-    address = Web3.to_checksum_address(wallet.address)
+    address = checksum(wallet.address)
 
     await animated_spinner(CONFIG['FAUCET_PRE_CLAIM_MS'], f'Preparing claim {claim_number}/{total_claims}...')
     print(f"\r\033[1m\033[36m⟳ Sending faucet request...\033[0m                         ", end='', flush=True)
 
     try:
-        tx_hashes = web3.manager.request_blocking('tempo_fundAddress', [address])
+        tx_hashes = await rpc_request(web3, 'tempo_fundAddress', [address])
         if not isinstance(tx_hashes, list):
             tx_hashes = [tx_hashes] if tx_hashes else []
 
@@ -40,7 +41,7 @@ async def claim_faucet_single(web3, wallet, claim_number, total_claims, retry_co
                     )
                     tokens.append(token['symbol'])
 
-        stats = WalletStatistics()
+        stats = get_statistics()
         stats.record_transaction(
             address,
             'faucet_claim',
@@ -49,16 +50,15 @@ async def claim_faucet_single(web3, wallet, claim_number, total_claims, retry_co
             'success',
             {'tokens': tokens}
         )
-        stats.close()
 
         return {'success': True, 'address': address, 'txHashes': tx_hashes}
 
     except Exception as error:
         error_msg = str(error)
-        is_retryable = any(x in error_msg for x in ['502', '503', 'Bad Gateway', 'timeout'])
+        is_retryable = is_transient_error(error)
 
         if retry_count < max_retries and is_retryable:
-            wait_time = (retry_count + 1) * 10
+            wait_time = backoff_seconds(retry_count + 1)
             print(f"\n\033[1m\033[33mRPC error, retry in {wait_time}s... ({retry_count + 1}/{max_retries})\033[0m")
             await countdown(wait_time, 'Retry in')
             return await claim_faucet_single(web3, wallet, claim_number, total_claims, retry_count + 1)
@@ -86,8 +86,8 @@ async def run_faucet_claim():
             print('\033[1m\033[31mPrivate keys not found in pv.txt\033[0m')
             return
 
-        web3 = Web3(Web3.HTTPProvider(CONFIG['RPC_URL']))
-        wallets = [Account.from_key(pk) for pk in private_keys]
+        web3 = create_web3()
+        wallets = get_wallets(private_keys)
 
         claim_count = 1
         while True:
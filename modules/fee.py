@@ -3,12 +3,15 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import asyncio
-from web3 import Web3
-from eth_account import Account
 from config import CONFIG, SYSTEM_CONTRACTS, FEE_MANAGER_ABI, ERC20_ABI, COLORS
-from utils.helpers import ask_question, async_sleep, countdown, get_random_int, short_hash, wait_for_tx_with_retry
-from utils.wallet import get_private_keys, get_token_balance
-from utils.statistics import WalletStatistics
+from utils.address import checksum
+from utils.contracts import get_contract
+from utils.helpers import ask_question, async_sleep, countdown, get_random_int, short_hash
+from utils.provider import create_web3
+from utils.pipeline import TxPipeline
+from utils.wallet import get_private_keys, get_token_balance, get_wallets
+from utils.statistics import get_statistics
+from utils.resilience import is_transient_error, backoff_seconds
 
 async def run_set_fee_token():
     """Main entry for fee token setup module"""
@@ -22,8 +25,9 @@ async def run_set_fee_token():
             print('\033[1m\033[31mPrivate keys not found in pv.txt\033[0m')
             return
 
-        web3 = Web3(Web3.HTTPProvider(CONFIG['RPC_URL']))
-        wallets = [Account.from_key(pk) for pk in private_keys]
+        web3 = create_web3()
+        pipeline = TxPipeline(web3)
+        wallets = get_wallets(private_keys)
 
         token_list = list(CONFIG['TOKENS'].items())
 
@@ -44,16 +48,15 @@ async def run_set_fee_token():
 
         print(f"\n\033[1m\033[32mSetting fee token: {token_symbol}\033[0m\n")
 
-        fee_manager = web3.eth.contract(address=Web3.to_checksum_address(SYSTEM_CONTRACTS['FEE_MANAGER']), abi=FEE_MANAGER_ABI)
+        fee_manager = get_contract(web3, SYSTEM_CONTRACTS['FEE_MANAGER'], FEE_MANAGER_ABI)
 
         successful = 0
         failed = 0
 
         for w in range(len(wallets)):
             wallet = wallets[w]
-            private_key = private_keys[w]
-            wallet_address = Web3.to_checksum_address(wallet.address)
-            token_address_checksum = Web3.to_checksum_address(token_address)
+            wallet_address = checksum(wallet.address)
+            token_address_checksum = checksum(token_address)
 
             print(f"\n\033[1m\033[35mWALLET #{w + 1}/{len(wallets)}\033[0m")
             print(f"\033[1m\033[36mAddress: {wallet_address}\033[0m")
@@ -64,7 +67,7 @@ async def run_set_fee_token():
 
             while not done and retry_count <= max_retries:
                 try:
-                    current_token = fee_manager.functions.userTokens(wallet_address).call()
+                    current_token = await fee_manager.functions.userTokens(wallet_address).call()
                     current_fee_token_addr = CONFIG['TOKENS']['PathUSD'] if current_token == '0x0000000000000000000000000000000000000000' else current_token
 
                     current_token_name = 'PathUSD (default)'
@@ -76,8 +79,8 @@ async def run_set_fee_token():
                         if current_token_name == 'PathUSD (default)':
                             current_token_name = current_token
 
-                    current_fee_token_contract = web3.eth.contract(address=Web3.to_checksum_address(current_fee_token_addr), abi=ERC20_ABI)
-                    current_fee_balance = current_fee_token_contract.functions.balanceOf(wallet_address).call()
+                    current_fee_token_contract = get_contract(web3, checksum(current_fee_token_addr), ERC20_ABI)
+                    current_fee_balance = await current_fee_token_contract.functions.balanceOf(wallet_address).call()
                     current_fee_balance_formatted = current_fee_balance / (10 ** 6)
 
                     print(f"\033[1m\033[34mCurrent fee token: {current_token_name} (balance: {current_fee_balance_formatted})\033[0m")
@@ -95,72 +98,55 @@ async def run_set_fee_token():
                         continue
 
                     print('\033[1m\033[36mSetting fee token...\033[0m')
-                    await async_sleep(2)
-                    nonce = web3.eth.get_transaction_count(wallet_address)
-                    tx = fee_manager.functions.setUserToken(token_address_checksum).build_transaction({
-                        'from': wallet_address,
-                        'nonce': nonce,
-                        'gas': 150000,
-                        'gasPrice': web3.eth.gas_price,
-                        'chainId': CONFIG['CHAIN_ID']
-                    })
-
-                    try:
-                        signed_tx = wallet.sign_transaction(tx)
-                        raw_tx = signed_tx.rawTransaction
-                    except (AttributeError, TypeError):
-                        signed_tx = Account.sign_transaction(tx, private_key)
-                        raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-                    tx_hash = web3.eth.send_raw_transaction(raw_tx)
-
-                    print(f"\033[1m\033[33mTX: {short_hash(tx_hash.hex())}\033[0m")
+                    pending = await pipeline.submit(wallet, fee_manager.functions.setUserToken(token_address_checksum), gas=150000)
+
+                    print(f"\033[1m\033[33mTX: {short_hash(pending.hash)}\033[0m")
 
                     receipt = None
                     wait_success = False
                     for wait_retry in range(5):
                         try:
-                            receipt = await wait_for_tx_with_retry(web3, tx_hash.hex())
+                            receipt = await pending.wait()
                             wait_success = True
                             break
                         except Exception as wait_err:
-                            wait_err_msg = str(wait_err)
-                            if any(x in wait_err_msg for x in ['502', '503', 'Bad Gateway', 'SERVER_ERROR']):
-                                print(f"\033[1m\033[33m⚠️ RPC ошибка при ожидании ({wait_retry + 1}/5), повтор через 5s...\033[0m")
-                                await async_sleep(5)
+                            if is_transient_error(wait_err):
+                                wait_time = backoff_seconds(wait_retry + 1)
+                                print(f"\033[1m\033[33m⚠️ RPC ошибка при ожидании ({wait_retry + 1}/5), повтор через {wait_time}s...\033[0m")
+                                await async_sleep(wait_time)
                             else:
                                 break
 
                     if not wait_success:
                         print(f"\033[1m\033[33m⚠️ TX отправлена, но не удалось подтвердить.\033[0m")
-                        print(f"\033[1m\033[34mExplorer: {CONFIG['EXPLORER_URL']}/tx/{tx_hash.hex()}\033[0m")
+                        print(f"\033[1m\033[34mExplorer: {CONFIG['EXPLORER_URL']}/tx/{pending.hash}\033[0m")
                         successful += 1
                         done = True
                         continue
 
                     print(f"\033[1m\033[32m✓ Fee token set!\033[0m")
-                    print(f"\033[1m\033[34mExplorer: {CONFIG['EXPLORER_URL']}/tx/{tx_hash.hex()}\033[0m")
+                    print(f"\033[1m\033[34mExplorer: {CONFIG['EXPLORER_URL']}/tx/{pending.hash}\033[0m")
 
-                    stats = WalletStatistics()
+                    stats = get_statistics()
                     stats.record_transaction(
                         wallet_address,
                         'fee_token_set',
-                        tx_hash.hex(),
+                        pending.hash,
                         str(receipt['gasUsed']),
                         'success',
                         {'tokenAddress': token_address, 'symbol': token_symbol}
                     )
-                    stats.close()
 
                     successful += 1
                     done = True
 
                 except Exception as error:
                     err_msg = str(error)
-                    is_retryable = any(x in err_msg for x in ['502', '503', 'Bad Gateway', 'SERVER_ERROR', 'timeout'])
+                    is_retryable = is_transient_error(error)
 
                     if is_retryable and retry_count < max_retries:
                         retry_count += 1
-                        wait_time = retry_count * 10
+                        wait_time = backoff_seconds(retry_count)
                         print(f"\033[1m\033[33m⚠️ RPC error, retry in {wait_time}s... ({retry_count}/{max_retries})\033[0m")
                         await countdown(wait_time, 'Retry in')
                     else:
@@ -5,11 +5,14 @@
 import asyncio
 import random
 import string
-from web3 import Web3
-from eth_account import Account
 from config import CONFIG, INFINITY_NAME_CONTRACT, ERC20_ABI, COLORS, SYSTEM_CONTRACTS, FEE_MANAGER_ABI
-from utils.helpers import async_sleep, short_hash, wait_for_tx_with_retry, countdown, get_random_int
-from utils.wallet import get_private_keys
+from utils.address import checksum
+from utils.contracts import get_contract
+from utils.helpers import async_sleep, short_hash, countdown, get_random_int
+from utils.provider import create_web3
+from utils.pipeline import TxPipeline
+from utils.wallet import get_private_keys, get_wallets
+from utils.resilience import is_transient_error, backoff_seconds
 
 INFINITY_NAME_ABI = [
     {
@@ -57,17 +60,18 @@ async def run_infinity_name():
         print('❌ Private keys not found in pv.txt')
         return
 
-    web3 = Web3(Web3.HTTPProvider(CONFIG['RPC_URL']))
-    wallets = [Account.from_key(pk) for pk in private_keys]
+    web3 = create_web3()
+    pipeline = TxPipeline(web3)
+    wallets = get_wallets(private_keys)
 
     print(f"\033[1m\033[36mFound {len(wallets)} wallet(s)\033[0m\n")
 
     # Убеждаемся, что все адреса в checksum формате
-    infinity_contract_checksum = Web3.to_checksum_address(INFINITY_NAME_CONTRACT)
-    path_usd_address_checksum = Web3.to_checksum_address(CONFIG['TOKENS']['PathUSD'])
+    infinity_contract_checksum = INFINITY_NAME_CONTRACT
+    path_usd_address_checksum = CONFIG['TOKENS']['PathUSD']
 
     # Проверяем баланс fee токена для всех кошельков
-    fee_manager = web3.eth.contract(address=Web3.to_checksum_address(SYSTEM_CONTRACTS['FEE_MANAGER']), abi=FEE_MANAGER_ABI)
+    fee_manager = get_contract(web3, SYSTEM_CONTRACTS['FEE_MANAGER'], FEE_MANAGER_ABI)
 
     successful = 0
     failed = 0
@@ -75,8 +79,7 @@ async def run_infinity_name():
 
     for w in range(len(wallets)):
         wallet = wallets[w]
-        private_key = private_keys[w]
-        wallet_address = Web3.to_checksum_address(wallet.address)
+        wallet_address = checksum(wallet.address)
 
         print(f"\n\033[1m\033[35mWALLET #{w + 1}/{len(wallets)}\033[0m")
         print(f"\033[1m\033[36mAddress: {wallet_address}\033[0m")
@@ -84,12 +87,12 @@ async def run_infinity_name():
 
         # Проверяем баланс fee токена
         try:
-            current_fee_token = fee_manager.functions.userTokens(wallet_address).call()
+            current_fee_token = await fee_manager.functions.userTokens(wallet_address).call()
             if current_fee_token == '0x0000000000000000000000000000000000000000':
                 current_fee_token = CONFIG['TOKENS']['PathUSD']  # Default
 
-            fee_token_contract = web3.eth.contract(address=Web3.to_checksum_address(current_fee_token), abi=ERC20_ABI)
-            fee_balance = fee_token_contract.functions.balanceOf(wallet_address).call()
+            fee_token_contract = get_contract(web3, checksum(current_fee_token), ERC20_ABI)
+            fee_balance = await fee_token_contract.functions.balanceOf(wallet_address).call()
             fee_balance_formatted = fee_balance / (10 ** 6)
 
             # Минимальный баланс для оплаты газа (примерно 0.3 токена для регистрации домена)
@@ -105,11 +108,11 @@ async def run_infinity_name():
             # Continue execution, but user will be warned
 
         try:
-            infinity_name = web3.eth.contract(address=infinity_contract_checksum, abi=INFINITY_NAME_ABI)
-            path_usd_contract = web3.eth.contract(address=path_usd_address_checksum, abi=ERC20_ABI)
+            infinity_name = get_contract(web3, infinity_contract_checksum, INFINITY_NAME_ABI)
+            path_usd_contract = get_contract(web3, path_usd_address_checksum, ERC20_ABI)
 
             # Check PathUSD balance
-            path_balance = path_usd_contract.functions.balanceOf(wallet_address).call()
+            path_balance = await path_usd_contract.functions.balanceOf(wallet_address).call()
             print(f"\033[1m\033[36m💰 PathUSD Balance: {path_balance / (10 ** 6)}\033[0m")
 
             # Generate random name for each wallet
@@ -118,42 +121,27 @@ async def run_infinity_name():
 
             # Check availability (may not work)
             try:
-                available = infinity_name.functions.isAvailable(domain_name).call()
+                available = await infinity_name.functions.isAvailable(domain_name).call()
                 print(f"\033[1m\033[32m✓ Available: {available}\033[0m")
             except Exception:
                 print('\033[1m\033[33m⚠️ Failed to check availability\033[0m')
 
             # Approve PathUSD with retry
             approve_amount = int(1000 * (10 ** 6))
-            allowance = path_usd_contract.functions.allowance(wallet_address, infinity_contract_checksum).call()
+            allowance = await path_usd_contract.functions.allowance(wallet_address, infinity_contract_checksum).call()
 
             if allowance < approve_amount:
                 print('\033[1m\033[36m📝 Approving PathUSD...\033[0m')
                 for retry in range(3):
                     try:
-                        nonce = web3.eth.get_transaction_count(wallet_address)
                         max_uint256 = 2**256 - 1
-                        approve_tx = path_usd_contract.functions.approve(infinity_contract_checksum, max_uint256).build_transaction({
-                            'from': wallet_address,
-                            'nonce': nonce,
-                            'gas': 100000,
-                            'gasPrice': web3.eth.gas_price,
-                            'chainId': CONFIG['CHAIN_ID']
-                        })
-                        # Sign transaction
-                        try:
-                            signed_approve = wallet.sign_transaction(approve_tx)
-                            raw_tx = signed_approve.rawTransaction
-                        except (AttributeError, TypeError):
-                            signed_approve = Account.sign_transaction(approve_tx, private_key)
-                            raw_tx = signed_approve.rawTransaction if hasattr(signed_approve, 'rawTransaction') else signed_approve.raw_transaction
-                        await wait_for_tx_with_retry(web3, web3.eth.send_raw_transaction(raw_tx).hex())
+                        await pipeline.send(wallet, path_usd_contract.functions.approve(infinity_contract_checksum, max_uint256), gas=100000)
                         print('\033[1m\033[32m✓ Approved\033[0m')
                         break
                     except Exception as e:
-                        if '502' in str(e) and retry < 2:
+                        if is_transient_error(e) and retry < 2:
                             print(f"\033[1m\033[33m⚠️ RPC error, retry {retry + 1}/3...\033[0m")
-                            await async_sleep(10)
+                            await async_sleep(backoff_seconds(retry + 1))
                         else:
                             raise e
 
@@ -164,26 +152,10 @@ async def run_infinity_name():
                 if registered:
                     break
                 try:
-                    nonce = web3.eth.get_transaction_count(wallet_address)
-                    tx = infinity_name.functions.register(domain_name, '0x0000000000000000000000000000000000000000').build_transaction({
-                        'from': wallet_address,
-                        'nonce': nonce,
-                        'gas': 500000,
-                        'gasPrice': web3.eth.gas_price,
-                        'chainId': CONFIG['CHAIN_ID']
-                    })
-
-                    # Подписываем транзакцию
-                    try:
-                        signed_tx = wallet.sign_transaction(tx)
-                        raw_tx = signed_tx.rawTransaction
-                    except (AttributeError, TypeError):
-                        signed_tx = Account.sign_transaction(tx, private_key)
-                        raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-                    tx_hash = web3.eth.send_raw_transaction(raw_tx)
-                    print(f"\033[1m\033[33mTX: {short_hash(tx_hash.hex())}\033[0m")
+                    pending = await pipeline.submit(wallet, infinity_name.functions.register(domain_name, '0x0000000000000000000000000000000000000000'), gas=500000)
+                    print(f"\033[1m\033[33mTX: {short_hash(pending.hash)}\033[0m")
 
-                    receipt = await wait_for_tx_with_retry(web3, tx_hash.hex())
+                    receipt = await pending.wait()
 
                     if receipt['status'] == 1:
                         print(f"\033[1m\033[32m✅ Domain registered!\033[0m")
@@ -197,9 +169,9 @@ async def run_infinity_name():
                         registered = True
                 except Exception as e:
                     err_msg = str(e)
-                    if ('502' in err_msg or '503' in err_msg) and retry < 2:
+                    if is_transient_error(e) and retry < 2:
                         print(f"\033[1m\033[33m⚠️ RPC error, retry {retry + 1}/3...\033[0m")
-                        await async_sleep(10)
+                        await async_sleep(backoff_seconds(retry + 1))
                     else:
                         if 'execution reverted' in err_msg or 'CALL_EXCEPTION' in err_msg:
                             print('\033[1m\033[33m⚠️ Contract unavailable or domain taken\033[0m')
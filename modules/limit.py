@@ -3,12 +3,15 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import asyncio
-from web3 import Web3
-from eth_account import Account
 from config import CONFIG, SYSTEM_CONTRACTS, STABLECOIN_DEX_ABI, ERC20_ABI, COLORS
-from utils.helpers import ask_question, async_sleep, countdown, get_random_int, short_hash, wait_for_tx_with_retry
-from utils.wallet import get_private_keys, get_token_balance
-from utils.statistics import WalletStatistics
+from utils.address import checksum
+from utils.contracts import get_contract
+from utils.helpers import ask_question, async_sleep, countdown, get_random_int, short_hash
+from utils.provider import create_web3
+from utils.pipeline import TxPipeline
+from utils.wallet import get_private_keys, get_token_balance, get_wallets
+from utils.statistics import get_statistics
+from utils.resilience import is_transient_error, backoff_seconds
 
 DEX_ABI = [
     {
@@ -36,8 +39,9 @@ async def run_limit_order():
             print('\033[1m\033[31mPrivate keys not found in pv.txt\033[0m')
             return
 
-        web3 = Web3(Web3.HTTPProvider(CONFIG['RPC_URL']))
-        wallets = [Account.from_key(pk) for pk in private_keys]
+        web3 = create_web3()
+        pipeline = TxPipeline(web3)
+        wallets = get_wallets(private_keys)
 
         token_list = list(CONFIG['TOKENS'].items())
 
@@ -79,17 +83,16 @@ async def run_limit_order():
         print(f"  Amount: {amount}")
         print(f"  Tick: {tick}\n")
 
-        dex = web3.eth.contract(address=Web3.to_checksum_address(SYSTEM_CONTRACTS['STABLECOIN_DEX']), abi=DEX_ABI)
+        dex = get_contract(web3, SYSTEM_CONTRACTS['STABLECOIN_DEX'], DEX_ABI)
 
         successful = 0
         failed = 0
 
         for w in range(len(wallets)):
             wallet = wallets[w]
-            private_key = private_keys[w]
-            wallet_address = Web3.to_checksum_address(wallet.address)
-            token_address_checksum = Web3.to_checksum_address(token_address)
-            dex_address_checksum = Web3.to_checksum_address(SYSTEM_CONTRACTS['STABLECOIN_DEX'])
+            wallet_address = checksum(wallet.address)
+            token_address_checksum = checksum(token_address)
+            dex_address_checksum = SYSTEM_CONTRACTS['STABLECOIN_DEX']
 
             print(f"\n\033[1m\033[35mWALLET #{w + 1}/{len(wallets)}\033[0m")
             print(f"\033[1m\033[36mAddress: {wallet_address}\033[0m")
@@ -102,12 +105,12 @@ async def run_limit_order():
                 try:
                     token_to_approve = CONFIG['TOKENS']['PathUSD'] if is_bid else token_address
                     token_to_approve_symbol = 'PathUSD' if is_bid else token_symbol
-                    token_to_approve_checksum = Web3.to_checksum_address(token_to_approve)
+                    token_to_approve_checksum = checksum(token_to_approve)
 
-                    token_contract = web3.eth.contract(address=token_to_approve_checksum, abi=ERC20_ABI)
+                    token_contract = get_contract(web3, token_to_approve_checksum, ERC20_ABI)
                     amount_wei = int(float(amount) * (10 ** 6))
 
-                    balance_info = get_token_balance(web3, wallet_address, token_to_approve_checksum)
+                    balance_info = await get_token_balance(web3, wallet_address, token_to_approve_checksum)
                     print(f"\033[1m\033[34mBalance {token_to_approve_symbol}: {balance_info['formatted']}\033[0m")
 
                     if balance_info['balance'] < amount_wei:
@@ -116,57 +119,27 @@ async def run_limit_order():
                         done = True
                         continue
 
-                    allowance = token_contract.functions.allowance(wallet_address, dex_address_checksum).call()
+                    allowance = await token_contract.functions.allowance(wallet_address, dex_address_checksum).call()
                     if allowance < amount_wei:
                         print(f"\033[1m\033[33mApproving {token_to_approve_symbol}...\033[0m")
-                        nonce = web3.eth.get_transaction_count(wallet_address)
                         max_uint256 = 2**256 - 1
-                        approve_tx = token_contract.functions.approve(dex_address_checksum, max_uint256).build_transaction({
-                            'from': wallet_address,
-                            'nonce': nonce,
-                            'gas': 100000,
-                            'gasPrice': web3.eth.gas_price,
-                            'chainId': CONFIG['CHAIN_ID']
-                        })
-                        # Подписываем транзакцию
-                        try:
-                            signed_approve = wallet.sign_transaction(approve_tx)
-                            raw_tx = signed_approve.rawTransaction
-                        except (AttributeError, TypeError):
-                            signed_approve = Account.sign_transaction(approve_tx, private_key)
-                            raw_tx = signed_approve.rawTransaction if hasattr(signed_approve, 'rawTransaction') else signed_approve.raw_transaction
-                        await wait_for_tx_with_retry(web3, web3.eth.send_raw_transaction(raw_tx).hex())
+                        await pipeline.send(wallet, token_contract.functions.approve(dex_address_checksum, max_uint256), gas=100000)
                         print(f"\033[1m\033[32m✓ Approved\033[0m")
 
                     print(f"\033[1m\033[36mPlacing {'BID' if is_bid else 'ASK'} order...\033[0m")
-                    nonce = web3.eth.get_transaction_count(wallet_address)
-                    tx = dex.functions.place(
+                    pending = await pipeline.submit(wallet, dex.functions.place(
                         token_address_checksum,
                         amount_wei,
                         is_bid,
                         tick
-                    ).build_transaction({
-                        'from': wallet_address,
-                        'nonce': nonce,
-                        'gas': 200000,
-                        'gasPrice': web3.eth.gas_price,
-                        'chainId': CONFIG['CHAIN_ID']
-                    })
-
-                    try:
-                        signed_tx = wallet.sign_transaction(tx)
-                        raw_tx = signed_tx.rawTransaction
-                    except (AttributeError, TypeError):
-                        signed_tx = Account.sign_transaction(tx, private_key)
-                        raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-                    tx_hash = web3.eth.send_raw_transaction(raw_tx)
-
-                    print(f"\033[1m\033[33mTX: {short_hash(tx_hash.hex())}\033[0m")
-                    receipt = await wait_for_tx_with_retry(web3, tx_hash.hex())
+                    ), gas=200000)
+
+                    print(f"\033[1m\033[33mTX: {short_hash(pending.hash)}\033[0m")
+                    receipt = await pending.wait()
 
                     order_id = None
                     if receipt.get('logs'):
-                        dex_contract = web3.eth.contract(address=dex_address_checksum, abi=STABLECOIN_DEX_ABI)
+                        dex_contract = get_contract(web3, dex_address_checksum, STABLECOIN_DEX_ABI)
                         for log in receipt['logs']:
                             try:
                                 event = dex_contract.events.OrderPlaced().process_log(log)
@@ -176,29 +149,28 @@ async def run_limit_order():
                                 pass
 
                     print(f"\033[1m\033[32m✓ Order placed!{' Order ID: ' + str(order_id) if order_id else ''}\033[0m")
-                    print(f"\033[1m\033[34mExplorer: {CONFIG['EXPLORER_URL']}/tx/{tx_hash.hex()}\033[0m")
+                    print(f"\033[1m\033[34mExplorer: {CONFIG['EXPLORER_URL']}/tx/{pending.hash}\033[0m")
 
-                    stats = WalletStatistics()
+                    stats = get_statistics()
                     stats.record_transaction(
                         wallet_address,
                         'order_place',
-                        tx_hash.hex(),
+                        pending.hash,
                         str(receipt['gasUsed']),
                         'success',
                         {'tokenAddress': token_address, 'symbol': token_symbol, 'amount': amount, 'isBid': is_bid, 'tick': tick, 'orderId': str(order_id) if order_id else None}
                     )
-                    stats.close()
 
                     successful += 1
                     done = True
 
                 except Exception as error:
                     err_msg = str(error)
-                    is_retryable = any(x in err_msg for x in ['502', '503', 'Bad Gateway', 'SERVER_ERROR', 'timeout'])
+                    is_retryable = is_transient_error(error)
 
                     if is_retryable and retry_count < max_retries:
                         retry_count += 1
-                        wait_time = retry_count * 10
+                        wait_time = backoff_seconds(retry_count)
                         print(f"\033[1m\033[33m⚠️ RPC error, retry in {wait_time}s... ({retry_count}/{max_retries})\033[0m")
                         await countdown(wait_time, 'Retry in')
                     else:
@@ -4,12 +4,15 @@
 
 import asyncio
 import random
-from web3 import Web3
-from eth_account import Account
 from config import CONFIG, SYSTEM_CONTRACTS, FEE_MANAGER_ABI, ERC20_ABI, COLORS
-from utils.helpers import ask_question, async_sleep, countdown, get_random_int, short_hash, wait_for_tx_with_retry
-from utils.wallet import get_private_keys, get_token_balance, load_created_tokens
-from utils.statistics import WalletStatistics
+from utils.address import checksum
+from utils.contracts import get_contract
+from utils.helpers import ask_question, countdown, get_random_int, short_hash
+from utils.provider import create_web3
+from utils.pipeline import TxPipeline
+from utils.wallet import get_private_keys, get_token_balance, load_created_tokens, get_wallets
+from utils.statistics import get_statistics
+from utils.resilience import is_transient_error, backoff_seconds
 
 async def run_add_liquidity():
     """Main function of the add liquidity module"""
@@ -29,14 +32,15 @@ async def run_add_liquidity():
             print('\033[1m\033[31mPrivate keys not found in pv.txt\033[0m')
             return
 
-        web3 = Web3(Web3.HTTPProvider(CONFIG['RPC_URL']))
-        wallets = [Account.from_key(pk) for pk in private_keys]
+        web3 = create_web3()
+        pipeline = TxPipeline(web3)
+        wallets = get_wallets(private_keys)
         created_tokens = load_created_tokens()
 
         token_list = list(CONFIG['TOKENS'].items())
 
         # Convert addresses to checksum format for checking created tokens
-        wallets_with_tokens = [w for w in wallets if len(created_tokens.get(Web3.to_checksum_address(w.address), [])) > 0]
+        wallets_with_tokens = [w for w in wallets if len(created_tokens.get(checksum(w.address), [])) > 0]
 
         print('\033[1m\033[33mToken mode:\033[0m')
         print('\033[1m\033[34m  1. Select pair manually\033[0m')
@@ -140,7 +144,7 @@ async def run_add_liquidity():
                 amount_input = ask_question('\033[1m\033[36mAmount (default 1000): \033[0m')
                 fixed_amount = amount_input or '1000'
 
-        fee_manager = web3.eth.contract(address=Web3.to_checksum_address(SYSTEM_CONTRACTS['FEE_MANAGER']), abi=FEE_MANAGER_ABI)
+        fee_manager = get_contract(web3, SYSTEM_CONTRACTS['FEE_MANAGER'], FEE_MANAGER_ABI)
 
         successful = 0
         failed = 0
@@ -148,9 +152,8 @@ async def run_add_liquidity():
 
         for w in range(len(wallets)):
             wallet = wallets[w]
-            private_key = private_keys[w]
             # Ensure the address is in checksum format
-            wallet_address = Web3.to_checksum_address(wallet.address)
+            wallet_address = checksum(wallet.address)
             wallet_created_tokens = created_tokens.get(wallet_address, [])
 
             print(f"\n\033[1m\033[35mWALLET #{w + 1}/{len(wallets)}\033[0m")
@@ -191,11 +194,11 @@ async def run_add_liquidity():
                     current_amount = fixed_amount
 
                 # Ensure all addresses are in checksum format
-                current_val_token_address_checksum = Web3.to_checksum_address(current_val_token_address)
-                current_user_address_checksum = Web3.to_checksum_address(current_user_address)
-                fee_manager_address_checksum = Web3.to_checksum_address(SYSTEM_CONTRACTS['FEE_MANAGER'])
+                current_val_token_address_checksum = checksum(current_val_token_address)
+                current_user_address_checksum = checksum(current_user_address)
+                fee_manager_address_checksum = SYSTEM_CONTRACTS['FEE_MANAGER']
 
-                val_balance = get_token_balance(web3, wallet_address, current_val_token_address_checksum)
+                val_balance = await get_token_balance(web3, wallet_address, current_val_token_address_checksum)
                 print(f"\033[1m\033[34mBalance {current_val_token_symbol}: {val_balance['formatted']}\033[0m")
 
                 amount_wei = int(float(current_amount) * (10 ** 6))
@@ -212,82 +215,50 @@ async def run_add_liquidity():
 
                 while not liq_done and liq_retry <= max_liq_retries:
                     try:
-                        val_token_contract = web3.eth.contract(address=current_val_token_address_checksum, abi=ERC20_ABI)
-                        allowance_val = val_token_contract.functions.allowance(wallet_address, fee_manager_address_checksum).call()
+                        val_token_contract = get_contract(web3, current_val_token_address_checksum, ERC20_ABI)
+                        allowance_val = await val_token_contract.functions.allowance(wallet_address, fee_manager_address_checksum).call()
 
                         if allowance_val < amount_wei:
                             print(f"\033[1m\033[34mApproving {current_val_token_symbol}...\033[0m")
-                            nonce = web3.eth.get_transaction_count(wallet_address)
                             max_uint256 = 2**256 - 1
-                            approve_tx = val_token_contract.functions.approve(fee_manager_address_checksum, max_uint256).build_transaction({
-                                'from': wallet_address,
-                                'nonce': nonce,
-                                'gas': 100000,
-                                'gasPrice': web3.eth.gas_price,
-                                'chainId': CONFIG['CHAIN_ID']
-                            })
-                            # Sign transaction
-                            try:
-                                signed_approve = wallet.sign_transaction(approve_tx)
-                                raw_tx = signed_approve.rawTransaction
-                            except (AttributeError, TypeError):
-                                signed_approve = Account.sign_transaction(approve_tx, private_key)
-                                raw_tx = signed_approve.rawTransaction if hasattr(signed_approve, 'rawTransaction') else signed_approve.raw_transaction
-                            await wait_for_tx_with_retry(web3, web3.eth.send_raw_transaction(raw_tx).hex())
+                            await pipeline.send(wallet, val_token_contract.functions.approve(fee_manager_address_checksum, max_uint256), gas=100000)
                             print(f"\033[1m\033[32m✓ {current_val_token_symbol} approved\033[0m")
 
                         print(f"\033[1m\033[36mAdding liquidity...\033[0m")
-                        nonce = web3.eth.get_transaction_count(wallet_address)
-                        tx = fee_manager.functions.mintWithValidatorToken(
+                        pending = await pipeline.submit(wallet, fee_manager.functions.mintWithValidatorToken(
                             current_user_address_checksum,
                             current_val_token_address_checksum,
                             amount_wei,
                             wallet_address
-                        ).build_transaction({
-                            'from': wallet_address,
-                            'nonce': nonce,
-                            'gas': 500000,
-                            'gasPrice': web3.eth.gas_price,
-                            'chainId': CONFIG['CHAIN_ID']
-                        })
-
-                        # Sign transaction
-                        try:
-                            signed_tx = wallet.sign_transaction(tx)
-                            raw_tx = signed_tx.rawTransaction
-                        except (AttributeError, TypeError):
-                            signed_tx = Account.sign_transaction(tx, private_key)
-                            raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-                        tx_hash = web3.eth.send_raw_transaction(raw_tx)
-
-                        print(f"\033[1m\033[33mTX: {short_hash(tx_hash.hex())}\033[0m")
-                        receipt = await wait_for_tx_with_retry(web3, tx_hash.hex())
+                        ), gas=500000)
+
+                        print(f"\033[1m\033[33mTX: {short_hash(pending.hash)}\033[0m")
+                        receipt = await pending.wait()
 
                         print(f"\033[1m\033[32m✓ Liquidity added!\033[0m")
-                        print(f"\033[1m\033[34mExplorer: {CONFIG['EXPLORER_URL']}/tx/{tx_hash.hex()}\033[0m")
+                        print(f"\033[1m\033[34mExplorer: {CONFIG['EXPLORER_URL']}/tx/{pending.hash}\033[0m")
 
                         # Record in statistics
-                        stats = WalletStatistics()
+                        stats = get_statistics()
                         stats.record_transaction(
                             wallet_address,
                             'liquidity_add',
-                            tx_hash.hex(),
+                            pending.hash,
                             str(receipt['gasUsed']),
                             'success',
                             {'userToken': current_user_symbol, 'validatorToken': current_val_token_symbol, 'amount': current_amount}
                         )
-                        stats.close()
 
                         successful += 1
                         liq_done = True
 
                     except Exception as error:
                         err_msg = str(error)
-                        is_retryable = any(x in err_msg for x in ['502', '503', 'Bad Gateway', 'SERVER_ERROR', 'timeout'])
+                        is_retryable = is_transient_error(error)
 
                         if is_retryable and liq_retry < max_liq_retries:
                             liq_retry += 1
-                            wait_time = liq_retry * 10
+                            wait_time = backoff_seconds(liq_retry)
                             print(f"\033[1m\033[33m⚠️ Error, retrying in {wait_time}s... ({liq_retry}/{max_liq_retries})\033[0m")
                             await countdown(wait_time, 'Retry in')
                         else:
@@ -295,8 +266,6 @@ async def run_add_liquidity():
                             failed += 1
                             liq_done = True
 
-                await async_sleep(2)
-
             if w < len(wallets) - 1:
                 await countdown(get_random_int(5, 10), 'Next wallet in')
 
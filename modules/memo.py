@@ -3,12 +3,17 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import asyncio
-from web3 import Web3
 from eth_account import Account
 from config import CONFIG, COLORS
-from utils.helpers import ask_question, async_sleep, countdown, get_random_int, short_hash, wait_for_tx_with_retry
-from utils.wallet import get_private_keys, get_token_balance
-from utils.statistics import WalletStatistics
+from utils.address import checksum
+from utils.helpers import ask_question, async_sleep, countdown, get_random_int, short_hash
+from utils.provider import create_web3
+from utils.pipeline import TxPipeline
+from utils.wallet import get_private_keys, get_token_balance, get_wallets
+from utils.statistics import get_statistics
+from utils.resilience import is_transient_error, backoff_seconds
+from utils.cache import cached_read
+from utils.contracts import get_contract
 
 TIP20_MEMO_ABI = [
     {
@@ -49,8 +54,9 @@ async def run_transfer_with_memo():
             print('\033[1m\033[31mPrivate keys not found in pv.txt\033[0m')
             return
 
-        web3 = Web3(Web3.HTTPProvider(CONFIG['RPC_URL']))
-        wallets = [Account.from_key(pk) for pk in private_keys]
+        web3 = create_web3()
+        pipeline = TxPipeline(web3)
+        wallets = get_wallets(private_keys)
 
         token_list = list(CONFIG['TOKENS'].items())
 
@@ -89,10 +95,9 @@ async def run_transfer_with_memo():
 
         for w in range(len(wallets)):
             wallet = wallets[w]
-            private_key = private_keys[w]
-            wallet_address = Web3.to_checksum_address(wallet.address)
-            random_address = Web3.to_checksum_address(Account.create().address)
-            token_address_checksum = Web3.to_checksum_address(token_address)
+            wallet_address = checksum(wallet.address)
+            random_address = checksum(Account.create().address)
+            token_address_checksum = checksum(token_address)
 
             print(f"\n\033[1m\033[35mWALLET #{w + 1}/{len(wallets)}\033[0m")
             print(f"\033[1m\033[36mFrom: {wallet_address}\033[0m")
@@ -104,11 +109,11 @@ async def run_transfer_with_memo():
 
             while not done and retry_count <= max_retries:
                 try:
-                    token = web3.eth.contract(address=token_address_checksum, abi=TIP20_MEMO_ABI)
-                    decimals = token.functions.decimals().call()
+                    token = get_contract(web3, token_address_checksum, TIP20_MEMO_ABI)
+                    decimals = await cached_read(web3, token.functions.decimals())
                     amount_wei = int(float(amount) * (10 ** decimals))
 
-                    balance_info = get_token_balance(web3, wallet_address, token_address_checksum)
+                    balance_info = await get_token_balance(web3, wallet_address, token_address_checksum)
                     print(f"\033[1m\033[34mBalance: {balance_info['formatted']} {token_symbol}\033[0m")
 
                     if balance_info['balance'] < amount_wei:
@@ -118,54 +123,38 @@ async def run_transfer_with_memo():
                         continue
 
                     print(f"\033[1m\033[36mSending {amount} {token_symbol} with memo...\033[0m")
-                    nonce = web3.eth.get_transaction_count(wallet_address)
-                    tx = token.functions.transferWithMemo(
+                    pending = await pipeline.submit(wallet, token.functions.transferWithMemo(
                         random_address,
                         amount_wei,
                         memo
-                    ).build_transaction({
-                        'from': wallet_address,
-                        'nonce': nonce,
-                        'gas': 150000,
-                        'gasPrice': web3.eth.gas_price,
-                        'chainId': CONFIG['CHAIN_ID']
-                    })
-
-                    try:
-                        signed_tx = wallet.sign_transaction(tx)
-                        raw_tx = signed_tx.rawTransaction
-                    except (AttributeError, TypeError):
-                        signed_tx = Account.sign_transaction(tx, private_key)
-                        raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-                    tx_hash = web3.eth.send_raw_transaction(raw_tx)
-
-                    print(f"\033[1m\033[33mTX: {short_hash(tx_hash.hex())}\033[0m")
-                    receipt = await wait_for_tx_with_retry(web3, tx_hash.hex())
+                    ), gas=150000)
+
+                    print(f"\033[1m\033[33mTX: {short_hash(pending.hash)}\033[0m")
+                    receipt = await pending.wait()
 
                     print(f"\033[1m\033[32m✓ Sent!\033[0m")
-                    print(f"\033[1m\033[34mExplorer: {CONFIG['EXPLORER_URL']}/tx/{tx_hash.hex()}\033[0m")
+                    print(f"\033[1m\033[34mExplorer: {CONFIG['EXPLORER_URL']}/tx/{pending.hash}\033[0m")
 
-                    stats = WalletStatistics()
+                    stats = get_statistics()
                     stats.record_transaction(
                         wallet_address,
                         'token_transfer_memo',
-                        tx_hash.hex(),
+                        pending.hash,
                         str(receipt['gasUsed']),
                         'success',
                         {'tokenAddress': token_address, 'symbol': token_symbol, 'to': random_address, 'amount': amount, 'memo': memo_text}
                     )
-                    stats.close()
 
                     successful += 1
                     done = True
 
                 except Exception as error:
                     err_msg = str(error)
-                    is_retryable = any(x in err_msg for x in ['502', '503', 'Bad Gateway', 'SERVER_ERROR', 'timeout'])
+                    is_retryable = is_transient_error(error)
 
                     if is_retryable and retry_count < max_retries:
                         retry_count += 1
-                        wait_time = retry_count * 10
+                        wait_time = backoff_seconds(retry_count)
                         print(f"\033[1m\033[33m⚠️ RPC error, retry in {wait_time}s... ({retry_count}/{max_retries})\033[0m")
                         await countdown(wait_time, 'Retry in')
                     else:
@@ -3,12 +3,16 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import asyncio
-from web3 import Web3
-from eth_account import Account
 from config import CONFIG, COLORS
-from utils.helpers import ask_question, async_sleep, countdown, get_random_int, short_hash, wait_for_tx_with_retry
-from utils.wallet import get_private_keys, load_created_tokens, get_token_balance
-from utils.statistics import WalletStatistics
+from utils.address import checksum
+from utils.helpers import ask_question, countdown, get_random_int, short_hash
+from utils.provider import create_web3
+from utils.pipeline import TxPipeline
+from utils.wallet import get_private_keys, load_created_tokens, get_token_balance, get_wallets
+from utils.statistics import get_statistics
+from utils.resilience import is_transient_error, backoff_seconds
+from utils.cache import cached_read, ISSUER_ROLE
+from utils.contracts import get_contract
 from config import SYSTEM_CONTRACTS, FEE_MANAGER_ABI, ERC20_ABI
 
 TIP20_MINT_ABI = [
@@ -70,14 +74,15 @@ async def run_mint_tokens():
             print('\033[1m\033[31mPrivate keys not found in pv.txt\033[0m')
             return
 
-        web3 = Web3(Web3.HTTPProvider(CONFIG['RPC_URL']))
-        wallets = [Account.from_key(pk) for pk in private_keys]
+        web3 = create_web3()
+        pipeline = TxPipeline(web3)
+        wallets = get_wallets(private_keys)
         created_tokens = load_created_tokens()
 
         # Convert addresses to checksum format to check created tokens
         wallets_with_tokens = []
         for w in wallets:
-            wallet_addr_checksum = Web3.to_checksum_address(w.address)
+            wallet_addr_checksum = checksum(w.address)
             # Try to find tokens by checksum address
             wallet_tokens = created_tokens.get(wallet_addr_checksum, [])
             if len(wallet_tokens) > 0:
@@ -99,20 +104,17 @@ async def run_mint_tokens():
         amount_input = ask_question('\033[1m\033[36mAmount to mint (default 1000): \033[0m')
         amount = amount_input or '1000'
 
-        ISSUER_ROLE = Web3.keccak(text="ISSUER_ROLE")
-
         successful = 0
         failed = 0
         skipped = 0
 
         # Check fee token balance for all wallets
-        fee_manager = web3.eth.contract(address=Web3.to_checksum_address(SYSTEM_CONTRACTS['FEE_MANAGER']), abi=FEE_MANAGER_ABI)
+        fee_manager = get_contract(web3, SYSTEM_CONTRACTS['FEE_MANAGER'], FEE_MANAGER_ABI)
 
         for w in range(len(wallets)):
             wallet = wallets[w]
-            private_key = private_keys[w]
             # Ensure the address is in checksum format
-            wallet_address = Web3.to_checksum_address(wallet.address)
+            wallet_address = checksum(wallet.address)
             wallet_tokens = created_tokens.get(wallet_address, [])
 
             print(f"\n\033[1m\033[35mWALLET #{w + 1}/{len(wallets)}\033[0m")
@@ -125,12 +127,12 @@ async def run_mint_tokens():
 
             # Check fee token balance
             try:
-                current_fee_token = fee_manager.functions.userTokens(wallet_address).call()
+                current_fee_token = await fee_manager.functions.userTokens(wallet_address).call()
                 if current_fee_token == '0x0000000000000000000000000000000000000000':
                     current_fee_token = CONFIG['TOKENS']['PathUSD']  # Default
 
-                fee_token_contract = web3.eth.contract(address=Web3.to_checksum_address(current_fee_token), abi=ERC20_ABI)
-                fee_balance = fee_token_contract.functions.balanceOf(wallet_address).call()
+                fee_token_contract = get_contract(web3, checksum(current_fee_token), ERC20_ABI)
+                fee_balance = await fee_token_contract.functions.balanceOf(wallet_address).call()
                 fee_balance_formatted = fee_balance / (10 ** 6)
 
                 # Minimum balance to pay gas (approximately 0.1 token)
@@ -155,96 +157,62 @@ async def run_mint_tokens():
 
                 while not mint_done and mint_retry <= max_mint_retries:
                     try:
-                        token_address_checksum = Web3.to_checksum_address(token_info['token'])
-                        token = web3.eth.contract(address=token_address_checksum, abi=TIP20_MINT_ABI)
+                        token_address_checksum = checksum(token_info['token'])
+                        token = get_contract(web3, token_address_checksum, TIP20_MINT_ABI)
 
                         decimals = 6
                         try:
-                            decimals = token.functions.decimals().call()
+                            decimals = await cached_read(web3, token.functions.decimals())
                         except Exception as dec_err:
-                            dec_err_msg = str(dec_err)
-                            if any(x in dec_err_msg for x in ['502', '503', 'Bad Gateway']):
+                            if is_transient_error(dec_err):
                                 raise dec_err
 
                         amount_wei = int(float(amount) * (10 ** decimals))
 
                         needs_role = False
                         try:
-                            has_issuer_role = token.functions.hasRole(ISSUER_ROLE, wallet_address).call()
+                            has_issuer_role = await token.functions.hasRole(ISSUER_ROLE, wallet_address).call()
                             needs_role = not has_issuer_role
                         except Exception as check_err:
-                            check_err_msg = str(check_err)
-                            if any(x in check_err_msg for x in ['502', '503', 'Bad Gateway']):
+                            if is_transient_error(check_err):
                                 raise check_err
                             needs_role = True
 
                         if needs_role:
                             try:
                                 print(f"\033[1m\033[33m  ⚠️ Granting ISSUER_ROLE...\033[0m")
-                                nonce = web3.eth.get_transaction_count(wallet_address)
-                                grant_tx = token.functions.grantRole(ISSUER_ROLE, wallet_address).build_transaction({
-                                    'from': wallet_address,
-                                    'nonce': nonce,
-                                    'gas': 150000,
-                                    'gasPrice': web3.eth.gas_price,
-                                    'chainId': CONFIG['CHAIN_ID']
-                                })
-                                # Sign transaction
-                                try:
-                                    signed_grant = wallet.sign_transaction(grant_tx)
-                                    raw_tx = signed_grant.rawTransaction
-                                except (AttributeError, TypeError):
-                                    signed_grant = Account.sign_transaction(grant_tx, private_key)
-                                    raw_tx = signed_grant.rawTransaction if hasattr(signed_grant, 'rawTransaction') else signed_grant.raw_transaction
-                                grant_tx_hash = web3.eth.send_raw_transaction(raw_tx)
-                                print(f"\033[1m\033[33m  Grant TX: {short_hash(grant_tx_hash.hex())}\033[0m")
-                                await wait_for_tx_with_retry(web3, grant_tx_hash.hex())
+                                grant_tx = await pipeline.submit(wallet, token.functions.grantRole(ISSUER_ROLE, wallet_address), gas=150000)
+                                print(f"\033[1m\033[33m  Grant TX: {short_hash(grant_tx.hash)}\033[0m")
+                                await grant_tx.wait()
                                 print(f"\033[1m\033[32m  ✓ ISSUER_ROLE granted\033[0m")
-                                await async_sleep(2)
                             except Exception as grant_err:
                                 print(f"\033[1m\033[33m  ⚠️ Failed to grant role: {str(grant_err)[:60]}\033[0m")
 
                         print(f"\n\033[1m\033[36mMint {amount} {token_info['symbol']}...\033[0m")
-                        bal_before = token.functions.balanceOf(wallet_address).call()
+                        bal_before = await token.functions.balanceOf(wallet_address).call()
                         print(f"\033[1m\033[34mBalance before: {bal_before / (10 ** decimals)}\033[0m")
 
-                        nonce = web3.eth.get_transaction_count(wallet_address)
-                        mint_tx = token.functions.mint(wallet_address, amount_wei).build_transaction({
-                            'from': wallet_address,
-                            'nonce': nonce,
-                            'gas': 200000,
-                            'gasPrice': web3.eth.gas_price,
-                            'chainId': CONFIG['CHAIN_ID']
-                        })
-                        # Sign transaction
-                        try:
-                            signed_mint = wallet.sign_transaction(mint_tx)
-                            raw_tx = signed_mint.rawTransaction
-                        except (AttributeError, TypeError):
-                            signed_mint = Account.sign_transaction(mint_tx, private_key)
-                            raw_tx = signed_mint.rawTransaction if hasattr(signed_mint, 'rawTransaction') else signed_mint.raw_transaction
-                        mint_tx_hash = web3.eth.send_raw_transaction(raw_tx)
+                        mint_tx = await pipeline.submit(wallet, token.functions.mint(wallet_address, amount_wei), gas=200000)
 
-                        print(f"\033[1m\033[33mTX: {short_hash(mint_tx_hash.hex())}\033[0m")
-                        receipt = await wait_for_tx_with_retry(web3, mint_tx_hash.hex())
+                        print(f"\033[1m\033[33mTX: {short_hash(mint_tx.hash)}\033[0m")
+                        receipt = await mint_tx.wait()
 
-                        bal_after = token.functions.balanceOf(wallet_address).call()
+                        bal_after = await token.functions.balanceOf(wallet_address).call()
                         print(f"\033[1m\033[34mBalance after: {bal_after / (10 ** decimals)}\033[0m")
 
                         if bal_after > bal_before:
                             print(f"\033[1m\033[32m✓ Mint successful! +{(bal_after - bal_before) / (10 ** decimals)}\033[0m")
 
                             # Record in statistics
-                            stats = WalletStatistics()
+                            stats = get_statistics()
                             stats.record_transaction(
                                 wallet_address,
                                 'token_mint',
-                                mint_tx_hash.hex(),
+                                mint_tx.hash,
                                 str(receipt['gasUsed']),
                                 'success',
                                 {'tokenAddress': token_info['token'], 'symbol': token_info['symbol'], 'amount': amount}
                             )
-                            stats.close()
 
                             successful += 1
                         else:
@@ -255,11 +223,11 @@ async def run_mint_tokens():
 
                     except Exception as error:
                         err_msg = str(error)
-                        is_retryable = any(x in err_msg for x in ['502', '503', 'Bad Gateway', 'SERVER_ERROR', 'timeout'])
+                        is_retryable = is_transient_error(error)
 
                         if is_retryable and mint_retry < max_mint_retries:
                             mint_retry += 1
-                            wait_time = mint_retry * 10
+                            wait_time = backoff_seconds(mint_retry)
                             print(f"\033[1m\033[33m⚠️ RPC error, retrying in {wait_time}s... ({mint_retry}/{max_mint_retries})\033[0m")
                             await countdown(wait_time, 'Retry in')
                         else:
@@ -267,8 +235,6 @@ async def run_mint_tokens():
                             failed += 1
                             mint_done = True
 
-                await async_sleep(2)
-
             if w < len(wallets) - 1:
                 await countdown(get_random_int(5, 10), 'Next wallet in')
 
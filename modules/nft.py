@@ -5,24 +5,28 @@
 import asyncio
 import random
 import string
-from web3 import Web3
-from eth_account import Account
-from solcx import compile_source, set_solc_version
 from config import CONFIG, COLORS
-from utils.helpers import async_sleep, short_hash, wait_for_tx_with_retry, countdown, get_random_int
-from utils.wallet import get_private_keys, get_token_balance
-from utils.statistics import WalletStatistics
+from utils.address import checksum
+from utils.compiler import compile_solidity_async
+from utils.contracts import get_contract
+from utils.helpers import async_sleep, short_hash, countdown, get_random_int
+from utils.provider import create_web3
+from utils.pipeline import TxPipeline
+from utils.wallet import get_private_keys, get_token_balance, get_wallets
+from utils.statistics import get_statistics
+from utils.resilience import is_transient_error, backoff_seconds
 from config import SYSTEM_CONTRACTS, FEE_MANAGER_ABI, ERC20_ABI
 
-def get_nft_contract_source(name, symbol):
-    """Get NFT contract source code"""
-    clean_symbol = ''.join(c for c in symbol if c.isalnum())
-    return f"""// SPDX-License-Identifier: MIT
+NFT_CONTRACT_NAME = 'TempoNFT'
+
+def get_nft_contract_source():
+    """Get NFT contract source code (name and symbol are constructor args)"""
+    return """// SPDX-License-Identifier: MIT
 pragma solidity ^0.8.20;
 
-contract {clean_symbol}NFT {{
-    string public name = "{name}";
-    string public symbol = "{symbol}";
+contract TempoNFT {
+    string public name;
+    string public symbol;
 
     uint256 private _tokenIdCounter;
     mapping(uint256 => address) private _owners;
@@ -31,52 +35,44 @@ contract {clean_symbol}NFT {{
 
     event Transfer(address indexed from, address indexed to, uint256 indexed tokenId);
 
-    function totalSupply() public view returns (uint256) {{ return _tokenIdCounter; }}
-    function balanceOf(address owner) public view returns (uint256) {{ return _balances[owner]; }}
-    function ownerOf(uint256 tokenId) public view returns (address) {{ return _owners[tokenId]; }}
+    constructor(string memory name_, string memory symbol_) {
+        name = name_;
+        symbol = symbol_;
+    }
+
+    function totalSupply() public view returns (uint256) { return _tokenIdCounter; }
+    function balanceOf(address owner) public view returns (uint256) { return _balances[owner]; }
+    function ownerOf(uint256 tokenId) public view returns (address) { return _owners[tokenId]; }
 
-    function mint(address to, string memory color) public returns (uint256) {{
+    function mint(address to, string memory color) public returns (uint256) {
         uint256 tokenId = _tokenIdCounter++;
         _owners[tokenId] = to;
         _balances[to]++;
         _tokenColors[tokenId] = color;
         emit Transfer(address(0), to, tokenId);
         return tokenId;
-    }}
+    }
 
-    function tokenURI(uint256 tokenId) public view returns (string memory) {{
+    function tokenURI(uint256 tokenId) public view returns (string memory) {
         require(_owners[tokenId] != address(0), "Token does not exist");
-        return string(abi.encodePacked("data:application/json,{{name:", _toString(tokenId), "}}"));
-    }}
+        return string(abi.encodePacked("data:application/json,{name:", _toString(tokenId), "}"));
+    }
 
-    function _toString(uint256 value) internal pure returns (string memory) {{
+    function _toString(uint256 value) internal pure returns (string memory) {
         if (value == 0) return "0";
         uint256 temp = value;
         uint256 digits;
-        while (temp != 0) {{ digits++; temp /= 10; }}
+        while (temp != 0) { digits++; temp /= 10; }
         bytes memory buffer = new bytes(digits);
-        while (value != 0) {{ digits--; buffer[digits] = bytes1(uint8(48 + value % 10)); value /= 10; }}
+        while (value != 0) { digits--; buffer[digits] = bytes1(uint8(48 + value % 10)); value /= 10; }
         return string(buffer);
-    }}
-}}"""
-
-def compile_nft_contract(name, symbol):
-    """Compile NFT contract"""
-    source = get_nft_contract_source(name, symbol)
-    clean_symbol = ''.join(c for c in symbol if c.isalnum())
-    contract_name = f"{clean_symbol}NFT"
+    }
+}"""
 
+async def compile_nft_contract():
+    """Compile NFT contract (one cached artifact serves every collection)"""
     try:
-        set_solc_version('0.8.20')
-        compiled_sol = compile_source(
-            source,
-            solc_version='0.8.20',
-            optimize=True,
-            optimize_runs=200
-        )
-
-        contract_interface = compiled_sol[f'<stdin>:{contract_name}']
-        return {'abi': contract_interface['abi'], 'bytecode': '0x' + contract_interface['bin']}
+        return await compile_solidity_async(get_nft_contract_source(), NFT_CONTRACT_NAME)
     except Exception as e:
         raise Exception(f'NFT compilation failed: {e}')
 
@@ -96,13 +92,14 @@ async def run_nft():
         print('❌ Private keys not found in pv.txt')
         return
 
-    web3 = Web3(Web3.HTTPProvider(CONFIG['RPC_URL']))
-    wallets = [Account.from_key(pk) for pk in private_keys]
+    web3 = create_web3()
+    pipeline = TxPipeline(web3)
+    wallets = get_wallets(private_keys)
 
     print(f"\033[1m\033[36mFound {len(wallets)} wallet(s)\033[0m\n")
 
     # Check fee token balance for all wallets
-    fee_manager = web3.eth.contract(address=Web3.to_checksum_address(SYSTEM_CONTRACTS['FEE_MANAGER']), abi=FEE_MANAGER_ABI)
+    fee_manager = get_contract(web3, SYSTEM_CONTRACTS['FEE_MANAGER'], FEE_MANAGER_ABI)
 
     successful = 0
     failed = 0
@@ -110,20 +107,19 @@ async def run_nft():
 
     for w in range(len(wallets)):
         wallet = wallets[w]
-        private_key = private_keys[w]
-        wallet_address = Web3.to_checksum_address(wallet.address)
+        wallet_address = checksum(wallet.address)
 
         print(f"\n\033[1m\033[35mWALLET #{w + 1}/{len(wallets)}\033[0m")
         print(f"\033[1m\033[36mAddress: {wallet_address}\033[0m")
 
         # Check fee token balance
         try:
-            current_fee_token = fee_manager.functions.userTokens(wallet_address).call()
+            current_fee_token = await fee_manager.functions.userTokens(wallet_address).call()
             if current_fee_token == '0x0000000000000000000000000000000000000000':
                 current_fee_token = CONFIG['TOKENS']['PathUSD']  # Default
 
-            fee_token_contract = web3.eth.contract(address=Web3.to_checksum_address(current_fee_token), abi=ERC20_ABI)
-            fee_balance = fee_token_contract.functions.balanceOf(wallet_address).call()
+            fee_token_contract = get_contract(web3, checksum(current_fee_token), ERC20_ABI)
+            fee_balance = await fee_token_contract.functions.balanceOf(wallet_address).call()
             fee_balance_formatted = fee_balance / (10 ** 6)
 
             # Minimum balance to pay gas (about 0.5 token for deploy + mint)
@@ -148,7 +144,7 @@ async def run_nft():
         try:
             # Compilation
             print('\033[1m\033[36m📝 Compiling NFT contract...\033[0m')
-            compiled = compile_nft_contract(nft_name, nft_symbol)
+            compiled = await compile_nft_contract()
             abi = compiled['abi']
             bytecode = compiled['bytecode']
             print('\033[1m\033[32m✓ Compiled\033[0m')
@@ -157,28 +153,12 @@ async def run_nft():
             print('\033[1m\033[36m🚀 Deploying NFT contract...\033[0m')
             contract = web3.eth.contract(abi=abi, bytecode=bytecode)
 
-            nonce = web3.eth.get_transaction_count(wallet_address)
-            transaction = contract.constructor().build_transaction({
-                'from': wallet_address,
-                'nonce': nonce,
-                'gas': 2000000,
-                'gasPrice': web3.eth.gas_price,
-                'chainId': CONFIG['CHAIN_ID']
-            })
-
-            # Sign transaction
-            try:
-                signed_txn = wallet.sign_transaction(transaction)
-                raw_tx = signed_txn.rawTransaction
-            except (AttributeError, TypeError):
-                signed_txn = Account.sign_transaction(transaction, private_key)
-                raw_tx = signed_txn.rawTransaction if hasattr(signed_txn, 'rawTransaction') else signed_txn.raw_transaction
-            tx_hash = web3.eth.send_raw_transaction(raw_tx)
-
-            print(f"\033[1m\033[33mTX: {short_hash(tx_hash.hex())}\033[0m")
-            receipt = await wait_for_tx_with_retry(web3, tx_hash.hex())
-
-            contract_address = Web3.to_checksum_address(receipt['contractAddress'])
+            pending = await pipeline.submit(wallet, contract.constructor(nft_name, nft_symbol), gas=2000000)
+
+            print(f"\033[1m\033[33mTX: {short_hash(pending.hash)}\033[0m")
+            receipt = await pending.wait()
+
+            contract_address = checksum(receipt['contractAddress'])
             print(f"\033[1m\033[32m✓ Contract deployed: {contract_address}\033[0m")
 
             # Mint NFT
@@ -193,58 +173,38 @@ async def run_nft():
                         break
                     try:
                         color = get_random_color()
-                        contract_instance = web3.eth.contract(address=contract_address, abi=abi)
-
-                        nonce = web3.eth.get_transaction_count(wallet_address)
-                        mint_tx = contract_instance.functions.mint(wallet_address, color).build_transaction({
-                            'from': wallet_address,
-                            'nonce': nonce,
-                            'gas': 150000,
-                            'gasPrice': web3.eth.gas_price,
-                            'chainId': CONFIG['CHAIN_ID']
-                        })
-
-                        # Sign transaction
-                        try:
-                            signed_mint = wallet.sign_transaction(mint_tx)
-                            raw_tx = signed_mint.rawTransaction
-                        except (AttributeError, TypeError):
-                            signed_mint = Account.sign_transaction(mint_tx, private_key)
-                            raw_tx = signed_mint.rawTransaction if hasattr(signed_mint, 'rawTransaction') else signed_mint.raw_transaction
-                        mint_tx_hash = web3.eth.send_raw_transaction(raw_tx)
-
-                        print(f"\033[1m\033[33m  TX: {short_hash(mint_tx_hash.hex())}\033[0m")
-                        receipt = await wait_for_tx_with_retry(web3, mint_tx_hash.hex())
+                        contract_instance = get_contract(web3, contract_address, abi)
+
+                        mint_tx = await pipeline.submit(wallet, contract_instance.functions.mint(wallet_address, color), gas=150000)
+
+                        print(f"\033[1m\033[33m  TX: {short_hash(mint_tx.hash)}\033[0m")
+                        receipt = await mint_tx.wait()
                         print(f"\033[1m\033[32m  ✓ NFT #{i + 1} ({color})\033[0m")
 
-                        stats = WalletStatistics()
+                        stats = get_statistics()
                         stats.record_transaction(
                             wallet_address,
                             'nft_mint',
-                            mint_tx_hash.hex(),
+                            mint_tx.hash,
                             str(receipt['gasUsed']),
                             'success',
                             {'nftAddress': contract_address, 'tokenId': i, 'color': color}
                         )
-                        stats.close()
 
                         minted_successfully += 1
                         minted = True
                     except Exception as e:
                         err_msg = str(e)
-                        if ('502' in err_msg or '503' in err_msg) and retry < 2:
+                        if is_transient_error(e) and retry < 2:
                             print(f"\033[1m\033[33m  ⚠️ RPC error, retry {retry + 1}/3...\033[0m")
-                            await async_sleep(10)
+                            await async_sleep(backoff_seconds(retry + 1))
                         else:
                             print(f"\033[1m\033[31m  ✗ Mint error: {err_msg[:50]}\033[0m")
                             break
 
-                if i < mint_count - 1:
-                    await async_sleep(3)
-
             # Проверяем баланс
-            contract_instance = web3.eth.contract(address=contract_address, abi=abi)
-            balance = contract_instance.functions.balanceOf(wallet_address).call()
+            contract_instance = get_contract(web3, contract_address, abi)
+            balance = await contract_instance.functions.balanceOf(wallet_address).call()
             print(f"\033[1m\033[32m✅ NFT balance: {balance}\033[0m")
             print(f"\033[1m\033[36m🔗 Contract: {contract_address}\033[0m")
             print(f"\033[1m\033[36m📊 Total NFTs: {balance}\033[0m")
@@ -3,12 +3,16 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import asyncio
-from web3 import Web3
-from eth_account import Account
 from config import CONFIG, SYSTEM_CONTRACTS, FEE_MANAGER_ABI, COLORS
-from utils.helpers import ask_question, async_sleep, countdown, get_random_int, short_hash, wait_for_tx_with_retry
-from utils.wallet import get_private_keys
-from utils.statistics import WalletStatistics
+from utils.address import checksum
+from utils.helpers import ask_question, async_sleep, countdown, get_random_int, short_hash
+from utils.provider import create_web3
+from utils.pipeline import TxPipeline
+from utils.wallet import get_private_keys, get_wallets
+from utils.statistics import get_statistics
+from utils.resilience import is_transient_error, backoff_seconds
+from utils.cache import cached_read
+from utils.contracts import get_contract
 
 async def run_remove_liquidity():
     """Main entry for remove-liquidity module"""
@@ -21,8 +25,9 @@ async def run_remove_liquidity():
             print('\033[1m\033[31mPrivate keys not found in pv.txt\033[0m')
             return
 
-        web3 = Web3(Web3.HTTPProvider(CONFIG['RPC_URL']))
-        wallets = [Account.from_key(pk) for pk in private_keys]
+        web3 = create_web3()
+        pipeline = TxPipeline(web3)
+        wallets = get_wallets(private_keys)
 
         token_list = list(CONFIG['TOKENS'].items())
 
@@ -64,7 +69,7 @@ async def run_remove_liquidity():
         print(f"  Pool: {user_token_symbol}/{val_token_symbol}")
         print(f"  LP amount: {amount}\n")
 
-        fee_manager = web3.eth.contract(address=Web3.to_checksum_address(SYSTEM_CONTRACTS['FEE_MANAGER']), abi=FEE_MANAGER_ABI)
+        fee_manager = get_contract(web3, SYSTEM_CONTRACTS['FEE_MANAGER'], FEE_MANAGER_ABI)
 
         successful = 0
         failed = 0
@@ -72,10 +77,9 @@ async def run_remove_liquidity():
 
         for w in range(len(wallets)):
             wallet = wallets[w]
-            private_key = private_keys[w]
-            wallet_address = Web3.to_checksum_address(wallet.address)
-            user_token_address_checksum = Web3.to_checksum_address(user_token_address)
-            val_token_address_checksum = Web3.to_checksum_address(val_token_address)
+            wallet_address = checksum(wallet.address)
+            user_token_address_checksum = checksum(user_token_address)
+            val_token_address_checksum = checksum(val_token_address)
 
             print(f"\n\033[1m\033[35mWALLET #{w + 1}/{len(wallets)}\033[0m")
             print(f"\033[1m\033[36mAddress: {wallet_address}\033[0m")
@@ -86,11 +90,11 @@ async def run_remove_liquidity():
 
             while not done and retry_count <= max_retries:
                 try:
-                    pool_id = fee_manager.functions.getPoolId(
+                    pool_id = await cached_read(web3, fee_manager.functions.getPoolId(
                         user_token_address_checksum,
                         val_token_address_checksum
-                    ).call()
-                    lp_balance = fee_manager.functions.liquidityBalances(pool_id, wallet_address).call()
+                    ))
+                    lp_balance = await fee_manager.functions.liquidityBalances(pool_id, wallet_address).call()
                     print(f"\033[1m\033[34mLP balance: {lp_balance / (10 ** 6)}\033[0m")
 
                     withdraw_amount = int(float(amount) * (10 ** 6))
@@ -108,48 +112,32 @@ async def run_remove_liquidity():
                         continue
 
                     print(f"\033[1m\033[36mWithdrawing {amount} LP...\033[0m")
-                    nonce = web3.eth.get_transaction_count(wallet_address)
-                    tx = fee_manager.functions.burn(
+                    pending = await pipeline.submit(wallet, fee_manager.functions.burn(
                         user_token_address_checksum,
                         val_token_address_checksum,
                         withdraw_amount,
                         wallet_address
-                    ).build_transaction({
-                        'from': wallet_address,
-                        'nonce': nonce,
-                        'gas': 500000,
-                        'gasPrice': web3.eth.gas_price,
-                        'chainId': CONFIG['CHAIN_ID']
-                    })
-
-                    try:
-                        signed_tx = wallet.sign_transaction(tx)
-                        raw_tx = signed_tx.rawTransaction
-                    except (AttributeError, TypeError):
-                        signed_tx = Account.sign_transaction(tx, private_key)
-                        raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-                    tx_hash = web3.eth.send_raw_transaction(raw_tx)
-
-                    print(f"\033[1m\033[33mTX: {short_hash(tx_hash.hex())}\033[0m")
-                    receipt = await wait_for_tx_with_retry(web3, tx_hash.hex())
-
-                    lp_after = fee_manager.functions.liquidityBalances(pool_id, wallet_address).call()
+                    ), gas=500000)
+
+                    print(f"\033[1m\033[33mTX: {short_hash(pending.hash)}\033[0m")
+                    receipt = await pending.wait()
+
+                    lp_after = await fee_manager.functions.liquidityBalances(pool_id, wallet_address).call()
                     print(f"\033[1m\033[34mLP balance after: {lp_after / (10 ** 6)}\033[0m")
 
                     if lp_after < lp_balance:
                         print(f"\033[1m\033[32m✓ Liquidity withdrawn!\033[0m")
-                        print(f"\033[1m\033[34mExplorer: {CONFIG['EXPLORER_URL']}/tx/{tx_hash.hex()}\033[0m")
+                        print(f"\033[1m\033[34mExplorer: {CONFIG['EXPLORER_URL']}/tx/{pending.hash}\033[0m")
 
-                        stats = WalletStatistics()
+                        stats = get_statistics()
                         stats.record_transaction(
                             wallet_address,
                             'liquidity_remove',
-                            tx_hash.hex(),
+                            pending.hash,
                             str(receipt['gasUsed']),
                             'success',
                             {'userToken': user_token_symbol, 'validatorToken': val_token_symbol, 'amount': amount}
                         )
-                        stats.close()
 
                         successful += 1
                     else:
@@ -160,11 +148,11 @@ async def run_remove_liquidity():
 
                 except Exception as error:
                     err_msg = str(error)
-                    is_retryable = any(x in err_msg for x in ['502', '503', 'Bad Gateway', 'SERVER_ERROR', 'timeout'])
+                    is_retryable = is_transient_error(error)
 
                     if is_retryable and retry_count < max_retries:
                         retry_count += 1
-                        wait_time = retry_count * 10
+                        wait_time = backoff_seconds(retry_count)
                         print(f"\033[1m\033[33m⚠️ RPC error, retry in {wait_time}s... ({retry_count}/{max_retries})\033[0m")
                         await countdown(wait_time, 'Retry in')
                     else:
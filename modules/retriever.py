@@ -3,11 +3,15 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import asyncio
-from web3 import Web3
-from eth_account import Account
 from config import CONFIG, RETRIEVER_NFT_CONTRACT, COLORS, SYSTEM_CONTRACTS, FEE_MANAGER_ABI, ERC20_ABI
-from utils.helpers import async_sleep, short_hash, wait_for_tx_with_retry, countdown, get_random_int
-from utils.wallet import get_private_keys
+from utils.address import checksum
+from utils.helpers import async_sleep, short_hash, countdown, get_random_int
+from utils.provider import create_web3
+from utils.pipeline import TxPipeline
+from utils.wallet import get_private_keys, get_wallets
+from utils.resilience import is_transient_error, backoff_seconds
+from utils.cache import cached_read
+from utils.contracts import get_contract
 
 RETRIEVER_NFT_ABI = [
     {
@@ -61,16 +65,17 @@ async def run_retriever_nft():
         print('❌ Private keys not found in pv.txt')
         return
 
-    web3 = Web3(Web3.HTTPProvider(CONFIG['RPC_URL']))
-    wallets = [Account.from_key(pk) for pk in private_keys]
+    web3 = create_web3()
+    pipeline = TxPipeline(web3)
+    wallets = get_wallets(private_keys)
 
     print(f"\033[1m\033[36mFound {len(wallets)} wallet(s)\033[0m\n")
 
     # Ensure all addresses are in checksum format
-    retriever_contract_checksum = Web3.to_checksum_address(RETRIEVER_NFT_CONTRACT)
+    retriever_contract_checksum = RETRIEVER_NFT_CONTRACT
 
     # Check fee token balance for all wallets
-    fee_manager = web3.eth.contract(address=Web3.to_checksum_address(SYSTEM_CONTRACTS['FEE_MANAGER']), abi=FEE_MANAGER_ABI)
+    fee_manager = get_contract(web3, SYSTEM_CONTRACTS['FEE_MANAGER'], FEE_MANAGER_ABI)
 
     successful = 0
     failed = 0
@@ -78,8 +83,7 @@ async def run_retriever_nft():
 
     for w in range(len(wallets)):
         wallet = wallets[w]
-        private_key = private_keys[w]
-        wallet_address = Web3.to_checksum_address(wallet.address)
+        wallet_address = checksum(wallet.address)
 
         print(f"\n\033[1m\033[35mWALLET #{w + 1}/{len(wallets)}\033[0m")
         print(f"\033[1m\033[36mAddress: {wallet_address}\033[0m")
@@ -87,12 +91,12 @@ async def run_retriever_nft():
 
         # Check fee token balance
         try:
-            current_fee_token = fee_manager.functions.userTokens(wallet_address).call()
+            current_fee_token = await fee_manager.functions.userTokens(wallet_address).call()
             if current_fee_token == '0x0000000000000000000000000000000000000000':
                 current_fee_token = CONFIG['TOKENS']['PathUSD']  # Default
 
-            fee_token_contract = web3.eth.contract(address=Web3.to_checksum_address(current_fee_token), abi=ERC20_ABI)
-            fee_balance = fee_token_contract.functions.balanceOf(wallet_address).call()
+            fee_token_contract = get_contract(web3, checksum(current_fee_token), ERC20_ABI)
+            fee_balance = await fee_token_contract.functions.balanceOf(wallet_address).call()
             fee_balance_formatted = fee_balance / (10 ** 6)
 
             # Minimum balance to pay gas (about 0.2 token for NFT mint)
@@ -108,19 +112,19 @@ async def run_retriever_nft():
             # Continue execution, but user will be warned
 
         try:
-            nft_contract = web3.eth.contract(address=retriever_contract_checksum, abi=RETRIEVER_NFT_ABI)
+            nft_contract = get_contract(web3, retriever_contract_checksum, RETRIEVER_NFT_ABI)
 
             # Check current balance
             balance_before = 0
             try:
-                balance_before = nft_contract.functions.balanceOf(wallet_address).call()
+                balance_before = await nft_contract.functions.balanceOf(wallet_address).call()
                 print(f"\033[1m\033[36m💰 NFT balance before: {balance_before}\033[0m")
             except Exception:
                 print('\033[1m\033[33m⚠️ Failed to get balance\033[0m')
 
             # Check collection name
             try:
-                name = nft_contract.functions.name().call()
+                name = await cached_read(web3, nft_contract.functions.name())
                 print(f"\033[1m\033[32m🎨 Collection: {name}\033[0m")
             except Exception:
                 pass
@@ -139,37 +143,21 @@ async def run_retriever_nft():
                 if minted:
                     break
                 try:
-                    nonce = web3.eth.get_transaction_count(wallet_address)
-                    tx = nft_contract.functions.claim(
+                    pending = await pipeline.submit(wallet, nft_contract.functions.claim(
                         wallet_address,
                         1,
                         '0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE',
                         0,
                         allowlist_proof,
                         b''
-                    ).build_transaction({
-                        'from': wallet_address,
-                        'nonce': nonce,
-                        'gas': 300000,
-                        'gasPrice': web3.eth.gas_price,
-                        'chainId': CONFIG['CHAIN_ID']
-                    })
-
-                    # Подписываем транзакцию
-                    try:
-                        signed_tx = wallet.sign_transaction(tx)
-                        raw_tx = signed_tx.rawTransaction
-                    except (AttributeError, TypeError):
-                        signed_tx = Account.sign_transaction(tx, private_key)
-                        raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-                    tx_hash = web3.eth.send_raw_transaction(raw_tx)
-
-                    print(f"\033[1m\033[33mTX: {short_hash(tx_hash.hex())}\033[0m")
-                    receipt = await wait_for_tx_with_retry(web3, tx_hash.hex())
+                    ), gas=300000)
+
+                    print(f"\033[1m\033[33mTX: {short_hash(pending.hash)}\033[0m")
+                    receipt = await pending.wait()
 
                     if receipt['status'] == 1:
                         # Check balance after
-                        balance_after = nft_contract.functions.balanceOf(wallet_address).call()
+                        balance_after = await nft_contract.functions.balanceOf(wallet_address).call()
                         print(f"\033[1m\033[32m✅ Mint successful!\033[0m")
                         print(f"\033[1m\033[36m💰 NFT balance after: {balance_after}\033[0m")
                         print(f"\033[1m\033[36m📈 Received: +{balance_after - balance_before} NFT\033[0m")
@@ -184,9 +172,9 @@ async def run_retriever_nft():
                         minted = True
                 except Exception as e:
                     err_msg = str(e)
-                    if ('502' in err_msg or '503' in err_msg) and retry < 2:
+                    if is_transient_error(e) and retry < 2:
                         print(f"\033[1m\033[33m⚠️ RPC error, retry {retry + 1}/3...\033[0m")
-                        await async_sleep(10)
+                        await async_sleep(backoff_seconds(retry + 1))
                     else:
                         if 'execution reverted' in err_msg or 'CALL_EXCEPTION' in err_msg:
                             print('\033[1m\033[33m⚠️ Contract unavailable or limit exhausted\033[0m')
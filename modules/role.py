@@ -3,12 +3,16 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import asyncio
-from web3 import Web3
-from eth_account import Account
 from config import CONFIG, COLORS
-from utils.helpers import ask_question, async_sleep, countdown, get_random_int, short_hash, wait_for_tx_with_retry
-from utils.wallet import get_private_keys, load_created_tokens, get_token_balance
-from utils.statistics import WalletStatistics
+from utils.address import checksum
+from utils.helpers import ask_question, countdown, get_random_int, short_hash
+from utils.provider import create_web3
+from utils.pipeline import TxPipeline
+from utils.wallet import get_private_keys, load_created_tokens, get_token_balance, get_wallets
+from utils.statistics import get_statistics
+from utils.resilience import is_transient_error, backoff_seconds
+from utils.cache import ISSUER_ROLE, PAUSE_ROLE
+from utils.contracts import get_contract
 from config import SYSTEM_CONTRACTS, FEE_MANAGER_ABI, ERC20_ABI
 
 ROLE_ABI = [
@@ -45,14 +49,15 @@ async def run_grant_role():
             print('\033[1m\033[31mPrivate keys not found in pv.txt\033[0m')
             return
 
-        web3 = Web3(Web3.HTTPProvider(CONFIG['RPC_URL']))
-        wallets = [Account.from_key(pk) for pk in private_keys]
+        web3 = create_web3()
+        pipeline = TxPipeline(web3)
+        wallets = get_wallets(private_keys)
         created_tokens = load_created_tokens()
 
         # Convert addresses to checksum format to check created tokens
         wallets_with_tokens = []
         for w in wallets:
-            wallet_addr_checksum = Web3.to_checksum_address(w.address)
+            wallet_addr_checksum = checksum(w.address)
             # Try to find tokens by checksum address
             wallet_tokens = created_tokens.get(wallet_addr_checksum, [])
             if len(wallet_tokens) > 0:
@@ -78,7 +83,7 @@ async def run_grant_role():
 
         role_choice = ask_question('\033[1m\033[36mChoose (1-2, default 1): \033[0m')
         role_name = 'PAUSE_ROLE' if role_choice == '2' else 'ISSUER_ROLE'
-        role_hash = Web3.keccak(text=role_name)
+        role_hash = PAUSE_ROLE if role_choice == '2' else ISSUER_ROLE
 
         print(f"\n\033[1m\033[32mGranting role: {role_name}\033[0m\n")
 
@@ -87,13 +92,12 @@ async def run_grant_role():
         skipped = 0
 
         # Check fee token balance for all wallets
-        fee_manager = web3.eth.contract(address=Web3.to_checksum_address(SYSTEM_CONTRACTS['FEE_MANAGER']), abi=FEE_MANAGER_ABI)
+        fee_manager = get_contract(web3, SYSTEM_CONTRACTS['FEE_MANAGER'], FEE_MANAGER_ABI)
 
         for w in range(len(wallets)):
             wallet = wallets[w]
-            private_key = private_keys[w]
             # Ensure the address is in checksum format
-            wallet_address = Web3.to_checksum_address(wallet.address)
+            wallet_address = checksum(wallet.address)
             wallet_tokens = created_tokens.get(wallet_address, [])
 
             print(f"\n\033[1m\033[35mWALLET #{w + 1}/{len(wallets)}\033[0m")
@@ -106,12 +110,12 @@ async def run_grant_role():
 
             # Check fee token balance
             try:
-                current_fee_token = fee_manager.functions.userTokens(wallet_address).call()
+                current_fee_token = await fee_manager.functions.userTokens(wallet_address).call()
                 if current_fee_token == '0x0000000000000000000000000000000000000000':
                     current_fee_token = CONFIG['TOKENS']['PathUSD']  # Default
 
-                fee_token_contract = web3.eth.contract(address=Web3.to_checksum_address(current_fee_token), abi=ERC20_ABI)
-                fee_balance = fee_token_contract.functions.balanceOf(wallet_address).call()
+                fee_token_contract = get_contract(web3, checksum(current_fee_token), ERC20_ABI)
+                fee_balance = await fee_token_contract.functions.balanceOf(wallet_address).call()
                 fee_balance_formatted = fee_balance / (10 ** 6)
 
                 # Minimum balance to pay gas (about 0.1 token)
@@ -132,12 +136,12 @@ async def run_grant_role():
 
                 while not role_done and role_retry <= max_role_retries:
                     try:
-                        token_address_checksum = Web3.to_checksum_address(token_info['token'])
-                        token = web3.eth.contract(address=token_address_checksum, abi=ROLE_ABI)
+                        token_address_checksum = checksum(token_info['token'])
+                        token = get_contract(web3, token_address_checksum, ROLE_ABI)
 
                         print(f"\n\033[1m\033[36mToken: {token_info['symbol']}\033[0m")
 
-                        has_role = token.functions.hasRole(role_hash, wallet_address).call()
+                        has_role = await token.functions.hasRole(role_hash, wallet_address).call()
 
                         if has_role:
                             print(f"\033[1m\033[32m✓ {role_name} already granted\033[0m")
@@ -146,41 +150,24 @@ async def run_grant_role():
                             continue
 
                         print(f"\033[1m\033[36mGranting {role_name}...\033[0m")
-                        nonce = web3.eth.get_transaction_count(wallet_address)
-                        tx = token.functions.grantRole(role_hash, wallet_address).build_transaction({
-                            'from': wallet_address,
-                            'nonce': nonce,
-                            'gas': 150000,
-                            'gasPrice': web3.eth.gas_price,
-                            'chainId': CONFIG['CHAIN_ID']
-                        })
-
-                        # Sign transaction
-                        try:
-                            signed_tx = wallet.sign_transaction(tx)
-                            raw_tx = signed_tx.rawTransaction
-                        except (AttributeError, TypeError):
-                            signed_tx = Account.sign_transaction(tx, private_key)
-                            raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-                        tx_hash = web3.eth.send_raw_transaction(raw_tx)
-
-                        print(f"\033[1m\033[33mTX: {short_hash(tx_hash.hex())}\033[0m")
-                        receipt = await wait_for_tx_with_retry(web3, tx_hash.hex())
-
-                        has_role_after = token.functions.hasRole(role_hash, wallet_address).call()
+                        pending = await pipeline.submit(wallet, token.functions.grantRole(role_hash, wallet_address), gas=150000)
+
+                        print(f"\033[1m\033[33mTX: {short_hash(pending.hash)}\033[0m")
+                        receipt = await pending.wait()
+
+                        has_role_after = await token.functions.hasRole(role_hash, wallet_address).call()
                         if has_role_after:
                             print(f"\033[1m\033[32m✓ {role_name} granted!\033[0m")
 
-                            stats = WalletStatistics()
+                            stats = get_statistics()
                             stats.record_transaction(
                                 wallet_address,
                                 'role_grant',
-                                tx_hash.hex(),
+                                pending.hash,
                                 str(receipt['gasUsed']),
                                 'success',
                                 {'tokenAddress': token_info['token'], 'symbol': token_info['symbol'], 'role': role_name, 'account': wallet_address}
                             )
-                            stats.close()
 
                             successful += 1
                         else:
@@ -191,11 +178,11 @@ async def run_grant_role():
 
                     except Exception as error:
                         err_msg = str(error)
-                        is_retryable = any(x in err_msg for x in ['502', '503', 'Bad Gateway', 'SERVER_ERROR', 'timeout'])
+                        is_retryable = is_transient_error(error)
 
                         if is_retryable and role_retry < max_role_retries:
                             role_retry += 1
-                            wait_time = role_retry * 10
+                            wait_time = backoff_seconds(role_retry)
                             print(f"\033[1m\033[33m⚠️ RPC error, retrying in {wait_time}s... ({role_retry}/{max_role_retries})\033[0m")
                             await countdown(wait_time, 'Retry in')
                         else:
@@ -203,8 +190,6 @@ async def run_grant_role():
                             failed += 1
                             role_done = True
 
-                await async_sleep(2)
-
             if w < len(wallets) - 1:
                 await countdown(get_random_int(3, 6), 'Next wallet in')
 
@@ -7,19 +7,26 @@ import random
 from web3 import Web3
 from eth_account import Account
 from config import CONFIG, ERC20_ABI, COLORS
-from utils.helpers import ask_question, async_sleep, countdown, get_random_int, short_hash, wait_for_tx_with_retry
-from utils.wallet import get_private_keys, get_token_balance
-from utils.statistics import WalletStatistics
-
-async def send_token(web3, wallet, private_key, token_address, token_symbol, to_address, amount, retry_count=0):
+from utils.address import checksum
+from utils.helpers import ask_question, async_sleep, countdown, get_random_int, short_hash
+from utils.provider import create_web3
+from utils.pipeline import TxPipeline
+from utils.wallet import get_private_keys, get_token_balance, get_wallets
+from utils.statistics import get_statistics
+from utils.resilience import classify_error, FATAL, backoff_seconds
+from utils.cache import cached_read
+from utils.contracts import get_contract
+
+async def send_token(web3, wallet, token_address, token_symbol, to_address, amount, retry_count=0):
     """Send tokens"""
+    pipeline = TxPipeline(web3)
     max_retries = 3
     try:
-        contract = web3.eth.contract(address=Web3.to_checksum_address(token_address), abi=ERC20_ABI)
-        decimals = contract.functions.decimals().call()
+        contract = get_contract(web3, checksum(token_address), ERC20_ABI)
+        decimals = await cached_read(web3, contract.functions.decimals())
         amount_wei = int(amount * (10 ** decimals))
 
-        balance_info = get_token_balance(web3, wallet.address, token_address)
+        balance_info = await get_token_balance(web3, wallet.address, token_address)
 
         if balance_info['balance'] < amount_wei:
             print(f"\033[1m\033[31mInsufficient {token_symbol} balance. Have: {balance_info['formatted']}, Need: {amount}\033[0m")
@@ -28,63 +35,39 @@ async def send_token(web3, wallet, private_key, token_address, token_symbol, to_
         print(f"\033[1m\033[36mSending {amount} {token_symbol} to {to_address[:10]}...\033[0m")
         print(f"\033[1m\033[34mBalance: {balance_info['formatted']} {token_symbol}\033[0m")
 
-        nonce = web3.eth.get_transaction_count(wallet.address)
-        transaction = contract.functions.transfer(
-            Web3.to_checksum_address(to_address),
+        pending = await pipeline.submit(wallet, contract.functions.transfer(
+            checksum(to_address),
             amount_wei
-        ).build_transaction({
-            'from': wallet.address,
-            'nonce': nonce,
-            'gas': 100000,
-            'gasPrice': web3.eth.gas_price,
-            'chainId': CONFIG['CHAIN_ID']
-        })
-
-        # Sign transaction using wallet.sign_transaction; fallback to Account.sign_transaction
-        try:
-            signed_txn = wallet.sign_transaction(transaction)
-            raw_tx = signed_txn.rawTransaction
-        except (AttributeError, TypeError) as e:
-            signed_txn = Account.sign_transaction(transaction, private_key)
-            if hasattr(signed_txn, 'rawTransaction'):
-                raw_tx = signed_txn.rawTransaction
-            elif hasattr(signed_txn, 'raw_transaction'):
-                raw_tx = signed_txn.raw_transaction
-            else:
-                # Last fallback - use web3.eth.account.sign_transaction
-                signed_txn = web3.eth.account.sign_transaction(transaction, private_key)
-                raw_tx = signed_txn.rawTransaction
-        tx_hash = web3.eth.send_raw_transaction(raw_tx)
-
-        print(f"\033[1m\033[33mTX: {short_hash(tx_hash.hex())}\033[0m")
-
-        receipt = await wait_for_tx_with_retry(web3, tx_hash.hex())
+        ), gas=100000)
+
+        print(f"\033[1m\033[33mTX: {short_hash(pending.hash)}\033[0m")
+
+        receipt = await pending.wait()
 
         if receipt['status'] == 0:
             raise Exception('Transaction reverted')
 
         print(f"\033[1m\033[32mSent successfully! Block: {receipt['blockNumber']}\033[0m")
-        print(f"\033[1m\033[34mExplorer: {CONFIG['EXPLORER_URL']}/tx/{tx_hash.hex()}\033[0m")
+        print(f"\033[1m\033[34mExplorer: {CONFIG['EXPLORER_URL']}/tx/{pending.hash}\033[0m")
 
-        stats = WalletStatistics()
+        stats = get_statistics()
         stats.record_transaction(
             wallet.address,
             'token_transfer',
-            tx_hash.hex(),
+            pending.hash,
             str(receipt['gasUsed']),
             'success',
             {'tokenAddress': token_address, 'symbol': token_symbol, 'to': to_address, 'amount': str(amount)}
         )
-        stats.close()
 
         return {'success': True}
 
     except Exception as error:
         error_msg = str(error)
-        is_retryable = any(x in error_msg for x in ['reverted', 'nonce', '502', '503', 'Bad Gateway', 'timeout'])
+        is_retryable = 'reverted' in error_msg or classify_error(error) != FATAL
 
         if retry_count < max_retries and is_retryable:
-            wait_time = (retry_count + 1) * 5
+            wait_time = backoff_seconds(retry_count + 1)
             print(f"\033[1m\033[33m⚠️ RPC error, retry in {wait_time}s... ({retry_count + 1}/{max_retries})\033[0m")
             await async_sleep(wait_time)
             return await send_token(web3, wallet, token_address, token_symbol, to_address, amount, retry_count + 1)
@@ -139,8 +122,8 @@ async def run_send_token():
             print('\033[1m\033[31mPrivate keys not found in pv.txt\033[0m')
             return
 
-        web3 = Web3(Web3.HTTPProvider(CONFIG['RPC_URL']))
-        wallets = [Account.from_key(pk) for pk in private_keys]
+        web3 = create_web3()
+        wallets = get_wallets(private_keys)
 
         successful = 0
         failed = 0
@@ -149,18 +132,16 @@ async def run_send_token():
 
         for w in range(len(wallets)):
             wallet = wallets[w]
-            private_key = private_keys[w]
             print(f"\n\033[1m\033[35mWALLET #{w + 1}/{len(wallets)}\033[0m")
             print(f"\033[1m\033[36mAddress: {wallet.address}\033[0m\n")
 
             for token_symbol, token_address in tokens_to_send:
                 to = Account.create().address if use_random_address else to_address
-                result = await send_token(web3, wallet, private_key, token_address, token_symbol, to, amount)
+                result = await send_token(web3, wallet, token_address, token_symbol, to, amount)
                 if result.get('success'):
                     successful += 1
                 else:
                     failed += 1
-                await async_sleep(2)
 
             if w < len(wallets) - 1:
                 await countdown(get_random_int(5, 10), 'Next wallet in')
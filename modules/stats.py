@@ -2,12 +2,12 @@
 # STATISTICS MODULE - [20]
 # ═══════════════════════════════════════════════════════════════════════════════
 
-from datetime import datetime
-from eth_account import Account
+from datetime import datetime, timedelta
 from config import COLORS
 from utils.helpers import ask_question
-from utils.wallet import get_private_keys
-from utils.statistics import WalletStatistics
+from utils.provider import create_web3
+from utils.wallet import get_private_keys, get_addresses
+from utils.statistics import get_statistics
 
 def display_wallet_stats(wallet_stats):
     """Display wallet statistics"""
@@ -23,8 +23,8 @@ def display_wallet_stats(wallet_stats):
     print(f"\033[1m\033[36m═══════════════════════════════════════════════════════════\033[0m\n")
 
     print(f"\033[1m\033[32mAddress: {wallet['address']}\033[0m")
-    print(f"First activity: {datetime.fromisoformat(wallet['first_activity']).strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Last activity: {datetime.fromisoformat(wallet['last_activity']).strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"First activity: {datetime.fromtimestamp(wallet['first_activity']).strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Last activity: {datetime.fromtimestamp(wallet['last_activity']).strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"\033[1m\033[33mTotal transactions: {wallet.get('total_transactions', 0)}\033[0m")
     print(f"\033[1m\033[33mTotal gas used: {wallet.get('total_gas_used', 0)}\033[0m\n")
 
@@ -77,12 +77,14 @@ async def run_statistics():
     print('\033[1m\033[33mAvailable operations:\033[0m')
     print('\033[1m\033[34m  1. Show wallet statistics\033[0m')
     print('\033[1m\033[34m  2. Top-10 most active wallets\033[0m')
-    print('\033[1m\033[34m  3. Export statistics to CSV\033[0m')
-    print('\033[1m\033[34m  4. Show all wallets\033[0m\n')
+    print('\033[1m\033[34m  3. Export transactions (CSV/JSONL/Parquet)\033[0m')
+    print('\033[1m\033[34m  4. Show all wallets\033[0m')
+    print('\033[1m\033[34m  5. Activity by day (last 7 days)\033[0m')
+    print('\033[1m\033[34m  6. Backfill receipt data (block, gas price, fee)\033[0m\n')
 
-    choice = ask_question('\033[1m\033[36mChoose (1-4): \033[0m')
+    choice = ask_question('\033[1m\033[36mChoose (1-6): \033[0m')
 
-    stats = WalletStatistics()
+    stats = get_statistics()
 
     try:
         if choice == '1':
@@ -92,10 +94,10 @@ async def run_statistics():
                 print('\033[1m\033[31mPrivate keys not found in pv.txt\033[0m')
                 return
 
+            addresses = get_addresses(private_keys)
             print(f"\n\033[1m\033[36mAvailable wallets:\033[0m")
-            for i, pk in enumerate(private_keys):
-                wallet = Account.from_key(pk)
-                print(f"\033[1m\033[34m  {i + 1}. {wallet.address}\033[0m")
+            for i, address in enumerate(addresses):
+                print(f"\033[1m\033[34m  {i + 1}. {address}\033[0m")
 
             wallet_choice = ask_question(f"\n\033[1m\033[36mChoose WALLET NUMBER (1-{len(private_keys)}): \033[0m")
             try:
@@ -107,8 +109,7 @@ async def run_statistics():
                 print('\033[1m\033[31m❌ Invalid choice!\033[0m')
                 return
 
-            wallet = Account.from_key(private_keys[wallet_index])
-            wallet_stats = stats.get_wallet_stats(wallet.address)
+            wallet_stats = stats.get_wallet_stats(addresses[wallet_index])
 
             display_wallet_stats(wallet_stats)
 
@@ -130,34 +131,39 @@ async def run_statistics():
                 print(f"   Swaps: {w.get('swaps_total', 0)}\n")
 
         elif choice == '3':
-            # Export to CSV
-            private_keys = get_private_keys()
-            if len(private_keys) == 0:
-                print('\033[1m\033[31mPrivate keys not found in pv.txt\033[0m')
-                return
-
-            print(f"\n\033[1m\033[36mAvailable wallets:\033[0m")
-            for i, pk in enumerate(private_keys):
-                wallet = Account.from_key(pk)
-                print(f"\033[1m\033[34m  {i + 1}. {wallet.address}\033[0m")
-
-            wallet_choice = ask_question(f"\n\033[1m\033[36mChoose WALLET NUMBER (1-{len(private_keys)}): \033[0m")
-            try:
-                wallet_index = int(wallet_choice) - 1
-                if wallet_index < 0 or wallet_index >= len(private_keys):
+            # Export transactions (streamed, any number of wallets)
+            wallet_range = ask_question('\033[1m\033[36mWallet range from pv.txt, e.g. 1-10 (Enter = all wallets): \033[0m').strip()
+            addresses = None
+            if wallet_range:
+                private_keys = get_private_keys()
+                try:
+                    first, _, last = wallet_range.partition('-')
+                    first = int(first)
+                    last = int(last or first)
+                    if first < 1 or last > len(private_keys) or first > last:
+                        raise ValueError
+                except ValueError:
                     print('\033[1m\033[31m❌ Invalid choice!\033[0m')
                     return
-            except ValueError:
+                addresses = get_addresses(private_keys[first - 1:last])
+
+            print('\033[1m\033[34m  1. CSV\033[0m')
+            print('\033[1m\033[34m  2. JSONL\033[0m')
+            print('\033[1m\033[34m  3. Parquet (requires pyarrow)\033[0m')
+            fmt = {'1': 'csv', '2': 'jsonl', '3': 'parquet'}.get(ask_question('\033[1m\033[36mFormat (1-3): \033[0m').strip())
+            if not fmt:
                 print('\033[1m\033[31m❌ Invalid choice!\033[0m')
                 return
 
-            wallet = Account.from_key(private_keys[wallet_index])
-            filename = f"wallet_stats_{wallet.address[:10]}.csv"
+            tx_type = ask_question('\033[1m\033[36mTransaction type, e.g. swap_exact_in (Enter = all): \033[0m').strip() or None
+            start_day = ask_question('\033[1m\033[36mFrom date YYYY-MM-DD (Enter = any): \033[0m').strip() or None
+            end_day = ask_question('\033[1m\033[36mTo date YYYY-MM-DD (Enter = any): \033[0m').strip() or None
 
-            success = stats.export_to_csv(wallet.address, filename)
+            filename = f"wallet_stats_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{fmt}"
+            written = stats.export_transactions(filename, fmt, addresses, tx_type, start_day, end_day)
 
-            if success:
-                print(f"\n\033[1m\033[32m✓ Export completed: {filename}\033[0m")
+            if written > 0:
+                print(f"\n\033[1m\033[32m✓ Export completed: {filename} ({written} transactions)\033[0m")
             else:
                 print(f"\n\033[1m\033[31m✗ No data to export\033[0m")
 
@@ -176,7 +182,30 @@ async def run_statistics():
                 print(f"   Transactions: {w.get('total_transactions', 0)}")
                 print(f"   Tokens: {w.get('tokens_deployed', 0)} | Swaps: {w.get('swaps_total', 0)} | Batch: {w.get('batch_operations', 0)}\n")
 
+        elif choice == '5':
+            # Daily activity from the rollups
+            start_day = (datetime.now() - timedelta(days=6)).strftime('%Y-%m-%d')
+            rows = stats.get_daily_activity(start_day)
+
+            print(f"\n\033[1m\033[36m📅 ACTIVITY BY DAY (since {start_day})\033[0m\n")
+
+            if len(rows) == 0:
+                print('\033[1m\033[33m⚠️ No data. Start using the modules!\033[0m')
+                return
+
+            current_day = None
+            for row in rows:
+                if row['day'] != current_day:
+                    current_day = row['day']
+                    print(f"\033[1m\033[32m{current_day}\033[0m")
+                print(f"   {row['type'].ljust(26)} {str(row['tx_count']).rjust(6)} tx  "
+                      f"{str(row['successful']).rjust(6)} ok  {str(row['wallets']).rjust(5)} wallets  gas {row['gas_used']}")
+
+        elif choice == '6':
+            # Fetch missing receipt metadata in JSON-RPC batches
+            print(f"\n\033[1m\033[36mFetching receipts for transactions without block data...\033[0m")
+            result = await stats.backfill_receipts(create_web3())
+            print(f"\033[1m\033[32m✓ Checked: {result['checked']} | Updated: {result['updated']} | Not found: {result['missing']}\033[0m")
+
     except Exception as error:
         print(f"\033[1m\033[31mError: {error}\033[0m")
-    finally:
-        stats.close()
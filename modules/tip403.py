@@ -6,10 +6,15 @@ import asyncio
 import re
 from web3 import Web3
 from eth_account import Account
-from config import CONFIG, TIP403_REGISTRY_ABI, TIP403_REGISTRY, TIP20_POLICY_ABI, COLORS
-from utils.helpers import ask_question, async_sleep, short_hash, wait_for_tx_with_retry
-from utils.wallet import get_private_keys, load_created_tokens
-from utils.statistics import WalletStatistics
+from config import TIP403_REGISTRY_ABI, TIP403_REGISTRY, TIP20_POLICY_ABI, COLORS
+from utils.address import checksum
+from utils.contracts import get_contract
+from utils.helpers import ask_question, async_sleep, short_hash
+from utils.provider import create_web3
+from utils.pipeline import TxPipeline
+from utils.wallet import get_private_keys, load_created_tokens, get_wallets
+from utils.statistics import get_statistics
+from utils.resilience import is_transient_error, backoff_seconds
 
 async def run_tip403_policies():
     """Main function of the TIP-403 policies module"""
@@ -37,7 +42,8 @@ async def run_tip403_policies():
             print('\033[1m\033[31mPrivate keys not found in pv.txt\033[0m')
             return
 
-        web3 = Web3(Web3.HTTPProvider(CONFIG['RPC_URL']))
+        web3 = create_web3()
+        pipeline = TxPipeline(web3)
 
         # Load all created tokens
         created_tokens = load_created_tokens()
@@ -46,17 +52,15 @@ async def run_tip403_policies():
         print(f"\n\033[1m\033[36mAvailable wallets:\033[0m")
         wallets_with_tokens = []
 
-        for i, pk in enumerate(private_keys):
-            wallet = Account.from_key(pk)
-            # Ensure the address is in checksum format
-            wallet_address_checksum = Web3.to_checksum_address(wallet.address)
+        for i, wallet in enumerate(get_wallets(private_keys)):
+            wallet_address_checksum = wallet.address
             wallet_tokens = created_tokens.get(wallet_address_checksum, [])
             has_tokens = len(wallet_tokens) > 0
 
             wallets_with_tokens.append({
                 'index': i,
                 'address': wallet_address_checksum,
-                'privateKey': pk,
+                'wallet': wallet,
                 'tokens': wallet_tokens,
                 'hasTokens': has_tokens
             })
@@ -82,10 +86,8 @@ async def run_tip403_policies():
             print('\033[1m\033[31m⚠️ This wallet has no created tokens. Create via [4]\033[0m')
             return
 
-        wallet = Account.from_key(selected_wallet['privateKey'])
-        private_key = selected_wallet['privateKey']
-        # Ensure the address is in checksum format
-        wallet_address = Web3.to_checksum_address(wallet.address)
+        wallet = selected_wallet['wallet']
+        wallet_address = wallet.address
         print(f"\n\033[1m\033[32m✓ Selected wallet: {wallet_address}\033[0m")
 
         # Show tokens of this wallet
@@ -104,10 +106,10 @@ async def run_tip403_policies():
             return
 
         token_info = selected_wallet['tokens'][token_index]
-        token_address_checksum = Web3.to_checksum_address(token_info['token'])
-        registry_address_checksum = Web3.to_checksum_address(TIP403_REGISTRY)
-        token = web3.eth.contract(address=token_address_checksum, abi=TIP20_POLICY_ABI)
-        registry = web3.eth.contract(address=registry_address_checksum, abi=TIP403_REGISTRY_ABI)
+        token_address_checksum = checksum(token_info['token'])
+        registry_address_checksum = TIP403_REGISTRY
+        token = get_contract(web3, token_address_checksum, TIP20_POLICY_ABI)
+        registry = get_contract(web3, registry_address_checksum, TIP403_REGISTRY_ABI)
 
         print(f"\n\033[1m\033[32m✓ Selected: {token_info['symbol']} ({token_info['token']})\033[0m\n")
 
@@ -135,7 +137,7 @@ async def run_tip403_policies():
 
                 for i in range(count):
                     random_wallet = Account.create()
-                    valid_addresses.append(Web3.to_checksum_address(random_wallet.address))
+                    valid_addresses.append(checksum(random_wallet.address))
 
                 print(f"\033[1m\033[32m✓ Generated {count} addresses\033[0m\n")
             else:
@@ -145,7 +147,7 @@ async def run_tip403_policies():
                 # Validate
                 for addr in addresses:
                     if Web3.is_address(addr):
-                        valid_addresses.append(Web3.to_checksum_address(addr))
+                        valid_addresses.append(checksum(addr))
                     else:
                         invalid_addresses.append(addr)
 
@@ -164,47 +166,31 @@ async def run_tip403_policies():
             print('')
 
             # Ensure all addresses are in checksum format
-            valid_addresses_checksum = [Web3.to_checksum_address(addr) for addr in valid_addresses]
-            token_address_checksum = Web3.to_checksum_address(token_info['token'])
-            registry_address_checksum = Web3.to_checksum_address(TIP403_REGISTRY)
+            valid_addresses_checksum = [checksum(addr) for addr in valid_addresses]
+            token_address_checksum = checksum(token_info['token'])
+            registry_address_checksum = TIP403_REGISTRY
 
             # Create policy with accounts
             print('\033[1m\033[33m1/2 Creating policy in TIP403 Registry...\033[0m')
-            nonce = web3.eth.get_transaction_count(wallet_address)
-            create_tx = registry.functions.createPolicyWithAccounts(
+            pending = await pipeline.submit(wallet, registry.functions.createPolicyWithAccounts(
                 wallet_address,
                 policy_type,
                 valid_addresses_checksum
-            ).build_transaction({
-                'from': wallet_address,
-                'nonce': nonce,
-                'gas': 300000 + len(valid_addresses_checksum) * 50000,
-                'gasPrice': web3.eth.gas_price,
-                'chainId': CONFIG['CHAIN_ID']
-            })
-
-            # Sign transaction
-            try:
-                signed_create = wallet.sign_transaction(create_tx)
-                raw_tx = signed_create.rawTransaction
-            except (AttributeError, TypeError):
-                signed_create = Account.sign_transaction(create_tx, private_key)
-                raw_tx = signed_create.rawTransaction if hasattr(signed_create, 'rawTransaction') else signed_create.raw_transaction
-            tx_hash = web3.eth.send_raw_transaction(raw_tx)
-            print(f"  TX: {short_hash(tx_hash.hex())}")
+            ), gas=300000 + len(valid_addresses_checksum) * 50000)
+            print(f"  TX: {short_hash(pending.hash)}")
 
             # Wait with retry logic
             create_receipt = None
             retries = 3
             while retries > 0 and not create_receipt:
                 try:
-                    create_receipt = await wait_for_tx_with_retry(web3, tx_hash.hex())
+                    create_receipt = await pending.wait()
                 except Exception as error:
                     retries -= 1
-                    err_msg = str(error)[:50]
-                    if retries > 0 and any(x in err_msg for x in ['ECONNRESET', 'timeout', '502']):
-                        print(f"  ⚠️ Network error, retrying in 3s... ({retries} attempts)")
-                        await async_sleep(3)
+                    if retries > 0 and is_transient_error(error):
+                        wait_time = backoff_seconds(3 - retries)
+                        print(f"  ⚠️ Network error, retrying in {wait_time}s... ({retries} attempts)")
+                        await async_sleep(wait_time)
                     else:
                         raise error
 
@@ -218,60 +204,43 @@ async def run_tip403_policies():
 
             # Attach policy to token
             print('\033[1m\033[33m2/2 Attaching policy to token...\033[0m')
-            nonce = web3.eth.get_transaction_count(wallet_address)
-            attach_tx = token.functions.changeTransferPolicyId(policy_id).build_transaction({
-                'from': wallet_address,
-                'nonce': nonce,
-                'gas': 200000,
-                'gasPrice': web3.eth.gas_price,
-                'chainId': CONFIG['CHAIN_ID']
-            })
-
-            # Sign transaction
-            try:
-                signed_attach = wallet.sign_transaction(attach_tx)
-                raw_tx = signed_attach.rawTransaction
-            except (AttributeError, TypeError):
-                signed_attach = Account.sign_transaction(attach_tx, private_key)
-                raw_tx = signed_attach.rawTransaction if hasattr(signed_attach, 'rawTransaction') else signed_attach.raw_transaction
-            attach_tx_hash = web3.eth.send_raw_transaction(raw_tx)
-            print(f"  TX: {short_hash(attach_tx_hash.hex())}")
+            attach_tx = await pipeline.submit(wallet, token.functions.changeTransferPolicyId(policy_id), gas=200000)
+            print(f"  TX: {short_hash(attach_tx.hash)}")
 
             # Wait with retry logic
             attach_receipt = None
             retries = 3
             while retries > 0 and not attach_receipt:
                 try:
-                    attach_receipt = await wait_for_tx_with_retry(web3, attach_tx_hash.hex())
+                    attach_receipt = await attach_tx.wait()
                 except Exception as error:
                     retries -= 1
-                    err_msg = str(error)[:50]
-                    if retries > 0 and any(x in err_msg for x in ['ECONNRESET', 'timeout', '502']):
-                        print(f"  ⚠️ Network error, retrying in 3s... ({retries} attempts)")
-                        await async_sleep(3)
+                    if retries > 0 and is_transient_error(error):
+                        wait_time = backoff_seconds(3 - retries)
+                        print(f"  ⚠️ Network error, retrying in {wait_time}s... ({retries} attempts)")
+                        await async_sleep(wait_time)
                     else:
                         raise error
 
             print(f"  ✓ Policy attached to token\n")
 
             # Record in statistics
-            stats = WalletStatistics()
+            stats = get_statistics()
             stats.record_transaction(
                 wallet_address,
                 'policy_create',
-                tx_hash.hex(),
+                pending.hash,
                 str(create_receipt['gasUsed']),
                 'success',
                 {'policyId': str(policy_id), 'policyType': 'whitelist' if is_whitelist else 'blacklist', 'addressesCount': len(valid_addresses_checksum), 'tokenAddress': token_info['token']}
             )
-            stats.close()
 
             print(f"\033[1m\033[32m✓ {'Whitelist' if is_whitelist else 'Blacklist'} set for {len(valid_addresses_checksum)} addresses\033[0m")
             print(f"\033[1m\033[36mPolicy ID: {policy_id}\033[0m")
 
         elif choice == '3':
             # Check current policy
-            policy_id = token.functions.transferPolicyId().call()
+            policy_id = await token.functions.transferPolicyId().call()
             print(f"\033[1m\033[36mCurrent Policy ID: {policy_id}\033[0m")
 
             if policy_id == 0:
@@ -288,7 +257,7 @@ async def run_tip403_policies():
                 print('\033[1m\033[31mInvalid address\033[0m')
                 return
 
-            is_authorized = registry.functions.isAuthorized(policy_id, Web3.to_checksum_address(address)).call()
+            is_authorized = await registry.functions.isAuthorized(policy_id, checksum(address)).call()
 
             print(f"\n\033[1m\033[36mResults for {address}:\033[0m")
             auth_status = '\033[32m✓ Yes\033[0m' if is_authorized else '\033[31m✗ No\033[0m'
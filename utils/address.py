@@ -0,0 +1,19 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEMPO BOT v2.0.1 - ADDRESS NORMALIZATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from functools import lru_cache
+from eth_utils import to_checksum_address
+
+# Wallets, tokens and system contracts of a run fit comfortably
+CHECKSUM_CACHE_SIZE = 8192
+
+@lru_cache(maxsize=CHECKSUM_CACHE_SIZE)
+def checksum(address: str) -> str:
+    """EIP-55 checksum form of an address.
+
+    Every conversion hashes the address with keccak, and the bot converts the
+    same wallets and contracts over and over, so results are memoized. Must
+    not import config (config uses it for its constants).
+    """
+    return to_checksum_address(address)
@@ -0,0 +1,152 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEMPO BOT v2.0.1 - READ-THROUGH CONTRACT CALL CACHE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from web3 import Web3
+from config import CONFIG
+from utils.multicall import get_multicall
+
+_script_dir = os.path.dirname(os.path.abspath(__file__))
+_project_root = os.path.dirname(_script_dir)
+CACHE_FILE = os.path.join(_project_root, 'data', 'read_cache.db')
+
+@lru_cache(maxsize=None)
+def role_hash(role_name: str) -> bytes:
+    """keccak256 of an access-control role name (PAUSE_ROLE, ISSUER_ROLE, ...)"""
+    return bytes(Web3.keccak(text=role_name))
+
+ISSUER_ROLE = role_hash('ISSUER_ROLE')
+PAUSE_ROLE = role_hash('PAUSE_ROLE')
+
+def _dump(value) -> str:
+    if isinstance(value, bytes):
+        return json.dumps({'hex': value.hex()})
+    return json.dumps({'value': value})
+
+def _load(text: str):
+    data = json.loads(text)
+    return bytes.fromhex(data['hex']) if 'hex' in data else data['value']
+
+class ReadCache:
+    """Layered cache for contract reads keyed by (chain id, contract, calldata).
+
+    Entries live in an in-process LRU. Immutable values (decimals, names,
+    pool ids) are also written to an on-disk SQLite store, so later runs
+    start warm. Mutable values expire after a TTL, or with the block they
+    were read in (see `on_new_block`).
+    """
+
+    def __init__(self, size: int = None, db_path: str = None, persist: bool = None):
+        self.size = size or CONFIG['READ_CACHE_SIZE']
+        self.db_path = db_path or CACHE_FILE
+        self.persist = CONFIG['READ_CACHE_PERSIST'] if persist is None else persist
+        self._entries = OrderedDict()
+        self._block = None
+        self._db = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _disk(self):
+        if self._db is None and self.persist:
+            try:
+                os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+                self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+                self._db.execute('PRAGMA journal_mode=WAL')
+                self._db.execute('CREATE TABLE IF NOT EXISTS calls (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+                self._db.commit()
+            except sqlite3.Error:
+                # Memory-only for this run
+                self.persist = False
+                self._db = None
+        return self._db
+
+    @staticmethod
+    def key(call) -> str:
+        return f"{CONFIG['CHAIN_ID']}:{call.address.lower()}:{call._encode_transaction_data()}"
+
+    def get(self, key: str):
+        """(True, value) on a hit, (False, None) on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at, block = entry
+                if (expires_at is None or time.monotonic() < expires_at) and (block is None or block == self._block):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+            db = self._disk()
+            if db is not None:
+                row = db.execute('SELECT value FROM calls WHERE key = ?', (key,)).fetchone()
+                if row:
+                    value = _load(row[0])
+                    self._remember(key, value, None, None)
+                    self.hits += 1
+                    return True, value
+            self.misses += 1
+        return False, None
+
+    def _remember(self, key: str, value, expires_at, block):
+        self._entries[key] = (value, expires_at, block)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+
+    def set(self, key: str, value, ttl: float = None, per_block: bool = False):
+        """Store a value; without ttl/per_block it is immutable and persisted"""
+        if per_block:
+            # Bounded by a TTL too: blocks are only observed while txs are pending
+            ttl = min(ttl, CONFIG['READ_CACHE_BLOCK_TTL']) if ttl is not None else CONFIG['READ_CACHE_BLOCK_TTL']
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._remember(key, value, expires_at, self._block if per_block else None)
+            db = self._disk() if expires_at is None else None
+            if db is not None:
+                try:
+                    db.execute('INSERT OR REPLACE INTO calls (key, value) VALUES (?, ?)', (key, _dump(value)))
+                    db.commit()
+                except (TypeError, sqlite3.Error):
+                    pass
+
+    def on_new_block(self, block_number: int):
+        """Block-scoped entries of older blocks become stale"""
+        self._block = block_number
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> dict:
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+# Process-wide instance used by all modules
+read_cache = ReadCache()
+
+async def cached_read(web3, call, ttl: float = None, per_block: bool = False):
+    """Read a contract call through the cache.
+
+    Without `ttl`/`per_block` the result is treated as immutable. Misses go
+    through the shared multicall reader, so concurrent misses still share
+    one round trip. Failed reads are never cached.
+    """
+    key = read_cache.key(call)
+    hit, value = read_cache.get(key)
+    if hit:
+        return value
+    value = await get_multicall(web3).read(call)
+    read_cache.set(key, value, ttl, per_block)
+    return value
@@ -0,0 +1,130 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEMPO BOT v2.0.1 - SOLIDITY COMPILER CACHE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import os
+import json
+import asyncio
+import hashlib
+import threading
+
+SOLC_VERSION = '0.8.20'
+OPTIMIZER = {'enabled': True, 'runs': 200}
+
+_script_dir = os.path.dirname(os.path.abspath(__file__))
+_project_root = os.path.dirname(_script_dir)
+CACHE_DIR = os.path.join(_project_root, 'data', 'solc_cache')
+
+_memory = {}
+_lock = threading.Lock()
+# solc versions known to be installed
+_installed = set()
+
+def cache_key(source: str, version: str = SOLC_VERSION, optimizer: dict = None) -> str:
+    """Content hash of everything that affects the compiler output"""
+    payload = json.dumps({
+        'source': source,
+        'version': version,
+        'optimizer': optimizer or OPTIMIZER
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def _standard_input(sources: dict, optimizer: dict) -> dict:
+    return {
+        'language': 'Solidity',
+        'sources': {filename: {'content': source} for filename, source in sources.items()},
+        'settings': {
+            'optimizer': optimizer,
+            'outputSelection': {'*': {'*': ['abi', 'evm.bytecode.object']}}
+        }
+    }
+
+def _artifacts(file_output: dict) -> dict:
+    """Contract name -> {abi, bytecode} for one compiled source file"""
+    return {
+        name: {'abi': data['abi'], 'bytecode': '0x' + data['evm']['bytecode']['object']}
+        for name, data in file_output.items()
+    }
+
+def _load(key: str):
+    if key in _memory:
+        return _memory[key]
+    path = os.path.join(CACHE_DIR, f'{key}.json')
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            artifacts = json.load(f)
+    except (OSError, ValueError):
+        return None
+    _memory[key] = artifacts
+    return artifacts
+
+def _store(key: str, artifacts: dict):
+    _memory[key] = artifacts
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        path = os.path.join(CACHE_DIR, f'{key}.json')
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(artifacts, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # The in-memory copy still serves this process
+        pass
+
+def _ensure_solc(version: str):
+    """Install the pinned solc on first use (fresh checkouts have none)"""
+    if version in _installed:
+        return
+    from solcx import get_installed_solc_versions, install_solc
+    if version not in {str(v) for v in get_installed_solc_versions()}:
+        print(f"\033[1m\033[36mInstalling solc {version}...\033[0m")
+        install_solc(version)
+    _installed.add(version)
+
+def _compile(sources: dict, version: str, optimizer: dict) -> dict:
+    """Run solc once over several sources; returns filename -> artifacts"""
+    from solcx import compile_standard
+    _ensure_solc(version)
+    output = compile_standard(_standard_input(sources, optimizer), solc_version=version)
+    return {filename: _artifacts(output['contracts'].get(filename, {})) for filename in sources}
+
+def compile_solidity(source: str, contract_name: str, version: str = SOLC_VERSION, optimizer: dict = None) -> dict:
+    """Compile a contract, reusing cached artifacts for unchanged sources.
+
+    Returns {'abi': [...], 'bytecode': '0x...'}.
+    """
+    optimizer = optimizer or OPTIMIZER
+    key = cache_key(source, version, optimizer)
+    with _lock:
+        artifacts = _load(key)
+        if artifacts is None:
+            artifacts = _compile({f'{key}.sol': source}, version, optimizer)[f'{key}.sol']
+            _store(key, artifacts)
+    if contract_name not in artifacts:
+        raise Exception(f'Contract {contract_name} not found in compiled source')
+    return artifacts[contract_name]
+
+def warm_templates(sources: list, version: str = SOLC_VERSION, optimizer: dict = None) -> int:
+    """Compile every uncached source in a single solc invocation.
+
+    Returns the number of sources that had to be compiled.
+    """
+    optimizer = optimizer or OPTIMIZER
+    with _lock:
+        missing = {}
+        for source in sources:
+            key = cache_key(source, version, optimizer)
+            if _load(key) is None:
+                missing[f'{key}.sol'] = source
+        if missing:
+            for filename, artifacts in _compile(missing, version, optimizer).items():
+                _store(filename[:-len('.sol')], artifacts)
+    return len(missing)
+
+async def compile_solidity_async(source: str, contract_name: str, version: str = SOLC_VERSION, optimizer: dict = None) -> dict:
+    """compile_solidity() in a worker thread, so a cache miss never stalls the event loop"""
+    return await asyncio.to_thread(compile_solidity, source, contract_name, version, optimizer)
+
+async def warm_templates_async(sources: list, version: str = SOLC_VERSION, optimizer: dict = None) -> int:
+    """warm_templates() in a worker thread"""
+    return await asyncio.to_thread(warm_templates, sources, version, optimizer)
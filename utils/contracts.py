@@ -0,0 +1,165 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEMPO BOT v2.0.1 - CONTRACT & FUNCTION SELECTOR REGISTRY
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import weakref
+from eth_abi import decode, encode
+from eth_utils import function_abi_to_4byte_selector
+from utils.address import checksum
+
+def abi_type(param: dict) -> str:
+    """Canonical ABI type string, expanding tuples"""
+    kind = param['type']
+    if kind.startswith('tuple'):
+        inner = ','.join(abi_type(c) for c in param['components'])
+        return f'({inner}){kind[5:]}'
+    return kind
+
+def _check_addresses(param: dict, value):
+    """Raise unless every address in value is checksummed, as web3 requires"""
+    kind = param['type']
+    if kind.endswith(']'):
+        element = dict(param, type=kind[:kind.rindex('[')])
+        for item in value:
+            _check_addresses(element, item)
+    elif kind == 'address':
+        if not isinstance(value, str) or checksum(value) != value:
+            raise ValueError(f'Not a checksum address: {value!r}')
+    elif kind == 'tuple':
+        for component, item in zip(param['components'], value):
+            _check_addresses(component, item)
+
+class FunctionCodec:
+    """Selector and argument/return types of one ABI function, resolved once"""
+
+    def __init__(self, fn_abi: dict):
+        self.abi = fn_abi
+        self.name = fn_abi['name']
+        self.inputs = fn_abi.get('inputs') or []
+        self.input_types = [abi_type(p) for p in self.inputs]
+        self.has_addresses = any('address' in t for t in self.input_types)
+        self.output_types = [abi_type(p) for p in fn_abi.get('outputs') or []]
+        self.selector = function_abi_to_4byte_selector(fn_abi)
+
+    def encode(self, args) -> str:
+        if self.has_addresses:
+            for param, value in zip(self.inputs, args):
+                _check_addresses(param, value)
+        return '0x' + (self.selector + encode(self.input_types, args)).hex()
+
+    def decode(self, data: bytes):
+        """Return data decoded the way ContractFunction.call() does"""
+        values = [
+            checksum(v) if t == 'address' else v
+            for t, v in zip(self.output_types, decode(self.output_types, data))
+        ]
+        if len(values) == 1:
+            return values[0]
+        return values
+
+def _codecs(abi: list) -> dict:
+    """Name -> FunctionCodec for every non-overloaded function of an ABI"""
+    functions = [e for e in abi if e.get('type', 'function') == 'function' and 'name' in e]
+    names = [e['name'] for e in functions]
+    return {e['name']: FunctionCodec(e) for e in functions if names.count(e['name']) == 1}
+
+class PreparedCall:
+    """Contract call with its calldata encoded up front.
+
+    Quacks like web3's ContractFunction where the bot uses one: `call()`,
+    `build_transaction()` (TxPipeline), and `address`/`abi`/`fn_name` plus
+    `_encode_transaction_data()` (MulticallReader, read cache).
+    """
+
+    def __init__(self, web3, address: str, codec: FunctionCodec, data: str):
+        self.w3 = web3
+        self.address = address
+        self.codec = codec
+        self.abi = codec.abi
+        self.fn_name = codec.name
+        self.data = data
+
+    def _encode_transaction_data(self) -> str:
+        return self.data
+
+    async def call(self, transaction: dict = None, block_identifier='latest'):
+        tx = dict(transaction or {}, to=self.address, data=self.data)
+        return self.codec.decode(await self.w3.eth.call(tx, block_identifier))
+
+    async def build_transaction(self, transaction: dict = None) -> dict:
+        tx = dict(transaction or {}, to=self.address, data=self.data)
+        tx.setdefault('value', 0)
+        if 'gas' not in tx:
+            tx['gas'] = await self.w3.eth.estimate_gas(tx)
+        return tx
+
+class _Functions:
+    def __init__(self, bound):
+        self._bound = bound
+
+    def __getattr__(self, name: str):
+        bound = self._bound
+        codec = bound.codecs.get(name)
+        if codec is None:
+            # Overloaded or unknown - let web3 resolve it
+            return getattr(bound.contract.functions, name)
+
+        def prepare(*args, **kwargs):
+            if not kwargs:
+                try:
+                    return PreparedCall(bound.web3, bound.address, codec, codec.encode(args))
+                except Exception:
+                    # Arguments web3 would normalize first (hex strings for
+                    # bytes, ...) or reject (non-checksum addresses)
+                    pass
+            return getattr(bound.contract.functions, name)(*args, **kwargs)
+        return prepare
+
+class BoundContract:
+    """A contract at one address, built once per (ABI, address).
+
+    `functions.<name>(...)` encodes calldata with precompiled selectors and
+    eth_abi encoders instead of web3's per-call ABI resolution. Anything
+    else (events, overloads, keyword arguments) goes to the regular web3
+    contract object, created on first use.
+    """
+
+    def __init__(self, web3, address: str, abi: list, codecs: dict):
+        self.web3 = web3
+        self.address = checksum(address)
+        self.abi = abi
+        self.codecs = codecs
+        self.functions = _Functions(self)
+        self._contract = None
+
+    @property
+    def contract(self):
+        if self._contract is None:
+            self._contract = self.web3.eth.contract(address=self.address, abi=self.abi)
+        return self._contract
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.contract, name)
+
+# ABI JSON -> codecs, shared by every address and client
+_abi_codecs = {}
+# web3 client -> {(ABI JSON, lowercase address): BoundContract}
+_registry = weakref.WeakKeyDictionary()
+
+def get_contract(web3, address: str, abi: list) -> BoundContract:
+    """Shared contract object for an address and ABI"""
+    abi_key = json.dumps(abi, sort_keys=True)
+    contracts = _registry.get(web3)
+    if contracts is None:
+        contracts = _registry[web3] = {}
+    key = (abi_key, address.lower())
+    contract = contracts.get(key)
+    if contract is None:
+        codecs = _abi_codecs.get(abi_key)
+        if codecs is None:
+            codecs = _abi_codecs[abi_key] = _codecs(abi)
+        contract = contracts[key] = BoundContract(web3, address, abi, codecs)
+    return contract
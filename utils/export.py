@@ -0,0 +1,146 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEMPO BOT v2.0.1 - STATISTICS EXPORT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import csv
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+from config import CONFIG
+from utils.address import checksum
+
+EXPORT_FORMATS = ['csv', 'jsonl', 'parquet']
+EXPORT_COLUMNS = [
+    'timestamp', 'address', 'type', 'tx_hash', 'block_number', 'gas_used',
+    'effective_gas_price', 'fee', 'fee_token', 'status', 'details'
+]
+INT_COLUMNS = ['block_number', 'gas_used', 'effective_gas_price', 'fee']
+
+def _as_int(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def _day_start(day: str, offset: int = 0) -> int:
+    """Epoch seconds of local midnight of a YYYY-MM-DD day"""
+    return int((datetime.strptime(day, '%Y-%m-%d') + timedelta(days=offset)).timestamp())
+
+def _wallet(address: str) -> str:
+    """Rows store checksummed addresses; accept any casing in filters"""
+    try:
+        return checksum(address)
+    except ValueError:
+        raise Exception(f'Invalid wallet address: {address}')
+
+def _query(conn, addresses: Optional[List[str]], tx_type: str, start_day: str, end_day: str):
+    """Build the filtered SELECT; wallet filters go through a temp table"""
+    query = f"SELECT {', '.join('t.' + c for c in EXPORT_COLUMNS)} FROM transactions t"
+    where = []
+    params = []
+    if addresses is not None:
+        conn.execute('CREATE TEMP TABLE IF NOT EXISTS export_addresses (address TEXT PRIMARY KEY)')
+        conn.execute('DELETE FROM export_addresses')
+        conn.executemany('INSERT OR IGNORE INTO export_addresses VALUES (?)', [(_wallet(a),) for a in addresses])
+        query += ' JOIN export_addresses e ON e.address = t.address'
+    if tx_type:
+        where.append('t.type = ?')
+        params.append(tx_type)
+    if start_day:
+        where.append('t.timestamp >= ?')
+        params.append(_day_start(start_day))
+    if end_day:
+        # Inclusive end day: everything before the following midnight
+        where.append('t.timestamp < ?')
+        params.append(_day_start(end_day, 1))
+    if where:
+        query += ' WHERE ' + ' AND '.join(where)
+    query += ' ORDER BY t.id'
+    return query, params
+
+def _chunks(cursor, chunk_size: int) -> Iterable[list]:
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            return
+        yield rows
+
+def _write_csv(chunks, filename: str) -> int:
+    written = 0
+    with open(filename, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_COLUMNS)
+        for rows in chunks:
+            writer.writerows(rows)
+            written += len(rows)
+    return written
+
+def _typed(row) -> dict:
+    record = dict(zip(EXPORT_COLUMNS, row))
+    for column in INT_COLUMNS:
+        record[column] = _as_int(record[column])
+    return record
+
+def _write_jsonl(chunks, filename: str) -> int:
+    written = 0
+    with open(filename, 'w', encoding='utf-8') as f:
+        for rows in chunks:
+            for row in rows:
+                record = _typed(row)
+                record['details'] = json.loads(record['details'] or '{}')
+                f.write(json.dumps(record, ensure_ascii=False))
+                f.write('\n')
+            written += len(rows)
+    return written
+
+def _write_parquet(chunks, filename: str) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise Exception('Parquet export requires pyarrow (pip install pyarrow)')
+
+    schema = pa.schema([
+        ('timestamp', pa.int64()),
+        ('address', pa.string()),
+        ('type', pa.string()),
+        ('tx_hash', pa.string()),
+        ('block_number', pa.int64()),
+        ('gas_used', pa.int64()),
+        ('effective_gas_price', pa.int64()),
+        ('fee', pa.int64()),
+        ('fee_token', pa.string()),
+        ('status', pa.string()),
+        ('details', pa.string())
+    ])
+    written = 0
+    with pq.ParquetWriter(filename, schema) as writer:
+        for rows in chunks:
+            records = [_typed(row) for row in rows]
+            writer.write_table(pa.Table.from_pylist(records, schema=schema))
+            written += len(rows)
+    return written
+
+_WRITERS = {'csv': _write_csv, 'jsonl': _write_jsonl, 'parquet': _write_parquet}
+
+def export_transactions(db_path: str, filename: str, fmt: str = 'csv', addresses: List[str] = None,
+                        tx_type: str = None, start_day: str = None, end_day: str = None,
+                        chunk_size: int = None) -> int:
+    """Stream transactions matching the filters into a file.
+
+    Rows are read through a separate connection in chunks, so memory
+    stays bounded and the statistics writer is never blocked. Days are
+    YYYY-MM-DD and inclusive. Returns the number of rows written.
+    """
+    if fmt not in _WRITERS:
+        raise Exception(f"Unknown export format: {fmt} (use {', '.join(EXPORT_FORMATS)})")
+    chunk_size = chunk_size or CONFIG['STATS_EXPORT_CHUNK_SIZE']
+
+    conn = sqlite3.connect(db_path)
+    try:
+        query, params = _query(conn, addresses, tx_type, start_day, end_day)
+        cursor = conn.execute(query, params)
+        return _WRITERS[fmt](_chunks(cursor, chunk_size), filename)
+    finally:
+        conn.close()
@@ -0,0 +1,61 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEMPO BOT v2.0.1 - FEE ORACLE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import asyncio
+import time
+from config import CONFIG
+
+class FeeOracle:
+    """Block-scoped fee cache shared by every module.
+
+    Fees come from one `eth_feeHistory` call and are served from memory until
+    a new block is seen or `FEE_CACHE_TTL` expires. Chains without EIP-1559
+    data fall back to a cached legacy `gasPrice`.
+    """
+
+    def __init__(self, ttl: float = None, blocks: int = None, percentile: float = None):
+        self.ttl = CONFIG['FEE_CACHE_TTL'] if ttl is None else ttl
+        self.blocks = blocks or CONFIG['FEE_HISTORY_BLOCKS']
+        self.percentile = CONFIG['FEE_PRIORITY_PERCENTILE'] if percentile is None else percentile
+        self._lock = asyncio.Lock()
+        self._fees = None
+        self._block = None
+        self._fetched_at = 0.0
+
+    def _fresh(self) -> bool:
+        return self._fees is not None and time.monotonic() - self._fetched_at < self.ttl
+
+    def on_new_block(self, block_number: int):
+        """Drop cached fees once the chain moves past the block they came from"""
+        if self._block is not None and block_number > self._block:
+            self._fees = None
+
+    async def get_fees(self, web3) -> dict:
+        """Fee fields to merge into a tx dict"""
+        if self._fresh():
+            return dict(self._fees)
+        async with self._lock:
+            # Another caller may have refreshed while we waited
+            if not self._fresh():
+                self._fees, self._block = await self._fetch(web3)
+                self._fetched_at = time.monotonic()
+        return dict(self._fees)
+
+    async def _fetch(self, web3):
+        try:
+            history = await web3.eth.fee_history(self.blocks, 'latest', [self.percentile])
+            base_fees = history['baseFeePerGas']
+            if base_fees and base_fees[-1]:
+                rewards = sorted(r[0] for r in history.get('reward') or [] if r)
+                priority = rewards[len(rewards) // 2] if rewards else 0
+                # Last entry is the base fee of the next block
+                max_fee = int(base_fees[-1] * CONFIG['FEE_BASE_MULTIPLIER']) + priority
+                last_block = history['oldestBlock'] + len(base_fees) - 2
+                return {'maxFeePerGas': max_fee, 'maxPriorityFeePerGas': priority}, last_block
+        except Exception:
+            pass
+        return {'gasPrice': await web3.eth.gas_price}, None
+
+# Process-wide instance used by all modules
+fee_oracle = FeeOracle()
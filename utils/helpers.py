@@ -78,27 +78,14 @@ async def animated_spinner(ms: int, text: str):
         await async_sleep(0.08)
     print('\r' + ' ' * (len(text) + 10) + '\r', end='')
 
-async def wait_for_tx_with_retry(web3, tx_hash: str, max_retries: int = 5):
-    """Wait for a tx with retries on RPC errors"""
-    import time
-    for attempt in range(max_retries + 1):
-        try:
-            receipt = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-            return receipt
-        except Exception as error:
-            err_msg = str(error)
-            is_rpc_error = any(x in err_msg for x in ['502', '503', 'Bad Gateway', 'SERVER_ERROR', 'timeout'])
-
-            if is_rpc_error and attempt < max_retries:
-                wait_time = (attempt + 1) * 5
-                print(f"\033[1m\033[33m⚠️ RPC error while waiting for TX, retry in {wait_time}s... ({attempt + 1}/{max_retries})\033[0m")
-                await async_sleep(wait_time)
-            else:
-                raise error
+async def wait_for_tx_with_retry(web3, tx_hash: str):
+    """Wait for a tx receipt (RPC errors are retried by the receipt watcher)"""
+    from utils.receipts import get_receipt_watcher
+    return await get_receipt_watcher(web3).wait(tx_hash)
 
 # ============ CREATED TOKENS STORAGE ============
 
-# Token-related helpers moved to utils/wallet.py
+# Token-related helpers moved to utils/wallet.py (stored in utils/token_registry.py)
 # Use: from utils.wallet import load_created_tokens, save_created_token, get_tokens_for_wallet
 
 def close_rl():
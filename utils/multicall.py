@@ -0,0 +1,118 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEMPO BOT v2.0.1 - MULTICALL3 READER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import asyncio
+import weakref
+from eth_abi import decode
+from web3 import Web3
+from config import CONFIG, MULTICALL3_ADDRESS, MULTICALL3_ABI
+from utils.contracts import abi_type, get_contract
+from utils.provider import rpc_batch
+
+def _decode_output(call, data: bytes):
+    """Decode return data the way ContractFunction.call() would"""
+    codec = getattr(call, 'codec', None)
+    if codec is not None:
+        return codec.decode(data)
+    outputs = call.abi.get('outputs') or []
+    values = decode([abi_type(o) for o in outputs], data)
+    if len(values) == 1:
+        return values[0]
+    return list(values)
+
+class MulticallReader:
+    """Aggregates contract reads into one Multicall3 `aggregate3` eth_call.
+
+    Reads issued in the same event-loop tick are flushed together, so
+    independent `read()` calls from different modules share one round trip.
+    If Multicall3 is not deployed the reads go out as one JSON-RPC batch of
+    plain `eth_call`s instead.
+    """
+
+    def __init__(self, web3, batch_size: int = None):
+        self.web3 = web3
+        self.batch_size = batch_size or CONFIG['MULTICALL_BATCH_SIZE']
+        self.multicall = get_contract(web3, MULTICALL3_ADDRESS, MULTICALL3_ABI)
+        self._available = None
+        self._queue = []
+        self._flush_scheduled = False
+        # asyncio keeps only weak references to tasks
+        self._flush_tasks = set()
+
+    async def read(self, call):
+        """Queue one read; raises like `.call()` if it reverts"""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((call, future))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            task = asyncio.get_running_loop().create_task(self.flush())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        return await future
+
+    async def read_many(self, calls: list) -> list:
+        """Run several reads at once; failed reads come back as None"""
+        results = await asyncio.gather(*(self.read(c) for c in calls), return_exceptions=True)
+        return [None if isinstance(r, Exception) else r for r in results]
+
+    async def flush(self):
+        """Send everything queued so far"""
+        self._flush_scheduled = False
+        queue, self._queue = self._queue, []
+        try:
+            for start in range(0, len(queue), self.batch_size):
+                chunk = queue[start:start + self.batch_size]
+                try:
+                    results = await self._execute([c for c, _ in chunk])
+                except Exception as error:
+                    for _, future in chunk:
+                        if not future.done():
+                            future.set_exception(error)
+                    continue
+                for (call, future), (success, data) in zip(chunk, results):
+                    if future.done():
+                        continue
+                    if not success:
+                        future.set_exception(Exception(f'execution reverted: {call.fn_name}'))
+                        continue
+                    try:
+                        future.set_result(_decode_output(call, data))
+                    except Exception as error:
+                        future.set_exception(error)
+        except Exception as error:
+            # Never leave a read waiting forever
+            for _, future in queue:
+                if not future.done():
+                    future.set_exception(error)
+        except BaseException:
+            for _, future in queue:
+                future.cancel()
+            raise
+        for _, future in queue:
+            if not future.done():
+                # Fewer results than calls
+                future.set_exception(Exception('multicall returned no result'))
+
+    async def _execute(self, calls: list) -> list:
+        """(success, returnData) for each call"""
+        if self._available is None:
+            code = await self.web3.eth.get_code(self.multicall.address)
+            self._available = len(code) > 0
+        if self._available:
+            return await self.multicall.functions.aggregate3([
+                (c.address, True, Web3.to_bytes(hexstr=c._encode_transaction_data())) for c in calls
+            ]).call()
+        results = await rpc_batch(self.web3, [
+            ('eth_call', [{'to': c.address, 'data': c._encode_transaction_data()}, 'latest']) for c in calls
+        ])
+        return [(r is not None, Web3.to_bytes(hexstr=r) if r else b'') for r in results]
+
+_readers = weakref.WeakKeyDictionary()
+
+def get_multicall(web3) -> MulticallReader:
+    """Multicall reader shared by everything using this web3 client"""
+    reader = _readers.get(web3)
+    if reader is None:
+        reader = _readers[web3] = MulticallReader(web3)
+    return reader
@@ -0,0 +1,72 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEMPO BOT v2.0.1 - NONCE MANAGER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import asyncio
+from web3 import Web3
+from utils.address import checksum
+
+# Error fragments meaning our local nonce view no longer matches the node
+NONCE_ERRORS = [
+    'nonce too low', 'nonce too high', 'invalid nonce', 'already known',
+    'replacement transaction underpriced', 'known transaction'
+]
+
+def is_nonce_error(error) -> bool:
+    """Check whether an RPC error is caused by a stale nonce"""
+    err_msg = str(error).lower()
+    return any(x in err_msg for x in NONCE_ERRORS)
+
+def tx_key(tx_hash) -> str:
+    """Normalize a tx hash (str or bytes, with or without 0x) for lookups"""
+    if not isinstance(tx_hash, str):
+        tx_hash = Web3.to_hex(tx_hash)
+    tx_hash = tx_hash.lower()
+    return tx_hash if tx_hash.startswith('0x') else '0x' + tx_hash
+
+class NonceManager:
+    """Per-wallet nonce allocator shared by every module.
+
+    Each address is seeded once from the `pending` transaction count and then
+    served locally, so consecutive sends need no extra RPC round trip.
+    """
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._next = {}
+        self._pending = {}
+
+    async def next_nonce(self, web3, address: str) -> int:
+        """Hand out the next nonce for an address"""
+        key = checksum(address)
+        if key not in self._next:
+            # Only the seeding round trip needs the lock; concurrent callers
+            # for a fresh address must not both seed from the node
+            async with self._lock:
+                if key not in self._next:
+                    self._next[key] = await web3.eth.get_transaction_count(key, 'pending')
+        nonce = self._next[key]
+        self._next[key] = nonce + 1
+        return nonce
+
+    def resync(self, address: str):
+        """Forget the local nonce; the next call reseeds from the node"""
+        key = checksum(address)
+        self._next.pop(key, None)
+
+    def track(self, tx_hash: str, address: str):
+        """Remember which address sent a broadcast tx"""
+        self._pending[tx_key(tx_hash)] = checksum(address)
+
+    def settle(self, tx_hash: str):
+        """Tx was mined - stop tracking it"""
+        self._pending.pop(tx_key(tx_hash), None)
+
+    def mark_dropped(self, tx_hash: str):
+        """Tx never made it into a block - resync its sender"""
+        address = self._pending.pop(tx_key(tx_hash), None)
+        if address:
+            self._next.pop(address, None)
+
+# Process-wide instance used by all modules
+nonce_manager = NonceManager()
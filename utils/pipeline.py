@@ -0,0 +1,113 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEMPO BOT v2.0.1 - TRANSACTION PIPELINE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import asyncio
+from web3 import Web3
+from config import CONFIG
+from utils.address import checksum
+from utils.fees import fee_oracle
+from utils.nonce import nonce_manager
+from utils.receipts import get_receipt_watcher
+from utils.statistics import get_statistics
+
+class PendingTx:
+    """Broadcast transaction whose receipt is still on its way"""
+
+    def __init__(self, web3, tx_hash: str):
+        self.web3 = web3
+        self.hash = tx_hash
+        self.receipt = self._watch()
+
+    def _watch(self) -> asyncio.Future:
+        receipt = get_receipt_watcher(self.web3).watch(self.hash)
+        receipt.add_done_callback(_consume_error)
+        receipt.add_done_callback(_record_receipt)
+        return receipt
+
+    def done(self) -> bool:
+        return self.receipt.done()
+
+    async def wait(self):
+        """Wait for the receipt.
+
+        A failed wait (RPC outage, timeout) settles its future for good, so
+        waiting again after one starts watching the tx afresh.
+        """
+        if self.receipt.done() and (self.receipt.cancelled() or self.receipt.exception() is not None):
+            self.receipt = self._watch()
+        return await self.receipt
+
+def _raw_transaction(signed):
+    """Raw bytes of a signed tx (eth-account renamed rawTransaction)"""
+    raw_tx = getattr(signed, 'raw_transaction', None)
+    if raw_tx is None:
+        raw_tx = signed.rawTransaction
+    return raw_tx
+
+def _consume_error(future: asyncio.Future):
+    # Fire-and-forget submits must not log "exception was never retrieved"
+    if not future.cancelled():
+        future.exception()
+
+def _record_receipt(future: asyncio.Future):
+    """Persist block, gas price, fee and status of every mined tx"""
+    if future.cancelled() or future.exception() is not None:
+        return
+    try:
+        get_statistics().record_receipt(future.result())
+    except Exception as error:
+        print(f"\033[1m\033[33m⚠️ Could not record receipt: {error}\033[0m")
+
+class TxPipeline:
+    """Build -> sign -> send -> await, in one place for every module.
+
+    `submit` returns as soon as the tx is broadcast; the receipt is tracked
+    in the background, so callers decide whether to wait or keep submitting.
+    """
+
+    def __init__(self, web3):
+        self.web3 = web3
+
+    async def build(self, address: str, call, gas: int = None, value: int = 0) -> dict:
+        """Build a tx dict for a contract call or constructor"""
+        params = {
+            'from': address,
+            'nonce': await nonce_manager.next_nonce(self.web3, address),
+            'gas': gas or CONFIG['GAS_LIMIT'],
+            'chainId': CONFIG['CHAIN_ID']
+        }
+        params.update(await fee_oracle.get_fees(self.web3))
+        if value:
+            params['value'] = value
+        return await call.build_transaction(params)
+
+    async def broadcast(self, address: str, raw_tx) -> str:
+        """Send a signed tx, resyncing the sender's nonce if the send fails"""
+        try:
+            tx_hash = Web3.to_hex(await self.web3.eth.send_raw_transaction(raw_tx))
+        except Exception:
+            # The nonce may or may not have been consumed - ask the node again
+            nonce_manager.resync(address)
+            raise
+        nonce_manager.track(tx_hash, address)
+        return tx_hash
+
+    async def submit(self, wallet, call, gas: int = None, value: int = 0) -> PendingTx:
+        """Build, sign and broadcast a call; the receipt future runs in the background"""
+        address = checksum(wallet.address)
+        try:
+            tx = await self.build(address, call, gas=gas, value=value)
+        except Exception:
+            # Gas estimation / call encoding failed - the nonce was never used
+            nonce_manager.resync(address)
+            raise
+        signed = wallet.sign_transaction(tx)
+        tx_hash = await self.broadcast(address, _raw_transaction(signed))
+
+        return PendingTx(self.web3, tx_hash)
+
+    async def send(self, wallet, call, gas: int = None, value: int = 0):
+        """Submit a call and wait for its receipt"""
+        pending = await self.submit(wallet, call, gas=gas, value=value)
+        return await pending.wait()
@@ -0,0 +1,178 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEMPO BOT v2.0.1 - RPC PROVIDER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import asyncio
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from web3 import AsyncWeb3, AsyncHTTPProvider
+from config import CONFIG
+from utils.ratelimit import SEND_METHODS, RateLimiter, request_kind
+from utils.resilience import RATE_LIMITED, CircuitBreaker, classify_error, is_endpoint_error, retry_policy
+
+def pool_size() -> int:
+    """Connections per endpoint: enough for every concurrent wallet"""
+    return max(CONFIG['RPC_POOL_SIZE'], CONFIG['AUTO_CONCURRENCY'] * 4)
+
+class PooledHTTPProvider(AsyncHTTPProvider):
+    """AsyncHTTPProvider on a keep-alive aiohttp session with a sized pool.
+
+    web3's default session closes the connection after every request; this
+    one keeps up to `pool_size()` connections open, so requests skip the
+    TCP+TLS handshake. The session is created on the first request, inside
+    the running event loop.
+
+    Every request waits for the endpoint's rate limiter (utils/ratelimit.py)
+    and goes through its circuit breaker; reads that fail transiently are
+    retried with jittered exponential backoff (utils/resilience.py). Sends
+    are never retried here.
+    """
+
+    def __init__(self, endpoint_uri: str, **kwargs):
+        super().__init__(endpoint_uri, **kwargs)
+        self._session_ready = None
+        self.breaker = CircuitBreaker(endpoint_uri)
+        self.limiter = RateLimiter()
+        if hasattr(self, 'exception_retry_configuration'):
+            # Retries are handled by the shared retry policy instead
+            self.exception_retry_configuration = None
+
+    def _new_session(self) -> ClientSession:
+        return ClientSession(
+            raise_for_status=True,
+            timeout=ClientTimeout(total=CONFIG['RPC_TIMEOUT']),
+            connector=TCPConnector(
+                limit=pool_size(),
+                limit_per_host=pool_size(),
+                keepalive_timeout=CONFIG['RPC_KEEPALIVE'],
+                ttl_dns_cache=300
+            )
+        )
+
+    async def _ensure_session(self):
+        if self._session_ready is None:
+            self._session_ready = asyncio.ensure_future(self.cache_async_session(self._new_session()))
+        await self._session_ready
+
+    async def _raw_request(self, method, params):
+        await self._ensure_session()
+        return await AsyncHTTPProvider.make_request(self, method, params)
+
+    async def _raw_batch(self, requests):
+        await self._ensure_session()
+        return await AsyncHTTPProvider.make_batch_request(self, requests)
+
+    async def _attempt(self, send, kind: str, cost: int = 1):
+        """One request through this endpoint's rate limiter and circuit breaker"""
+        probe = self.breaker.check()
+        try:
+            async with self.limiter.slot(kind, cost):
+                try:
+                    response = await send()
+                except Exception as error:
+                    if classify_error(error) == RATE_LIMITED:
+                        self.limiter.on_rate_limited(kind)
+                    if is_endpoint_error(error):
+                        self.breaker.record_failure()
+                    else:
+                        self.breaker.record_success()
+                    raise
+        finally:
+            if probe:
+                # Cancelled (CancelledError is no Exception) - free the probe
+                self.breaker.release()
+        if _rate_limited(response):
+            # Some nodes answer 200 with a JSON-RPC "limit exceeded" error
+            self.limiter.on_rate_limited(kind)
+        else:
+            self.limiter.on_success(kind)
+        self.breaker.record_success()
+        return response
+
+    async def _dispatch(self, methods: set, call, cost: int = 1):
+        """One attempt of `call(provider)`; RoutingProvider picks the endpoint"""
+        return await self._attempt(lambda: call(self), request_kind(methods), cost)
+
+    async def make_request(self, method, params):
+        return await retry_policy.run(
+            lambda: self._dispatch({method}, lambda p: p._raw_request(method, params)),
+            retry=method not in SEND_METHODS
+        )
+
+    if hasattr(AsyncHTTPProvider, 'make_batch_request'):
+        async def make_batch_request(self, requests):
+            methods = {method for method, _ in requests}
+            return await retry_policy.run(
+                lambda: self._dispatch(methods, lambda p: p._raw_batch(requests), len(requests)),
+                retry=not methods & SEND_METHODS
+            )
+
+    async def close(self):
+        """Close the pooled session"""
+        if self._session_ready is not None and self._session_ready.done():
+            session = self._session_ready.result()
+            if not session.closed:
+                await session.close()
+        self._session_ready = None
+
+def _rate_limited(response) -> bool:
+    if isinstance(response, list):
+        return any(_rate_limited(r) for r in response)
+    error = response.get('error') if isinstance(response, dict) else None
+    return bool(error) and classify_error(Exception(str(error))) == RATE_LIMITED
+
+_clients = {}
+
+def create_web3(rpc_url: str = None) -> AsyncWeb3:
+    """Async web3 client for the Tempo RPC, shared process-wide per endpoint.
+
+    Every eth/contract call on it is awaitable, so RPC round trips and
+    receipt waits yield to the event loop instead of blocking it. All modules
+    get the same client (and its connection pool, receipt watcher and
+    multicall reader) for the same URL. Without an explicit URL and with
+    several `RPC_URLS` configured, the client routes over all of them.
+    """
+    urls = [rpc_url] if rpc_url else (CONFIG['RPC_URLS'] or [CONFIG['RPC_URL']])
+    key = ' '.join(urls)
+    web3 = _clients.get(key)
+    if web3 is None:
+        if len(urls) > 1:
+            from utils.router import RoutingProvider
+            provider = RoutingProvider(urls)
+        else:
+            provider = PooledHTTPProvider(urls[0])
+        web3 = _clients[key] = AsyncWeb3(provider)
+    return web3
+
+async def close_web3_clients():
+    """Close the pooled sessions of every shared client"""
+    for web3 in list(_clients.values()):
+        await web3.provider.close()
+    _clients.clear()
+
+async def rpc_request(web3, method: str, params: list):
+    """Raw JSON-RPC request for methods web3 has no wrapper for"""
+    return await web3.manager.coro_request(method, params)
+
+def _result(response):
+    """Unwrap a raw JSON-RPC response; failed entries become None"""
+    if isinstance(response, dict) and 'error' not in response:
+        return response.get('result')
+    return None
+
+async def rpc_batch(web3, requests: list) -> list:
+    """Send several (method, params) calls in one JSON-RPC batch.
+
+    Results come back in request order, None for entries the node rejected.
+    Providers without batch support get the calls concurrently instead.
+    """
+    if not requests:
+        return []
+    provider = web3.provider
+    if hasattr(provider, 'make_batch_request'):
+        responses = await provider.make_batch_request(requests)
+        if not isinstance(responses, list):
+            # The whole batch was rejected (rate limit, 5xx, ...)
+            raise Exception(f"RPC batch failed: {responses.get('error', responses)}")
+        return [_result(r) for r in responses]
+    responses = await asyncio.gather(*(provider.make_request(method, params) for method, params in requests))
+    return [_result(r) for r in responses]
@@ -0,0 +1,116 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEMPO BOT v2.0.1 - CLIENT-SIDE RPC RATE LIMITER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from config import CONFIG
+
+READ = 'read'
+SEND = 'send'
+RECEIPT = 'receipt'
+
+SEND_METHODS = {'eth_sendRawTransaction', 'eth_sendTransaction', 'tempo_fundAddress'}
+RECEIPT_METHODS = {'eth_getTransactionReceipt'}
+
+# Slowest a bucket is ever throttled to, as a share of its configured rate
+MIN_RATE_FRACTION = 0.05
+# Consecutive 429s within this window count as one congestion signal
+DECREASE_COOLDOWN = 1.0
+
+def request_kind(methods) -> str:
+    """Budget a request (or batch) of these methods is charged to"""
+    if methods & SEND_METHODS:
+        return SEND
+    if methods <= RECEIPT_METHODS:
+        return RECEIPT
+    return READ
+
+class TokenBucket:
+    """Requests/second budget with AIMD adaptation.
+
+    Holds up to one second's worth of tokens. A request may take more tokens
+    than are left (a large batch), leaving the bucket in debt so the average
+    rate still holds. `decrease()` halves the rate on a 429; every success
+    then adds back a small fraction of the configured rate.
+    """
+
+    def __init__(self, rate: float):
+        self.max_rate = rate
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self._last_decrease = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, cost: int = 1):
+        while True:
+            self._refill()
+            if self.tokens >= min(cost, self.rate):
+                self.tokens -= cost
+                return
+            await asyncio.sleep((min(cost, self.rate) - self.tokens) / self.rate)
+
+    def increase(self):
+        self.rate = min(self.max_rate, self.rate + self.max_rate * CONFIG['RPC_RATE_RECOVERY'])
+
+    def decrease(self):
+        now = time.monotonic()
+        if now - self._last_decrease < DECREASE_COOLDOWN:
+            return
+        self._last_decrease = now
+        self.rate = max(self.max_rate * MIN_RATE_FRACTION, self.rate * CONFIG['RPC_RATE_BACKOFF'])
+        self.tokens = min(self.tokens, 0)
+
+class RateLimiter:
+    """Per-endpoint request budgets shared by every worker.
+
+    Reads, sends and receipt polls each draw from their own token bucket, so
+    a burst of balance checks cannot starve transactions, and at most
+    `RPC_MAX_IN_FLIGHT` requests are outstanding at once.
+    """
+
+    def __init__(self):
+        self.buckets = {
+            READ: TokenBucket(CONFIG['RPC_READ_RATE']),
+            SEND: TokenBucket(CONFIG['RPC_SEND_RATE']),
+            RECEIPT: TokenBucket(CONFIG['RPC_RECEIPT_RATE'])
+        }
+        self.max_in_flight = CONFIG['RPC_MAX_IN_FLIGHT']
+        self.in_flight = 0
+        self.throttled = 0
+        self._slots = None
+
+    @asynccontextmanager
+    async def slot(self, kind: str, cost: int = 1):
+        """Wait for budget and an in-flight slot for one request"""
+        if self._slots is None:
+            # Created inside the running loop
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+        await self.buckets[kind].acquire(cost)
+        async with self._slots:
+            self.in_flight += 1
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+
+    def on_success(self, kind: str):
+        self.buckets[kind].increase()
+
+    def on_rate_limited(self, kind: str):
+        self.throttled += 1
+        self.buckets[kind].decrease()
+
+    def metrics(self) -> dict:
+        """Current rates (req/s) and counters"""
+        return {
+            'rates': {kind: round(bucket.rate, 2) for kind, bucket in self.buckets.items()},
+            'in_flight': self.in_flight,
+            'throttled': self.throttled
+        }
@@ -0,0 +1,126 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEMPO BOT v2.0.1 - RECEIPT WATCHER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import asyncio
+import time
+import weakref
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted
+from config import CONFIG
+from utils.cache import read_cache
+from utils.fees import fee_oracle
+from utils.nonce import nonce_manager, tx_key
+from utils.provider import rpc_batch
+from utils.resilience import backoff_seconds
+
+try:
+    from web3._utils.method_formatters import receipt_formatter
+except ImportError:
+    receipt_formatter = None
+
+class ReceiptWatcher:
+    """Single background poller for every pending tx of one web3 client.
+
+    Once per new block all pending hashes are checked with one JSON-RPC batch
+    of `eth_getTransactionReceipt`, so polling cost follows the block rate
+    rather than the number of txs in flight.
+    """
+
+    def __init__(self, web3, poll_interval: float = None, timeout: float = None):
+        self.web3 = web3
+        self.poll_interval = poll_interval or CONFIG['RECEIPT_POLL_INTERVAL']
+        self.timeout = timeout or CONFIG['RECEIPT_TIMEOUT']
+        self._waiters = {}
+        self._task = None
+        self._last_block = None
+
+    def watch(self, tx_hash) -> asyncio.Future:
+        """Future resolved with the receipt of a tx"""
+        key = tx_key(tx_hash)
+        if key in self._waiters:
+            return self._waiters[key][0]
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[key] = (future, time.monotonic() + self.timeout)
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        return future
+
+    async def wait(self, tx_hash):
+        """Wait for the receipt of a tx"""
+        return await self.watch(tx_hash)
+
+    async def _run(self):
+        errors = 0
+        while self._waiters:
+            try:
+                block = await self.web3.eth.block_number
+                if block != self._last_block:
+                    fee_oracle.on_new_block(block)
+                    read_cache.on_new_block(block)
+                    await self._poll()
+                    # Only after a successful poll, so a failed one is repeated
+                    self._last_block = block
+                errors = 0
+            except Exception as error:
+                # The txs are most likely still pending: keep polling, each
+                # one fails at its own deadline (see _expire)
+                errors += 1
+                wait_time = backoff_seconds(errors)
+                print(f"\033[1m\033[33m⚠️ RPC error while waiting for TX, retry in {wait_time}s... ({str(error)[:60]})\033[0m")
+                self._expire()
+                await asyncio.sleep(wait_time)
+                continue
+            self._expire()
+            await asyncio.sleep(self.poll_interval)
+
+    async def _poll(self):
+        keys = list(self._waiters)
+        results = await rpc_batch(self.web3, [('eth_getTransactionReceipt', [key]) for key in keys])
+        for key, raw in zip(keys, results):
+            if not raw:
+                continue
+            try:
+                receipt = await self._format(key, raw)
+            except Exception as error:
+                # Mined, so the nonce is used - only this waiter fails
+                nonce_manager.settle(key)
+                self._reject(key, error)
+                continue
+            self._resolve(key, receipt)
+
+    async def _format(self, key, raw):
+        if receipt_formatter is None:
+            return await self.web3.eth.get_transaction_receipt(key)
+        return AttributeDict.recursive(receipt_formatter(raw))
+
+    def _expire(self):
+        now = time.monotonic()
+        for key, (_, deadline) in list(self._waiters.items()):
+            if now > deadline:
+                # Not mined in time - the tx is considered dropped and the
+                # sender's nonce must be reseeded
+                nonce_manager.mark_dropped(key)
+                self._reject(key, TimeExhausted(
+                    f"Transaction {key} is not in the chain after {self.timeout} seconds"
+                ))
+
+    def _resolve(self, key, receipt):
+        future, _ = self._waiters.pop(key)
+        nonce_manager.settle(key)
+        if not future.done():
+            future.set_result(receipt)
+
+    def _reject(self, key, error):
+        future, _ = self._waiters.pop(key)
+        if not future.done():
+            future.set_exception(error)
+
+_watchers = weakref.WeakKeyDictionary()
+
+def get_receipt_watcher(web3) -> ReceiptWatcher:
+    """Receipt watcher shared by everything using this web3 client"""
+    watcher = _watchers.get(web3)
+    if watcher is None:
+        watcher = _watchers[web3] = ReceiptWatcher(web3)
+    return watcher
@@ -0,0 +1,161 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEMPO BOT v2.0.1 - RETRY POLICY & CIRCUIT BREAKERS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import asyncio
+import random
+import time
+from aiohttp import ClientError, ClientResponseError
+from config import CONFIG
+from utils.nonce import is_nonce_error
+
+# Error classes
+TRANSIENT = 'transient'        # node/network hiccup - retry with backoff
+RATE_LIMITED = 'rate_limited'  # 429 - retry with backoff, slow down
+NONCE = 'nonce'                # stale nonce - rebuild the tx
+FATAL = 'fatal'                # revert, bad params, ... - do not retry
+
+# Fallback for errors that reach us only as text (wrapped by web3 or the node)
+TRANSIENT_FRAGMENTS = [
+    '502', '503', '504', 'Bad Gateway', 'Service Unavailable', 'SERVER_ERROR',
+    'timeout', 'timed out', 'ECONNRESET', 'Connection reset', 'Cannot connect', 'Server disconnected'
+]
+RATE_LIMIT_FRAGMENTS = ['429', 'Too Many Requests', 'rate limit', 'request limit']
+
+class CircuitOpenError(Exception):
+    """Endpoint is shed after repeated failures; fail fast until it is re-probed"""
+
+def classify_error(error) -> str:
+    """Map an exception to one of TRANSIENT / RATE_LIMITED / NONCE / FATAL"""
+    if isinstance(error, CircuitOpenError):
+        return TRANSIENT
+    if isinstance(error, ClientResponseError):
+        if error.status == 429:
+            return RATE_LIMITED
+        if error.status >= 500:
+            return TRANSIENT
+        return FATAL
+    if isinstance(error, (ClientError, asyncio.TimeoutError, ConnectionError)):
+        return TRANSIENT
+    if is_nonce_error(error):
+        return NONCE
+    err_msg = str(error)
+    if any(x.lower() in err_msg.lower() for x in RATE_LIMIT_FRAGMENTS):
+        return RATE_LIMITED
+    if any(x.lower() in err_msg.lower() for x in TRANSIENT_FRAGMENTS):
+        return TRANSIENT
+    return FATAL
+
+def is_transient_error(error) -> bool:
+    """Worth retrying the same request later"""
+    return classify_error(error) in (TRANSIENT, RATE_LIMITED)
+
+def is_endpoint_error(error) -> bool:
+    """The node (not the request) failed - counts against its circuit breaker"""
+    if isinstance(error, ClientResponseError):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, (ClientError, asyncio.TimeoutError, ConnectionError))
+
+class RetryPolicy:
+    """Exponential backoff with full jitter"""
+
+    def __init__(self, max_attempts: int = None, base_delay: float = None, max_delay: float = None):
+        self.max_attempts = max_attempts or CONFIG['RETRY_MAX_ATTEMPTS']
+        self.base_delay = base_delay or CONFIG['RETRY_BASE_DELAY']
+        self.max_delay = max_delay or CONFIG['RETRY_MAX_DELAY']
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number `attempt` (1-based)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    async def run(self, fn, retry: bool = True):
+        """Await fn() and retry transient failures.
+
+        An open circuit is never waited out: it fails fast, surfacing the
+        error that tripped it when there is one.
+        """
+        attempt = 0
+        last_error = None
+        while True:
+            try:
+                return await fn()
+            except CircuitOpenError:
+                if last_error is not None:
+                    raise last_error
+                raise
+            except Exception as error:
+                last_error = error
+                attempt += 1
+                if not retry or attempt >= self.max_attempts or not is_transient_error(error):
+                    raise
+                await asyncio.sleep(self.delay(attempt))
+
+class CircuitBreaker:
+    """Closed -> open after `threshold` consecutive failures -> half-open.
+
+    While open every request fails fast with CircuitOpenError. After the
+    reset timeout one request is let through as a probe: success closes the
+    circuit, failure reopens it with a doubled timeout.
+    """
+
+    def __init__(self, name: str, threshold: int = None, reset_timeout: float = None, max_reset_timeout: float = None):
+        self.name = name
+        self.threshold = threshold or CONFIG['CIRCUIT_FAILURE_THRESHOLD']
+        self.reset_timeout = reset_timeout or CONFIG['CIRCUIT_RESET_SECONDS']
+        self.max_reset_timeout = max_reset_timeout or CONFIG['CIRCUIT_MAX_RESET_SECONDS']
+        self.failures = 0
+        self.opens = 0
+        self.open_until = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opens == 0:
+            return 'closed'
+        return 'open' if time.monotonic() < self.open_until else 'half-open'
+
+    def available(self) -> bool:
+        """Would a request be let through now (without claiming the probe)"""
+        state = self.state
+        return state == 'closed' or (state == 'half-open' and not self._probing)
+
+    def check(self) -> bool:
+        """Raise CircuitOpenError unless a request may go out.
+
+        Returns True when the request is the half-open probe; its caller
+        must `release()` it if the request ends without an outcome.
+        """
+        state = self.state
+        if state == 'closed':
+            return False
+        if state == 'half-open' and not self._probing:
+            self._probing = True
+            return True
+        raise CircuitOpenError(f'RPC endpoint {self.name} unavailable (circuit open)')
+
+    def release(self):
+        """Let another request probe (the probe was cancelled)"""
+        self._probing = False
+
+    def record_success(self):
+        self.failures = 0
+        self.opens = 0
+        self._probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self._probing or self.failures >= self.threshold:
+            self.opens += 1
+            timeout = min(self.reset_timeout * 2 ** (self.opens - 1), self.max_reset_timeout)
+            self.open_until = time.monotonic() + timeout
+            self.failures = 0
+        self._probing = False
+
+# Per-request retries inside the provider
+retry_policy = RetryPolicy()
+# Whole-operation retries in the modules (rebuild and resend a tx, ...)
+tx_retry_policy = RetryPolicy(base_delay=CONFIG['TX_RETRY_BASE_DELAY'], max_delay=CONFIG['TX_RETRY_MAX_DELAY'])
+
+def backoff_seconds(attempt: int) -> int:
+    """Whole seconds to wait before operation retry number `attempt`"""
+    return max(1, round(tx_retry_policy.delay(attempt)))
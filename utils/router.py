@@ -0,0 +1,115 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEMPO BOT v2.0.1 - MULTI-ENDPOINT RPC ROUTER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import random
+import time
+from config import CONFIG
+from utils.provider import PooledHTTPProvider
+from utils.ratelimit import SEND_METHODS, request_kind
+from utils.resilience import CircuitOpenError, is_endpoint_error
+
+# Methods that must always reach the same node: a tx, and the nonce it was
+# built from, have to be seen by one mempool
+PINNED_METHODS = SEND_METHODS | {'eth_getTransactionCount'}
+
+# Latency assumed for an endpoint until it has served a request
+DEFAULT_LATENCY = 0.2
+
+class Endpoint:
+    """One RPC node with its rolling latency and health"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.provider = PooledHTTPProvider(url)
+        self.latency = None
+        self.error_rate = 0.0
+
+    @property
+    def breaker(self):
+        return self.provider.breaker
+
+    def healthy(self) -> bool:
+        return self.breaker.available()
+
+    def record_success(self, elapsed: float):
+        alpha = CONFIG['RPC_EWMA_ALPHA']
+        self.latency = elapsed if self.latency is None else (1 - alpha) * self.latency + alpha * elapsed
+        self.error_rate *= 1 - alpha
+
+    def record_failure(self):
+        alpha = CONFIG['RPC_EWMA_ALPHA']
+        self.error_rate = (1 - alpha) * self.error_rate + alpha
+
+    def weight(self) -> float:
+        latency = self.latency if self.latency is not None else DEFAULT_LATENCY
+        return (1 - self.error_rate) / max(latency, 0.001)
+
+class RoutingProvider(PooledHTTPProvider):
+    """Routes requests over several RPC endpoints.
+
+    Reads go to a healthy endpoint picked with probability proportional to
+    1/latency (rolling average). Sends and nonce reads stay pinned to one
+    endpoint until it fails. A failing endpoint trips its circuit breaker and
+    the request fails over to the next one at once; the shared retry policy
+    wraps the whole routed attempt.
+    """
+
+    def __init__(self, urls: list):
+        super().__init__(urls[0])
+        self.endpoints = [Endpoint(url) for url in urls]
+        self._pinned = self.endpoints[0]
+
+    def _candidates(self, pinned: bool) -> list:
+        """Endpoints in the order to try them"""
+        healthy = [e for e in self.endpoints if e.healthy()]
+        if pinned:
+            if self._pinned not in healthy and healthy:
+                self._pinned = healthy[0]
+            return [self._pinned] + [e for e in healthy if e is not self._pinned]
+        order = []
+        while healthy:
+            choice = random.choices(healthy, weights=[e.weight() for e in healthy])[0]
+            order.append(choice)
+            healthy.remove(choice)
+        return order
+
+    async def _dispatch(self, methods: set, call, cost: int = 1):
+        kind = request_kind(methods)
+        pinned = bool(methods & PINNED_METHODS)
+        last_error = CircuitOpenError('All RPC endpoints unavailable (circuits open)')
+        for endpoint in self._candidates(pinned):
+            provider = endpoint.provider
+            started = time.monotonic()
+            try:
+                response = await provider._attempt(lambda: call(provider), kind, cost)
+            except CircuitOpenError as error:
+                last_error = error
+                continue
+            except Exception as error:
+                if not is_endpoint_error(error):
+                    raise
+                endpoint.record_failure()
+                last_error = error
+                continue
+            endpoint.record_success(time.monotonic() - started)
+            if pinned:
+                # Later sends follow to the node that took this one
+                self._pinned = endpoint
+            return response
+        raise last_error
+
+    async def close(self):
+        for endpoint in self.endpoints:
+            await endpoint.provider.close()
+
+    def status(self) -> list:
+        """Per-endpoint latency/health snapshot"""
+        return [{
+            'url': e.url,
+            'latency': e.latency,
+            'error_rate': e.error_rate,
+            'circuit': e.breaker.state,
+            'limits': e.provider.limiter.metrics(),
+            'pinned': e is self._pinned
+        } for e in self.endpoints]
@@ -2,245 +2,643 @@
 # WALLET STATISTICS DATABASE
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import asyncio
 import sqlite3
 import os
 import json
+import time
+import queue
+import atexit
+import threading
+from collections import OrderedDict, namedtuple
 from datetime import datetime
 from typing import Optional, Dict, List
+from config import CONFIG
+from utils.nonce import tx_key
+
+COUNTER_MAP = {
+    'token_deploy': 'tokens_deployed',
+    'token_mint': 'tokens_minted',
+    'token_burn': 'tokens_burned',
+    'token_transfer': 'tokens_transferred',
+    'token_transfer_memo': 'tokens_transferred',
+    'swap_exact_in': 'swaps_total',
+    'swap_exact_out': 'swaps_total',
+    'liquidity_add': 'liquidity_added',
+    'liquidity_remove': 'liquidity_removed',
+    'order_place': 'orders_placed',
+    'order_cancel': 'orders_cancelled',
+    'nft_mint': 'nfts_minted',
+    'nft_transfer': 'nfts_transferred',
+    'batch_approve_swap': 'batch_operations',
+    'batch_multiple_swaps': 'batch_operations',
+    'batch_multiple_transfers': 'batch_operations',
+    'policy_create': 'policies_created',
+    'policy_attach': 'policies_created',
+    'whitelist_set': 'whitelists_set',
+    'blacklist_set': 'blacklists_set',
+    'faucet_claim': 'faucet_claims'
+}
+
+def _counter_columns(tx_type: str, status: str) -> List[str]:
+    """activity_counters columns bumped by one transaction"""
+    column = COUNTER_MAP.get(tx_type)
+    if not column:
+        return []
+    if tx_type.startswith('swap_'):
+        return [column, 'swaps_successful' if status == 'success' else 'swaps_failed']
+    return [column]
+
+# Schema migrations: version -> statements, applied in order inside one
+# transaction each. Version 1 is the original schema (existing databases
+# already have it, hence IF NOT EXISTS).
+MIGRATIONS = {
+    1: [
+        '''
+        CREATE TABLE IF NOT EXISTS wallets (
+            address TEXT PRIMARY KEY,
+            wallet_index INTEGER,
+            first_activity TEXT,
+            last_activity TEXT,
+            total_transactions INTEGER DEFAULT 0,
+            total_gas_used TEXT DEFAULT '0',
+            status TEXT DEFAULT 'active'
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS activity_counters (
+            address TEXT PRIMARY KEY,
+            tokens_deployed INTEGER DEFAULT 0,
+            tokens_minted INTEGER DEFAULT 0,
+            tokens_burned INTEGER DEFAULT 0,
+            tokens_transferred INTEGER DEFAULT 0,
+            swaps_total INTEGER DEFAULT 0,
+            swaps_successful INTEGER DEFAULT 0,
+            swaps_failed INTEGER DEFAULT 0,
+            liquidity_added INTEGER DEFAULT 0,
+            liquidity_removed INTEGER DEFAULT 0,
+            orders_placed INTEGER DEFAULT 0,
+            orders_cancelled INTEGER DEFAULT 0,
+            nfts_minted INTEGER DEFAULT 0,
+            nfts_transferred INTEGER DEFAULT 0,
+            batch_operations INTEGER DEFAULT 0,
+            policies_created INTEGER DEFAULT 0,
+            whitelists_set INTEGER DEFAULT 0,
+            blacklists_set INTEGER DEFAULT 0,
+            faucet_claims INTEGER DEFAULT 0,
+            FOREIGN KEY (address) REFERENCES wallets(address)
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS transactions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            address TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            type TEXT NOT NULL,
+            tx_hash TEXT,
+            block_number INTEGER,
+            gas_used TEXT,
+            status TEXT,
+            details TEXT,
+            FOREIGN KEY (address) REFERENCES wallets(address)
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_transactions_address ON transactions(address)',
+        'CREATE INDEX IF NOT EXISTS idx_transactions_type ON transactions(type)',
+        'CREATE INDEX IF NOT EXISTS idx_transactions_timestamp ON transactions(timestamp)',
+        # Per-day activity rollups, maintained with every write batch
+        '''
+        CREATE TABLE IF NOT EXISTS activity_rollups (
+            address TEXT NOT NULL,
+            day TEXT NOT NULL,
+            type TEXT NOT NULL,
+            status TEXT NOT NULL,
+            tx_count INTEGER NOT NULL DEFAULT 0,
+            gas_used INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (address, day, type, status)
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_rollups_day_type ON activity_rollups(day, type)'
+    ],
+    # Integer gas and epoch-second timestamps (local ISO text before), plus
+    # composite indexes for per-wallet history and top-N queries
+    2: [
+        '''
+        CREATE TABLE wallets_new (
+            address TEXT PRIMARY KEY,
+            wallet_index INTEGER,
+            first_activity INTEGER,
+            last_activity INTEGER,
+            total_transactions INTEGER NOT NULL DEFAULT 0,
+            total_gas_used INTEGER NOT NULL DEFAULT 0,
+            status TEXT DEFAULT 'active'
+        )
+        ''',
+        '''
+        INSERT INTO wallets_new
+        SELECT address, wallet_index,
+               CAST(strftime('%s', first_activity, 'utc') AS INTEGER),
+               CAST(strftime('%s', last_activity, 'utc') AS INTEGER),
+               COALESCE(total_transactions, 0), COALESCE(CAST(total_gas_used AS INTEGER), 0), status
+        FROM wallets
+        ''',
+        'DROP TABLE wallets',
+        'ALTER TABLE wallets_new RENAME TO wallets',
+        '''
+        CREATE TABLE transactions_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            address TEXT NOT NULL,
+            timestamp INTEGER NOT NULL,
+            type TEXT NOT NULL,
+            tx_hash TEXT,
+            block_number INTEGER,
+            gas_used INTEGER NOT NULL DEFAULT 0,
+            status TEXT,
+            details TEXT,
+            FOREIGN KEY (address) REFERENCES wallets(address)
+        )
+        ''',
+        '''
+        INSERT INTO transactions_new
+        SELECT id, address, CAST(strftime('%s', timestamp, 'utc') AS INTEGER), type, tx_hash,
+               block_number, COALESCE(CAST(gas_used AS INTEGER), 0), status, details
+        FROM transactions
+        ''',
+        'DROP TABLE transactions',
+        'ALTER TABLE transactions_new RENAME TO transactions',
+        'CREATE INDEX idx_transactions_address_timestamp ON transactions(address, timestamp)',
+        'CREATE INDEX idx_transactions_type_timestamp ON transactions(type, timestamp)',
+        'CREATE INDEX idx_transactions_timestamp ON transactions(timestamp)',
+        'CREATE INDEX idx_wallets_total_transactions ON wallets(total_transactions)',
+        'CREATE INDEX idx_wallets_total_gas_used ON wallets(total_gas_used)',
+        'CREATE INDEX idx_counters_tokens_deployed ON activity_counters(tokens_deployed)',
+        'CREATE INDEX idx_counters_swaps_total ON activity_counters(swaps_total)'
+    ],
+    # Receipt metadata (block_number already existed but was never filled)
+    3: [
+        'ALTER TABLE transactions ADD COLUMN effective_gas_price INTEGER',
+        'ALTER TABLE transactions ADD COLUMN fee INTEGER',
+        'ALTER TABLE transactions ADD COLUMN fee_token TEXT',
+        'CREATE INDEX idx_transactions_tx_hash ON transactions(tx_hash)'
+    ]
+}
+
+# get_top_wallets sort keys -> indexed column
+TOP_WALLET_COLUMNS = {
+    'total_transactions': 'w.total_transactions',
+    'total_gas_used': 'w.total_gas_used',
+    'tokens_deployed': 'ac.tokens_deployed',
+    'swaps_total': 'ac.swaps_total'
+}
+
+ReceiptMeta = namedtuple('ReceiptMeta', [
+    'tx_hash', 'block_number', 'gas_used', 'effective_gas_price', 'fee', 'fee_token', 'status', 'sender'
+])
+
+def _receipt_int(value) -> Optional[int]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return int(value, 16) if value.startswith('0x') else int(value)
+    return int(value)
+
+def receipt_meta(receipt) -> ReceiptMeta:
+    """Fields stored per transaction, from a formatted or raw JSON-RPC receipt"""
+    gas_used = _receipt_int(receipt.get('gasUsed')) or 0
+    gas_price = _receipt_int(receipt.get('effectiveGasPrice'))
+    fee_token = receipt.get('feeToken')
+    sender = receipt.get('from')
+    return ReceiptMeta(
+        tx_key(receipt['transactionHash']),
+        _receipt_int(receipt.get('blockNumber')),
+        gas_used,
+        gas_price,
+        gas_used * gas_price if gas_price is not None else None,
+        str(fee_token) if fee_token else None,
+        'success' if _receipt_int(receipt.get('status')) == 1 else 'failed',
+        str(sender).lower() if sender else None
+    )
+
+_STOP = object()
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
 
 class WalletStatistics:
-    def __init__(self):
-        db_path = os.path.join('data', 'wallet_stats.db')
+    def __init__(self, db_path: str = None):
+        db_path = db_path or os.path.join('data', 'wallet_stats.db')
 
         # Create data folder if missing
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
 
-        self.db = sqlite3.connect(db_path)
+        # One connection per process, shared by every module (see get_statistics)
+        self.db = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
         self.db.row_factory = sqlite3.Row
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.lock = threading.RLock()
+
+        # Recent receipt metadata by tx hash (see record_receipt)
+        self._receipts = OrderedDict()
+
+        # Token registry change cursor at last sync
+        self._tokens_cursor = 0
+
+        # Write-behind queue drained by a single writer thread
+        self.batch_size = CONFIG['STATS_BATCH_SIZE']
+        self._queue = queue.Queue(maxsize=CONFIG['STATS_QUEUE_SIZE'])
+        self._writer = None
+        self._writer_lock = threading.Lock()
+        self._metrics = {
+            'enqueued': 0,
+            'written': 0,
+            'batches': 0,
+            'errors': 0,
+            'max_depth': 0,
+            'dropped': 0,
+            'blocked': 0,
+            'blocked_seconds': 0.0
+        }
+
         self.init_database()
 
     def init_database(self):
-        """Initialize the database"""
-        # Table: wallets base info
-        self.db.execute('''
-            CREATE TABLE IF NOT EXISTS wallets (
-                address TEXT PRIMARY KEY,
-                wallet_index INTEGER,
-                first_activity TEXT,
-                last_activity TEXT,
-                total_transactions INTEGER DEFAULT 0,
-                total_gas_used TEXT DEFAULT '0',
-                status TEXT DEFAULT 'active'
-            )
-        ''')
-
-        # Table: activity counters
-        self.db.execute('''
-            CREATE TABLE IF NOT EXISTS activity_counters (
-                address TEXT PRIMARY KEY,
-                tokens_deployed INTEGER DEFAULT 0,
-                tokens_minted INTEGER DEFAULT 0,
-                tokens_burned INTEGER DEFAULT 0,
-                tokens_transferred INTEGER DEFAULT 0,
-                swaps_total INTEGER DEFAULT 0,
-                swaps_successful INTEGER DEFAULT 0,
-                swaps_failed INTEGER DEFAULT 0,
-                liquidity_added INTEGER DEFAULT 0,
-                liquidity_removed INTEGER DEFAULT 0,
-                orders_placed INTEGER DEFAULT 0,
-                orders_cancelled INTEGER DEFAULT 0,
-                nfts_minted INTEGER DEFAULT 0,
-                nfts_transferred INTEGER DEFAULT 0,
-                batch_operations INTEGER DEFAULT 0,
-                policies_created INTEGER DEFAULT 0,
-                whitelists_set INTEGER DEFAULT 0,
-                blacklists_set INTEGER DEFAULT 0,
-                faucet_claims INTEGER DEFAULT 0,
-                FOREIGN KEY (address) REFERENCES wallets(address)
-            )
-        ''')
-
-        # Table: transaction history
-        self.db.execute('''
-            CREATE TABLE IF NOT EXISTS transactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                address TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                type TEXT NOT NULL,
-                tx_hash TEXT,
-                block_number INTEGER,
-                gas_used TEXT,
-                status TEXT,
-                details TEXT,
-                FOREIGN KEY (address) REFERENCES wallets(address)
-            )
-        ''')
-
-        # Indexes for faster lookup
-        self.db.execute('CREATE INDEX IF NOT EXISTS idx_transactions_address ON transactions(address)')
-        self.db.execute('CREATE INDEX IF NOT EXISTS idx_transactions_type ON transactions(type)')
-        self.db.execute('CREATE INDEX IF NOT EXISTS idx_transactions_timestamp ON transactions(timestamp)')
-
-        self.db.commit()
+        """Create or upgrade the schema (versioned by PRAGMA user_version)"""
+        version = self.db.execute('PRAGMA user_version').fetchone()[0]
+        for target in sorted(MIGRATIONS):
+            if target <= version:
+                continue
+            self.db.execute('BEGIN')
+            try:
+                for statement in MIGRATIONS[target]:
+                    self.db.execute(statement)
+                self.db.execute(f'PRAGMA user_version = {target}')
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
+
+        # Databases from before rollups existed get them built once
+        if (self.db.execute('SELECT 1 FROM activity_rollups LIMIT 1').fetchone() is None
+                and self.db.execute('SELECT 1 FROM transactions LIMIT 1').fetchone() is not None):
+            self.rebuild_rollups()
+
+    def flush(self):
+        """Wait until every queued record is written.
+
+        Must not be called while holding `self.lock`: the writer thread
+        needs it to drain the queue.
+        """
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.join()
 
     def init_wallet(self, address: str, wallet_index: int = 0):
         """Initialize wallet rows"""
-        now = datetime.now().isoformat()
-
-        self.db.execute('''
-            INSERT OR IGNORE INTO wallets (address, wallet_index, first_activity, last_activity)
-            VALUES (?, ?, ?, ?)
-        ''', (address, wallet_index, now, now))
+        now = int(time.time())
 
-        self.db.execute('''
-            INSERT OR IGNORE INTO activity_counters (address)
-            VALUES (?)
-        ''', (address,))
+        with self.lock:
+            self.db.execute('''
+                INSERT OR IGNORE INTO wallets (address, wallet_index, first_activity, last_activity)
+                VALUES (?, ?, ?, ?)
+            ''', (address, wallet_index, now, now))
 
-        self.db.commit()
+            self.db.execute('''
+                INSERT OR IGNORE INTO activity_counters (address)
+                VALUES (?)
+            ''', (address,))
+            self.db.commit()
 
     def record_transaction(self, address: str, tx_type: str, tx_hash: str,
                           gas_used: str, status: str, details: Optional[Dict] = None):
-        """Record a transaction"""
-        self.init_wallet(address)
-
-        now = datetime.now().isoformat()
-        details_json = json.dumps(details or {})
-
-        self.db.execute('''
-            INSERT INTO transactions (address, timestamp, type, tx_hash, gas_used, status, details)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (address, now, tx_type, tx_hash, gas_used or '0', status, details_json))
-
-        self.update_counters(address, tx_type, status)
-
-        self.update_wallet_info(address, gas_used)
-
-        self.db.commit()
-
-    def update_counters(self, address: str, tx_type: str, status: str):
-        """Update activity counters"""
-        counter_map = {
-            'token_deploy': 'tokens_deployed',
-            'token_mint': 'tokens_minted',
-            'token_burn': 'tokens_burned',
-            'token_transfer': 'tokens_transferred',
-            'token_transfer_memo': 'tokens_transferred',
-            'swap_exact_in': 'swaps_total',
-            'swap_exact_out': 'swaps_total',
-            'liquidity_add': 'liquidity_added',
-            'liquidity_remove': 'liquidity_removed',
-            'order_place': 'orders_placed',
-            'order_cancel': 'orders_cancelled',
-            'nft_mint': 'nfts_minted',
-            'nft_transfer': 'nfts_transferred',
-            'batch_approve_swap': 'batch_operations',
-            'batch_multiple_swaps': 'batch_operations',
-            'batch_multiple_transfers': 'batch_operations',
-            'policy_create': 'policies_created',
-            'policy_attach': 'policies_created',
-            'whitelist_set': 'whitelists_set',
-            'blacklist_set': 'blacklists_set',
-            'faucet_claim': 'faucet_claims'
-        }
-
-        column = counter_map.get(tx_type)
-        if not column:
-            return
-
-        self.db.execute(f'''
-            UPDATE activity_counters
-            SET {column} = {column} + 1
-            WHERE address = ?
-        ''', (address,))
-
-        if tx_type.startswith('swap_'):
-            swap_column = 'swaps_successful' if status == 'success' else 'swaps_failed'
-            self.db.execute(f'''
-                UPDATE activity_counters
-                SET {swap_column} = {swap_column} + 1
-                WHERE address = ?
-            ''', (address,))
-
-    def update_wallet_info(self, address: str, gas_used: str):
-        """Update aggregate wallet info"""
-        now = datetime.now().isoformat()
-
-        self.db.execute('''
-            UPDATE wallets
-            SET last_activity = ?,
-                total_transactions = total_transactions + 1,
-                total_gas_used = CAST(total_gas_used AS INTEGER) + ?
-            WHERE address = ?
-        ''', (now, int(gas_used or '0'), address))
-
-    def get_wallet_stats(self, address: str):
-        """Get wallet statistics"""
-        wallet = self.db.execute('SELECT * FROM wallets WHERE address = ?', (address,)).fetchone()
-        counters = self.db.execute('SELECT * FROM activity_counters WHERE address = ?', (address,)).fetchone()
-        transactions = self.db.execute('''
-            SELECT * FROM transactions
-            WHERE address = ?
-            ORDER BY timestamp DESC
-            LIMIT 100
-        ''', (address,)).fetchall()
-
-        return {
-            'wallet': dict(wallet) if wallet else None,
-            'counters': dict(counters) if counters else None,
-            'recentTransactions': [
-                {**dict(tx), 'details': json.loads(tx['details'] or '{}')}
-                for tx in transactions
-            ]
-        }
-
-    def sync_tokens_from_file(self):
-        """Sync token count from created_tokens.json into DB"""
+        """Queue a transaction record; the writer thread stores it"""
+        if isinstance(tx_hash, bytes) or (isinstance(tx_hash, str) and tx_hash.startswith('0x')):
+            tx_hash = tx_key(tx_hash)
+        self._enqueue((
+            address,
+            int(time.time()),
+            tx_type,
+            tx_hash,
+            int(gas_used or 0),
+            status,
+            json.dumps(details or {})
+        ))
+
+    def record_receipt(self, receipt):
+        """Queue receipt metadata (block, gas price, fee, status) for its transaction.
+
+        The transaction row may be recorded before or after the receipt
+        arrives; either order ends up with the metadata stored.
+        """
+        self._enqueue(receipt_meta(receipt))
+
+    def _enqueue(self, item):
+        self._start_writer()
         try:
-            from utils.wallet import load_created_tokens
-            from web3 import Web3
-
-            tokens_data = load_created_tokens()
-
-            for wallet_address, token_list in tokens_data.items():
-                if not token_list:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            if _on_event_loop():
+                # Never stall every wallet's coroutines on a slow disk
+                self._metrics['dropped'] += 1
+                return
+            # Backpressure: a worker thread waits for the writer to catch up
+            started = time.monotonic()
+            self._queue.put(item)
+            self._metrics['blocked'] += 1
+            self._metrics['blocked_seconds'] += time.monotonic() - started
+        self._metrics['enqueued'] += 1
+        self._metrics['max_depth'] = max(self._metrics['max_depth'], self._queue.qsize())
+
+    def metrics(self) -> Dict:
+        """Write-behind queue counters"""
+        return {**self._metrics, 'depth': self._queue.qsize()}
+
+    def _start_writer(self):
+        if self._writer is not None and self._writer.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._writer_loop, name='stats-writer', daemon=True)
+                self._writer.start()
+
+    def _writer_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = _STOP in batch
+            records = [r for r in batch if r is not _STOP and not isinstance(r, ReceiptMeta)]
+            receipts = [r for r in batch if isinstance(r, ReceiptMeta)]
+            try:
+                if records or receipts:
+                    self._write_batch(records, receipts)
+            except Exception as error:
+                self._metrics['errors'] += 1
+                print(f"\033[1m\033[33m⚠️ Statistics write failed ({len(records)} records): {error}\033[0m")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _write_batch(self, records: List[tuple], receipts: List[ReceiptMeta] = ()):
+        """Store a batch of queued records and receipt metadata in one transaction"""
+        # Receipts seen recently are kept so rows recorded after them still get their metadata
+        for meta in receipts:
+            self._receipts[meta.tx_hash] = meta
+            self._receipts.move_to_end(meta.tx_hash)
+        while len(self._receipts) > self._queue.maxsize:
+            self._receipts.popitem(last=False)
+        receipts = list(receipts) + [self._receipts[r[3]] for r in records if r[3] in self._receipts]
+
+        addresses = {(r[0],) for r in records}
+        counters = {}
+        rollups = {}
+        for r in records:
+            for column in _counter_columns(r[2], r[5]):
+                counters.setdefault(column, []).append((r[0],))
+            key = (r[0], datetime.fromtimestamp(r[1]).strftime('%Y-%m-%d'), r[2], r[5] or '')
+            count, gas = rollups.get(key, (0, 0))
+            rollups[key] = (count + 1, gas + r[4])
+
+        with self.lock:
+            # A failed batch must not be committed half-written by the next one
+            try:
+                now = int(time.time())
+                self.db.executemany('''
+                    INSERT OR IGNORE INTO wallets (address, wallet_index, first_activity, last_activity)
+                    VALUES (?, 0, ?, ?)
+                ''', [(a, now, now) for (a,) in addresses])
+                self.db.executemany('INSERT OR IGNORE INTO activity_counters (address) VALUES (?)', addresses)
+
+                self.db.executemany('''
+                    INSERT INTO transactions (address, timestamp, type, tx_hash, gas_used, status, details)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', records)
+
+                for column, rows in counters.items():
+                    self.db.executemany(f'''
+                        UPDATE activity_counters
+                        SET {column} = {column} + 1
+                        WHERE address = ?
+                    ''', rows)
+
+                self.db.executemany('''
+                    UPDATE wallets
+                    SET last_activity = ?,
+                        total_transactions = total_transactions + 1,
+                        total_gas_used = total_gas_used + ?
+                    WHERE address = ?
+                ''', [(r[1], r[4], r[0]) for r in records])
+
+                self.db.executemany('''
+                    INSERT INTO activity_rollups (address, day, type, status, tx_count, gas_used)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (address, day, type, status) DO UPDATE SET
+                        tx_count = tx_count + excluded.tx_count,
+                        gas_used = gas_used + excluded.gas_used
+                ''', [key + value for key, value in rollups.items()])
+
+                self._merge_receipts(receipts)
+
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
+
+        self._metrics['written'] += len(records)
+        self._metrics['batches'] += 1
+
+    def _merge_receipts(self, receipts: List[ReceiptMeta]):
+        """Store receipt metadata on its transaction rows (caller holds the lock).
+
+        When the receipt changes a row's gas or status, wallet totals, swap
+        counters and rollups are moved by the same delta, so they keep
+        matching rebuild_rollups(). Rows of another wallet than the sender
+        (a faucet claim is sent by the faucet) only get the block number.
+        """
+        for meta in receipts:
+            rows = self.db.execute('''
+                SELECT id, address, type, gas_used, status,
+                       date(timestamp, 'unixepoch', 'localtime') AS day
+                FROM transactions
+                WHERE tx_hash = ?
+            ''', (meta.tx_hash,)).fetchall()
+            for row in rows:
+                if meta.sender and row['address'].lower() != meta.sender:
+                    self.db.execute('UPDATE transactions SET block_number = ? WHERE id = ?',
+                                    (meta.block_number, row['id']))
                     continue
+                self.db.execute('''
+                    UPDATE transactions
+                    SET block_number = ?, gas_used = ?, effective_gas_price = ?, fee = ?, fee_token = ?, status = ?
+                    WHERE id = ?
+                ''', meta[1:7] + (row['id'],))
+
+                old_gas, old_status = row['gas_used'] or 0, row['status'] or ''
+                if (old_gas, old_status) == (meta.gas_used, meta.status):
+                    continue
+                address, tx_type = row['address'], row['type']
+                self.db.execute('''
+                    UPDATE wallets
+                    SET total_gas_used = total_gas_used + ?
+                    WHERE address = ?
+                ''', (meta.gas_used - old_gas, address))
+
+                old_key = (address, row['day'], tx_type, old_status)
+                self.db.execute('''
+                    UPDATE activity_rollups
+                    SET tx_count = tx_count - 1, gas_used = gas_used - ?
+                    WHERE address = ? AND day = ? AND type = ? AND status = ?
+                ''', (old_gas,) + old_key)
+                self.db.execute('''
+                    DELETE FROM activity_rollups
+                    WHERE address = ? AND day = ? AND type = ? AND status = ? AND tx_count <= 0
+                ''', old_key)
+                self.db.execute('''
+                    INSERT INTO activity_rollups (address, day, type, status, tx_count, gas_used)
+                    VALUES (?, ?, ?, ?, 1, ?)
+                    ON CONFLICT (address, day, type, status) DO UPDATE SET
+                        tx_count = tx_count + 1,
+                        gas_used = gas_used + excluded.gas_used
+                ''', (address, row['day'], tx_type, meta.status, meta.gas_used))
+
+                old_columns = _counter_columns(tx_type, old_status)
+                new_columns = _counter_columns(tx_type, meta.status)
+                for column in set(old_columns) - set(new_columns):
+                    self.db.execute(f'UPDATE activity_counters SET {column} = {column} - 1 WHERE address = ?', (address,))
+                for column in set(new_columns) - set(old_columns):
+                    self.db.execute(f'UPDATE activity_counters SET {column} = {column} + 1 WHERE address = ?', (address,))
 
-                normalized_address = Web3.to_checksum_address(wallet_address)
-                token_count = len(token_list)
-
-                self.init_wallet(normalized_address)
-
-                current_count = self.db.execute(
-                    'SELECT tokens_deployed FROM activity_counters WHERE address = ?',
-                    (normalized_address,)
-                ).fetchone()
-
-                current_value = dict(current_count)['tokens_deployed'] if current_count else 0
-                new_value = max(current_value, token_count)
+    def sync_tokens_from_file(self):
+        """Sync token counts from the token registry into DB.
 
-                if new_value != current_value:
-                    self.db.execute('''
+        Incremental: only wallets that gained tokens since the last sync
+        (registry change cursor) are written.
+        """
+        # Queries after this point must see every queued record
+        self.flush()
+        try:
+            from utils.token_registry import get_token_registry
+
+            cursor, counts = get_token_registry().wallet_counts_since(self._tokens_cursor)
+            if counts:
+                now = int(time.time())
+                with self.lock:
+                    self.db.executemany('''
+                        INSERT OR IGNORE INTO wallets (address, wallet_index, first_activity, last_activity)
+                        VALUES (?, 0, ?, ?)
+                    ''', [(address, now, now) for address in counts])
+                    self.db.executemany(
+                        'INSERT OR IGNORE INTO activity_counters (address) VALUES (?)',
+                        [(address,) for address in counts]
+                    )
+                    self.db.executemany('''
                         UPDATE activity_counters
-                        SET tokens_deployed = ?
+                        SET tokens_deployed = MAX(tokens_deployed, ?)
                         WHERE address = ?
-                    ''', (new_value, normalized_address))
+                    ''', [(count, address) for address, count in counts.items()])
+                    self.db.commit()
+            self._tokens_cursor = cursor
+        except Exception:
+            pass
 
+    async def backfill_receipts(self, web3, batch_size: int = None) -> Dict:
+        """Fill receipt metadata for recorded transactions that lack it.
+
+        Rows are walked by id and their receipts fetched with one JSON-RPC
+        batch per `batch_size` hashes.
+        """
+        from utils.provider import rpc_batch
+
+        batch_size = batch_size or CONFIG['STATS_BACKFILL_BATCH_SIZE']
+        self.flush()
+        result = {'checked': 0, 'updated': 0, 'missing': 0}
+        last_id = 0
+        while True:
+            with self.lock:
+                rows = self.db.execute('''
+                    SELECT id, tx_hash FROM transactions
+                    WHERE id > ? AND block_number IS NULL AND tx_hash LIKE '0x%' AND length(tx_hash) = 66
+                    ORDER BY id
+                    LIMIT ?
+                ''', (last_id, batch_size)).fetchall()
+            if not rows:
+                return result
+            last_id = rows[-1]['id']
+
+            hashes = list(dict.fromkeys(row['tx_hash'] for row in rows))
+            receipts = await rpc_batch(web3, [('eth_getTransactionReceipt', [h]) for h in hashes])
+            metas = [receipt_meta(r) for r in receipts if r]
+
+            with self.lock:
+                self._merge_receipts(metas)
+                self.db.commit()
+
+            result['checked'] += len(hashes)
+            result['updated'] += len(metas)
+            result['missing'] += len(hashes) - len(metas)
+
+    def rebuild_rollups(self):
+        """Recompute activity_rollups from the full transaction history"""
+        self.flush()
+        with self.lock:
+            self.db.execute('DELETE FROM activity_rollups')
+            self.db.execute('''
+                INSERT INTO activity_rollups (address, day, type, status, tx_count, gas_used)
+                SELECT address, date(timestamp, 'unixepoch', 'localtime'), type, COALESCE(status, ''),
+                       COUNT(*), SUM(gas_used)
+                FROM transactions
+                GROUP BY 1, 2, 3, 4
+            ''')
             self.db.commit()
-        except Exception as e:
-            pass
+
+    def get_daily_activity(self, start_day: str, end_day: str = None,
+                           tx_type: str = None, address: str = None) -> List[Dict]:
+        """Per-day, per-type totals from the rollups (days as YYYY-MM-DD, inclusive)"""
+        self.flush()
+        query = '''
+            SELECT day, type, SUM(tx_count) AS tx_count, SUM(gas_used) AS gas_used,
+                   SUM(CASE WHEN status = 'success' THEN tx_count ELSE 0 END) AS successful,
+                   COUNT(DISTINCT address) AS wallets
+            FROM activity_rollups
+            WHERE day >= ?
+        '''
+        params = [start_day]
+        if end_day:
+            query += ' AND day <= ?'
+            params.append(end_day)
+        if tx_type:
+            query += ' AND type = ?'
+            params.append(tx_type)
+        if address:
+            query += ' AND address = ?'
+            params.append(address)
+        query += ' GROUP BY day, type ORDER BY day, type'
+
+        with self.lock:
+            rows = self.db.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
 
     def get_all_wallets(self):
         """Get all wallets"""
         # Sync tokens from file before querying
         self.sync_tokens_from_file()
 
-        rows = self.db.execute('''
-            SELECT w.*, ac.*
-            FROM wallets w
-            LEFT JOIN activity_counters ac ON w.address = ac.address
-            ORDER BY w.total_transactions DESC
-        ''').fetchall()
+        with self.lock:
+            rows = self.db.execute('''
+                SELECT w.*, ac.*
+                FROM wallets w
+                LEFT JOIN activity_counters ac ON w.address = ac.address
+                ORDER BY w.total_transactions DESC
+            ''').fetchall()
 
         return [dict(row) for row in rows]
 
@@ -249,16 +647,21 @@ class WalletStatistics:
         # Sync tokens from file before querying
         self.sync_tokens_from_file()
 
-        valid_columns = ['total_transactions', 'total_gas_used', 'tokens_deployed', 'swaps_total']
-        column = order_by if order_by in valid_columns else 'total_transactions'
-
-        rows = self.db.execute(f'''
-            SELECT w.*, ac.*
-            FROM wallets w
-            LEFT JOIN activity_counters ac ON w.address = ac.address
-            ORDER BY w.{column} DESC
-            LIMIT ?
-        ''', (limit,)).fetchall()
+        column = TOP_WALLET_COLUMNS.get(order_by, TOP_WALLET_COLUMNS['total_transactions'])
+        # Drive the query from the table holding the sort column so its index
+        # yields the top rows directly
+        if column.startswith('ac.'):
+            source = 'activity_counters ac JOIN wallets w ON w.address = ac.address'
+        else:
+            source = 'wallets w LEFT JOIN activity_counters ac ON w.address = ac.address'
+
+        with self.lock:
+            rows = self.db.execute(f'''
+                SELECT w.*, ac.*
+                FROM {source}
+                ORDER BY {column} DESC
+                LIMIT ?
+            ''', (limit,)).fetchall()
 
         return [dict(row) for row in rows]
 
@@ -267,14 +670,16 @@ class WalletStatistics:
         # Sync tokens from file before querying
         self.sync_tokens_from_file()
 
-        wallet = self.db.execute('SELECT * FROM wallets WHERE address = ?', (address,)).fetchone()
-        counters = self.db.execute('SELECT * FROM activity_counters WHERE address = ?', (address,)).fetchone()
-        transactions = self.db.execute('''
-            SELECT * FROM transactions
-            WHERE address = ?
-            ORDER BY timestamp DESC
-            LIMIT 100
-        ''', (address,)).fetchall()
+        with self.lock:
+            wallet = self.db.execute('SELECT * FROM wallets WHERE address = ?', (address,)).fetchone()
+            counters = self.db.execute('SELECT * FROM activity_counters WHERE address = ?', (address,)).fetchone()
+            # Served in order by idx_transactions_address_timestamp (id is the rowid)
+            transactions = self.db.execute('''
+                SELECT * FROM transactions
+                WHERE address = ?
+                ORDER BY timestamp DESC, id DESC
+                LIMIT 100
+            ''', (address,)).fetchall()
 
         return {
             'wallet': dict(wallet) if wallet else None,
@@ -285,30 +690,35 @@ class WalletStatistics:
             ]
         }
 
+    def export_transactions(self, filename: str, fmt: str = 'csv', addresses: List[str] = None,
+                            tx_type: str = None, start_day: str = None, end_day: str = None) -> int:
+        """Stream filtered transactions to csv/jsonl/parquet; returns rows written"""
+        from utils.export import export_transactions
+        self.flush()
+        return export_transactions(self.db_path, filename, fmt, addresses, tx_type, start_day, end_day)
+
     def export_to_csv(self, address: str, filename: str) -> bool:
         """Export wallet transactions to CSV"""
-        stats = self.get_wallet_stats(address)
-        if not stats['wallet']:
-            return False
-
-        lines = ['Timestamp,Type,TxHash,GasUsed,Status,Details']
-
-        all_tx = self.db.execute('''
-            SELECT * FROM transactions
-            WHERE address = ?
-            ORDER BY timestamp DESC
-        ''', (address,)).fetchall()
-
-        for tx in all_tx:
-            details = json.dumps(json.loads(tx['details'] or '{}')).replace(',', ';')
-            lines.append(f"{tx['timestamp']},{tx['type']},{tx['tx_hash']},{tx['gas_used']},{tx['status']},\"{details}\"")
-
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
-
-        return True
+        return self.export_transactions(filename, 'csv', [address]) > 0
 
     def close(self):
-        """Close database connection"""
-        self.db.close()
+        """Drain the write-behind queue and close the database connection"""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        with self.lock:
+            self.db.close()
+
+_instance = None
+_instance_lock = threading.Lock()
+
+def get_statistics() -> WalletStatistics:
+    """Process-wide statistics store, opened once and flushed at exit"""
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = WalletStatistics()
+                atexit.register(_instance.close)
+    return _instance
 
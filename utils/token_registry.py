@@ -0,0 +1,163 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEMPO BOT v2.0.1 - CREATED TOKEN REGISTRY
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from utils.address import checksum
+
+_script_dir = os.path.dirname(os.path.abspath(__file__))
+_project_root = os.path.dirname(_script_dir)
+REGISTRY_FILE = os.path.join(_project_root, 'data', 'token_registry.db')
+LEGACY_TOKENS_FILE = os.path.join(_project_root, 'data', 'created_tokens.json')
+
+class TokenRegistry:
+    """Created tokens indexed by wallet and by token address.
+
+    Addresses are checksummed once on insert and looked up by their lowercase
+    form, so reads never re-checksum. Each insert gets an increasing id that
+    doubles as a change cursor (see `wallet_counts_since`).
+    """
+
+    def __init__(self, db_path: str = None, legacy_file: str = None):
+        db_path = db_path or REGISTRY_FILE
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self.db = sqlite3.connect(db_path, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.lock = threading.RLock()
+        self.init_database()
+        self._import_legacy(legacy_file or LEGACY_TOKENS_FILE)
+
+    def init_database(self):
+        """Initialize the database"""
+        self.db.execute('''
+            CREATE TABLE IF NOT EXISTS tokens (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                token_key TEXT NOT NULL UNIQUE,
+                wallet_key TEXT NOT NULL,
+                token TEXT NOT NULL,
+                wallet TEXT NOT NULL,
+                symbol TEXT,
+                created_at TEXT
+            )
+        ''')
+        self.db.execute('CREATE INDEX IF NOT EXISTS idx_tokens_wallet ON tokens(wallet_key, id)')
+        self.db.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+        self.db.commit()
+
+    def _import_legacy(self, path: str):
+        """One-time import of data/created_tokens.json"""
+        with self.lock:
+            if self.db.execute("SELECT 1 FROM meta WHERE key = 'legacy_imported'").fetchone():
+                return
+            imported = 0
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                data = {}
+            except (OSError, ValueError) as error:
+                # Leave the flag unset so the import is retried next start
+                print(f"\033[1m\033[33mWarning: could not import {path}: {error}\033[0m")
+                return
+            for wallet_address, tokens_list in data.items():
+                for token_info in tokens_list or []:
+                    try:
+                        imported += self._insert(
+                            wallet_address,
+                            token_info['token'],
+                            token_info.get('symbol'),
+                            token_info.get('createdAt')
+                        )
+                    except Exception as error:
+                        print(f"\033[1m\033[33mWarning: skipped token {token_info} of {wallet_address}: {error}\033[0m")
+            self.db.execute(
+                "INSERT INTO meta (key, value) VALUES ('legacy_imported', ?)",
+                (datetime.now().isoformat(),)
+            )
+            self.db.commit()
+            if imported:
+                print(f"\033[1m\033[36mImported {imported} token(s) from {os.path.basename(path)}\033[0m")
+
+    def _insert(self, wallet_address: str, token_address: str, symbol: str, created_at: str = None) -> int:
+        wallet = checksum(wallet_address)
+        token = checksum(token_address)
+        cursor = self.db.execute('''
+            INSERT OR IGNORE INTO tokens (token_key, wallet_key, token, wallet, symbol, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (token.lower(), wallet.lower(), token, wallet, symbol, created_at or datetime.now().isoformat()))
+        return cursor.rowcount
+
+    def add(self, wallet_address: str, token_address: str, symbol: str) -> bool:
+        """Register a created token; False if it is already known"""
+        with self.lock:
+            added = self._insert(wallet_address, token_address, symbol) > 0
+            self.db.commit()
+        return added
+
+    @staticmethod
+    def _entry(row) -> Dict:
+        return {'token': row['token'], 'symbol': row['symbol'], 'createdAt': row['created_at']}
+
+    def tokens_for_wallet(self, wallet_address: str) -> List[Dict]:
+        """Tokens created by a wallet, oldest first"""
+        with self.lock:
+            rows = self.db.execute(
+                'SELECT token, symbol, created_at FROM tokens WHERE wallet_key = ? ORDER BY id',
+                (wallet_address.lower(),)
+            ).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def wallet_for_token(self, token_address: str) -> Optional[str]:
+        """Creator of a token, if it is registered"""
+        with self.lock:
+            row = self.db.execute('SELECT wallet FROM tokens WHERE token_key = ?', (token_address.lower(),)).fetchone()
+        return row['wallet'] if row else None
+
+    def all(self) -> Dict[str, List[Dict]]:
+        """Checksummed wallet -> its tokens, oldest first"""
+        with self.lock:
+            rows = self.db.execute('SELECT wallet, token, symbol, created_at FROM tokens ORDER BY id').fetchall()
+        result = {}
+        for row in rows:
+            result.setdefault(row['wallet'], []).append(self._entry(row))
+        return result
+
+    def wallet_counts_since(self, cursor: int = 0) -> Tuple[int, Dict[str, int]]:
+        """Token counts of every wallet that gained tokens after `cursor`.
+
+        Returns (new_cursor, {checksummed wallet: total tokens}).
+        """
+        with self.lock:
+            rows = self.db.execute('''
+                SELECT t.wallet AS wallet, COUNT(*) AS total, MAX(t.id) AS last_id
+                FROM tokens t
+                WHERE t.wallet_key IN (SELECT wallet_key FROM tokens WHERE id > ?)
+                GROUP BY t.wallet_key
+            ''', (cursor,)).fetchall()
+        new_cursor = max([cursor] + [row['last_id'] for row in rows])
+        return new_cursor, {row['wallet']: row['total'] for row in rows}
+
+    def close(self):
+        """Close database connection"""
+        with self.lock:
+            self.db.close()
+
+_instance = None
+_instance_lock = threading.Lock()
+
+def get_token_registry() -> TokenRegistry:
+    """Process-wide token registry"""
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = TokenRegistry()
+    return _instance
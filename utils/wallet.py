@@ -4,9 +4,17 @@
 
 import os
 import json
-from datetime import datetime
-from web3 import Web3
-from config import ERC20_ABI
+import asyncio
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from eth_account import Account
+from config import CONFIG, ERC20_ABI
+from utils.address import checksum
+from utils.cache import cached_read
+from utils.contracts import get_contract
+from utils.multicall import get_multicall
+from utils.token_registry import get_token_registry
 
 def get_private_keys():
     """Load private keys from pv.txt"""
@@ -20,99 +28,127 @@ def get_private_keys():
         print(f'\033[1m\033[31mError reading pv.txt: {error}\033[0m')
         return []
 
-def get_token_balance(web3, wallet_address: str, token_address: str):
+# ============ WALLET ADDRESS INDEX ============
+# key hash -> address, so addresses are derived once per key instead of on
+# every menu. The file holds no key material.
+_script_dir = os.path.dirname(os.path.abspath(__file__))
+_project_root = os.path.dirname(_script_dir)
+ADDRESS_INDEX_FILE = os.path.join(_project_root, 'data', 'address_index.json')
+
+_address_index = None
+
+def _key_hash(private_key: str) -> str:
+    return hashlib.sha256(private_key.encode('utf-8')).hexdigest()
+
+def _derive_address(private_key: str) -> str:
+    return Account.from_key(private_key).address
+
+def _load_address_index() -> dict:
+    global _address_index
+    if _address_index is None:
+        try:
+            with open(ADDRESS_INDEX_FILE, 'r', encoding='utf-8') as f:
+                _address_index = json.load(f)
+        except (OSError, ValueError):
+            _address_index = {}
+    return _address_index
+
+def _save_address_index(index: dict):
+    try:
+        os.makedirs(os.path.dirname(ADDRESS_INDEX_FILE), exist_ok=True)
+        tmp_path = f'{ADDRESS_INDEX_FILE}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, ADDRESS_INDEX_FILE)
+    except OSError as error:
+        print(f"\033[1m\033[33mWarning: could not save address index: {error}\033[0m")
+
+def get_addresses(private_keys: list) -> list:
+    """Checksummed address of each key, derived only for keys not indexed yet"""
+    index = _load_address_index()
+    hashes = [_key_hash(pk) for pk in private_keys]
+    missing = list({h: pk for h, pk in zip(hashes, private_keys) if h not in index}.items())
+    if missing:
+        keys = [pk for _, pk in missing]
+        if len(keys) >= CONFIG['ADDRESS_INDEX_PARALLEL_MIN']:
+            # Spawned, not forked: the stats writer thread and aiohttp
+            # session may already be running in this process
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn')) as pool:
+                addresses = list(pool.map(_derive_address, keys, chunksize=256))
+        else:
+            addresses = [_derive_address(pk) for pk in keys]
+        for (h, _), address in zip(missing, addresses):
+            index[h] = address
+        _save_address_index(index)
+    return [index[h] for h in hashes]
+
+def warm_address_index():
+    """Index the addresses of new pv.txt keys before the event loop starts"""
+    if os.path.exists('pv.txt'):
+        get_addresses(get_private_keys())
+
+class LazyWallet:
+    """Wallet whose eth_account Account is only built when it is needed.
+
+    `address` comes from the address index; signing (or any other Account
+    attribute) derives the key on first use.
+    """
+
+    def __init__(self, private_key: str, address: str):
+        self._private_key = private_key
+        self.address = address
+        self._account = None
+
+    @property
+    def account(self):
+        if self._account is None:
+            self._account = Account.from_key(self._private_key)
+        return self._account
+
+    def sign_transaction(self, tx: dict):
+        return self.account.sign_transaction(tx)
+
+    def __getattr__(self, name):
+        return getattr(self.account, name)
+
+def get_wallets(private_keys: list = None) -> list:
+    """LazyWallet for each key (defaults to the keys in pv.txt)"""
+    if private_keys is None:
+        private_keys = get_private_keys()
+    return [LazyWallet(pk, address) for pk, address in zip(private_keys, get_addresses(private_keys))]
+
+async def get_token_balance(web3, wallet_address: str, token_address: str):
     """Get token balance"""
     try:
-        contract = web3.eth.contract(address=Web3.to_checksum_address(token_address), abi=ERC20_ABI)
-        balance = contract.functions.balanceOf(Web3.to_checksum_address(wallet_address)).call()
-        decimals = contract.functions.decimals().call()
+        contract = get_contract(web3, checksum(token_address), ERC20_ABI)
+        balance, decimals = await asyncio.gather(
+            get_multicall(web3).read(contract.functions.balanceOf(checksum(wallet_address))),
+            cached_read(web3, contract.functions.decimals()),
+            return_exceptions=True
+        )
+        if isinstance(balance, Exception) or isinstance(decimals, Exception):
+            return {'balance': 0, 'decimals': 18, 'formatted': '0'}
         formatted = balance / (10 ** decimals)
         return {'balance': balance, 'decimals': decimals, 'formatted': formatted}
     except Exception:
         return {'balance': 0, 'decimals': 18, 'formatted': '0'}
 
 # ============ CREATED TOKENS STORAGE ============
-# Resolve absolute path to created_tokens.json relative to project root
-_script_dir = os.path.dirname(os.path.abspath(__file__))
-_project_root = os.path.dirname(_script_dir)  # Go one level up (from utils to root)
-TOKENS_FILE = os.path.join(_project_root, 'data', 'created_tokens.json')
-
-if __name__ != '__main__':
-    pass
-
+# Backed by the SQLite token registry (data/token_registry.db); the old
+# data/created_tokens.json is imported into it once on first use.
 
 def load_created_tokens():
-    """Load created tokens and normalize addresses to checksum format"""
+    """Load created tokens: checksummed wallet -> list of tokens"""
     try:
-        data_dir = os.path.dirname(TOKENS_FILE)
-        os.makedirs(data_dir, exist_ok=True)
-        if os.path.exists(TOKENS_FILE):
-            with open(TOKENS_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                normalized_data = {}
-                for wallet_addr, tokens_list in data.items():
-                    try:
-                        normalized_wallet = Web3.to_checksum_address(wallet_addr)
-                        normalized_tokens = []
-                        for token_info in tokens_list:
-                            normalized_token_info = token_info.copy()
-                            if 'token' in normalized_token_info:
-                                try:
-                                    normalized_token_info['token'] = Web3.to_checksum_address(normalized_token_info['token'])
-                                except Exception:
-                                    pass
-                            normalized_tokens.append(normalized_token_info)
-                        if normalized_wallet in normalized_data:
-                            normalized_data[normalized_wallet].extend(normalized_tokens)
-                        else:
-                            normalized_data[normalized_wallet] = normalized_tokens
-                    except Exception as e:
-                        print(f"\033[1m\033[33mWarning: failed to checksum wallet {wallet_addr}: {e}\033[0m")
-                        continue
-                if normalized_data != data:
-                    with open(TOKENS_FILE, 'w', encoding='utf-8') as f:
-                        json.dump(normalized_data, f, indent=2, ensure_ascii=False)
-                return normalized_data
+        return get_token_registry().all()
     except Exception as e:
-        try:
-            data_dir = os.path.dirname(TOKENS_FILE)
-            os.makedirs(data_dir, exist_ok=True)
-            if os.path.exists(TOKENS_FILE):
-                with open(TOKENS_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except Exception:
-            pass
-    return {}
+        print(f"\033[1m\033[31m✗ Error loading tokens: {e}\033[0m")
+        return {}
 
 def save_created_token(wallet_address: str, token_address: str, symbol: str):
     """Save a created token (addresses normalized to checksum format)"""
     try:
-        normalized_wallet = Web3.to_checksum_address(wallet_address)
-        normalized_token = Web3.to_checksum_address(token_address)
-
-        tokens = load_created_tokens()
-        if normalized_wallet not in tokens:
-            tokens[normalized_wallet] = []
-
-        token_exists = False
-        for existing_token in tokens[normalized_wallet]:
-            if existing_token.get('token', '').lower() == normalized_token.lower():
-                token_exists = True
-                break
-
-        if not token_exists:
-            tokens[normalized_wallet].append({
-                'token': normalized_token,
-                'symbol': symbol,
-                'createdAt': datetime.now().isoformat()
-            })
-
-            data_dir = os.path.dirname(TOKENS_FILE)
-            os.makedirs(data_dir, exist_ok=True)
-
-            with open(TOKENS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(tokens, f, indent=2, ensure_ascii=False)
-        else:
+        if not get_token_registry().add(wallet_address, token_address, symbol):
             print(f"\033[1m\033[33m⚠️ Token {symbol} already exists for this wallet\033[0m")
     except Exception as e:
         print(f"\033[1m\033[31m✗ Error saving token: {e}\033[0m")
@@ -121,8 +157,5 @@ def save_created_token(wallet_address: str, token_address: str, symbol: str):
         raise
 
 def get_tokens_for_wallet(wallet_address: str):
-    """Get tokens for a wallet (address normalized to checksum)"""
-    tokens = load_created_tokens()
-    normalized_wallet = Web3.to_checksum_address(wallet_address)
-    return tokens.get(normalized_wallet, [])
-
+    """Get tokens for a wallet"""
+    return get_token_registry().tokens_for_wallet(wallet_address)